@@ -0,0 +1,45 @@
+import argparse
+import sys
+
+from fastapi import HTTPException
+
+from app.infrastructures.config import COMPANY_IMPORT_BATCH_SIZE
+from app.infrastructures.database import SessionLocal, get_engine
+from app.services.company import CompanyService
+from app.utils.company_import import iter_companies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSONL / CSV 회사 리스트 일괄 추가")
+    parser.add_argument("path", help="입력 파일 경로 (- 이면 표준 입력)")
+    parser.add_argument("--format", choices=["jsonl", "csv"], default=None)
+    parser.add_argument("--batch-size", type=int, default=COMPANY_IMPORT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    fmt = args.format or ("csv" if args.path.endswith(".csv") else "jsonl")
+    file = (
+        sys.stdin
+        if args.path == "-"
+        else open(args.path, encoding="utf-8-sig", newline="")
+    )
+    db = SessionLocal(bind=get_engine())
+    try:
+        result = CompanyService().import_companies(
+            db=db,
+            companies=iter_companies(file, fmt=fmt),
+            batch_size=args.batch_size,
+        )
+    except HTTPException as e:
+        sys.exit(f"import failed: {e.detail}")
+    finally:
+        db.close()
+        file.close()
+
+    print(
+        f"imported {result['companies']} companies in {result['batches']} batches, "
+        f"{result['elapsed_seconds']}s ({result['companies_per_second']} companies/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
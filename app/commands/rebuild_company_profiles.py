@@ -0,0 +1,28 @@
+import argparse
+import time
+
+from app.infrastructures.database import get_engine
+from app.infrastructures.migration import upgrade
+from app.infrastructures.read_model import rebuild_company_profiles
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="조회용 회사 프로필 테이블 전체 재생성"
+    )
+    parser.parse_args()
+
+    engine = get_engine()
+    upgrade(engine)
+    started_at = time.perf_counter()
+    with engine.begin() as connection:
+        rebuilt = rebuild_company_profiles(connection)
+
+    print(
+        f"rebuilt {rebuilt} company profiles in "
+        f"{round(time.perf_counter() - started_at, 3)}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,48 +1,143 @@
-from fastapi import APIRouter, Header, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Header, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.utils.enum import Language
+from app.utils.enum import AutocompleteMode, Language, ResponseFormat, TagOperator
 
-from app.infrastructures.database import get_db
+from app.infrastructures.config import (
+    COMPANY_FAST_RESPONSE,
+    COMPANY_SEARCH_MAX_LIMIT,
+    RESPONSE_COMPRESSION_MIN_SIZE,
+)
+from app.infrastructures.database import (
+    AsyncSessionLocal,
+    get_async_db,
+    get_async_engine,
+    get_async_read_db,
+)
 
 from app.schemas.response.company import (
+    CompanyBatchGetItemOutSchema,
     CompanyAutoCompleteOutSchema,
     CompanySearchNameOutSchema,
     CompanySearchTagOutSchema,
 )
-from app.schemas.request.company import NewCompanyInSchema, NewCompanyTagNameInSchema
-
-from app.services.company import CompanyService
+from app.schemas.request.company import (
+    CompanyBatchGetInSchema,
+    NewCompanyInSchema,
+    NewCompanyTagNameInSchema,
+)
 
+from app.services.company import AsyncCompanyService
+from app.utils.company_import import aiter_companies, aiter_lines
+from app.utils.etag import etag_matches
+from app.utils.response import (
+    CompressedJSONResponse,
+    dumps_json,
+    encoded_etag,
+    response_encoding,
+)
 
 router = APIRouter(prefix="")
 
-_company_service = CompanyService()
+_company_service = AsyncCompanyService()
+
+
+NEXT_PAGE_HEADER = "x-next-after"
+
+
+def _fast_json_response(
+    companies: list[dict], response: Response, accept_encoding: str | None
+):
+    """응답 스키마 검증 없이 직렬화, 큰 본문은 압축 (response 에 설정한 헤더 유지)"""
+    # Response 를 직접 반환하면 FastAPI 의 응답 모델 검증, jsonable_encoder 를 건너뜀
+    return CompressedJSONResponse(
+        companies,
+        accept_encoding=accept_encoding,
+        min_size=RESPONSE_COMPRESSION_MIN_SIZE,
+        headers=dict(response.headers),
+    )
 
 
 @router.get("/search")
-def autocomplete_company(
+async def autocomplete_company(
+    response: Response,
     query: str = "",
+    limit: int | None = Query(default=None, ge=1, le=COMPANY_SEARCH_MAX_LIMIT),
+    after: int = 0,
+    mode: AutocompleteMode = AutocompleteMode.substring,
+    format: ResponseFormat = ResponseFormat.json,
     lang: str = Header(default=Language.ko.value, alias="x-wanted-language"),
-    db: Session = Depends(get_db),
+    accept_encoding: str | None = Header(default=None),
+    db: AsyncSession = Depends(get_async_read_db),
 ) -> list[CompanyAutoCompleteOutSchema]:
-    return _company_service.autocomplete_company_by_word(
+    # prefix 는 순위 상위 limit 개만 반환하므로 스트리밍 대상이 아님
+    if format == ResponseFormat.ndjson and mode == AutocompleteMode.substring:
+        return StreamingResponse(
+            _company_service.stream_autocomplete_company_by_word(
+                word=query, lang=lang, after=after
+            ),
+            media_type="application/x-ndjson",
+        )
+
+    companies, next_after = await _company_service.autocomplete_company_page(
         db=db,
         word=query,
         lang=lang,
+        after=after,
+        # JSON 응답은 전체 결과를 메모리에 만들지 않도록 최대 COMPANY_SEARCH_MAX_LIMIT 개씩
+        # (prefix 는 limit 미지정시 COMPANY_AUTOCOMPLETE_PREFIX_LIMIT 개)
+        limit=(
+            limit or COMPANY_SEARCH_MAX_LIMIT
+            if mode == AutocompleteMode.substring
+            else limit
+        ),
+        mode=mode,
     )
+    if next_after is not None:
+        response.headers[NEXT_PAGE_HEADER] = str(next_after)
+    if COMPANY_FAST_RESPONSE:
+        return _fast_json_response(companies, response, accept_encoding)
+    return companies
+
+
+def _set_etag(response: Response, etag: str) -> Response:
+    response.headers["etag"] = etag
+    # 같은 URL 이라도 x-wanted-language 에 따라 다른 응답
+    response.headers["vary"] = "x-wanted-language"
+    return response
 
 
 @router.get("/companies/{company_name}")
 async def search_company(
+    response: Response,
     company_name: str = "",
     lang: str = Header(default=Language.ko.value, alias="x-wanted-language"),
-    db: Session = Depends(get_db),
+    if_none_match: str | None = Header(default=None),
+    db: AsyncSession = Depends(get_async_read_db),
 ) -> CompanySearchNameOutSchema:
-    return _company_service.search_company_by_name(
+    company, etag = await _company_service.search_company_by_name_with_etag(
         db=db,
         name=company_name,
         lang=lang,
+        if_none_match=if_none_match,
+    )
+    if company is None:
+        return _set_etag(Response(status_code=304), etag)
+
+    _set_etag(response, etag)
+    return company
+
+
+@router.post("/companies:batch-get")
+async def batch_get_companies(
+    batch: CompanyBatchGetInSchema,
+    lang: str = Header(default=Language.ko.value, alias="x-wanted-language"),
+    db: AsyncSession = Depends(get_async_read_db),
+) -> list[CompanyBatchGetItemOutSchema]:
+    """회사명 리스트의 회사 상세를 한 번에 조회 (없는 회사는 항목별 detail 로 반환)"""
+    return await _company_service.search_companies_by_names(
+        db=db, names=batch.names, lang=lang
     )
 
 
@@ -50,22 +145,115 @@ async def search_company(
 async def add_company(
     new_company: NewCompanyInSchema,
     lang: str = Header(default=Language.ko.value, alias="x-wanted-language"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
+):
+    return await _company_service.add_new_company(db=db, company=new_company, lang=lang)
+
+
+@router.post("/companies:import")
+async def import_companies(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
 ):
-    return _company_service.add_new_company(db=db, company=new_company, lang=lang)
+    """JSONL(application/x-ndjson) 또는 CSV(text/csv) 본문의 회사 리스트 일괄 추가"""
+    content_type = request.headers.get("content-type", "")
+    fmt = "csv" if content_type.startswith("text/csv") else "jsonl"
+    try:
+        return await _company_service.import_companies(
+            db=db,
+            companies=aiter_companies(aiter_lines(request.stream()), fmt=fmt),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=f"Invalid company record: {e}")
 
 
 @router.get("/tags")
 async def search_tag_company(
+    response: Response,
     query: str = "",
+    tags: str | None = Query(default=None, description="쉼표로 구분된 태그 리스트"),
+    op: TagOperator = TagOperator.intersection,
+    limit: int | None = Query(default=None, ge=1, le=COMPANY_SEARCH_MAX_LIMIT),
+    after: int = 0,
+    format: ResponseFormat = ResponseFormat.json,
     lang: str = Header(default=Language.ko.value, alias="x-wanted-language"),
-    db: Session = Depends(get_db),
+    if_none_match: str | None = Header(default=None),
+    accept_encoding: str | None = Header(default=None),
+    db: AsyncSession = Depends(get_async_read_db),
 ) -> list[CompanySearchTagOutSchema]:
-    return _company_service.search_company_by_tag(
-        db=db,
-        tag=query,
-        lang=lang,
+    # tags=태그_4,태그_16&op=and|or|not 이면 다중 태그 검색 (not: 첫 태그만 있고 나머지는 없는 회사)
+    tag_list = (
+        [tag.strip() for tag in tags.split(",") if tag.strip()]
+        if tags is not None
+        else None
     )
+    if format == ResponseFormat.ndjson:
+        return StreamingResponse(
+            (
+                _company_service.stream_search_company_by_tags(
+                    tags=tag_list, op=op, lang=lang, after=after
+                )
+                if tag_list is not None
+                else _company_service.stream_search_company_by_tag(
+                    tag=query, lang=lang, after=after
+                )
+            ),
+            media_type="application/x-ndjson",
+        )
+
+    # JSON 응답은 전체 결과를 메모리에 만들지 않도록 최대 COMPANY_SEARCH_MAX_LIMIT 개씩
+    limit = limit or COMPANY_SEARCH_MAX_LIMIT
+    if tag_list is not None:
+        companies, next_after, etag = (
+            await _company_service.search_company_by_tags_page_with_etag(
+                db=db,
+                tags=tag_list,
+                op=op,
+                lang=lang,
+                after=after,
+                limit=limit,
+            )
+        )
+    else:
+        companies, next_after, etag = (
+            await _company_service.search_company_by_tag_page_with_etag(
+                db=db,
+                tag=query,
+                lang=lang,
+                after=after,
+                limit=limit,
+            )
+        )
+    # 결과가 바뀌지 않았으면 본문 없이 304 응답 (다음 페이지 커서 헤더는 유지)
+    if etag_matches(if_none_match, etag):
+        response = _set_etag(Response(status_code=304), etag)
+        if COMPANY_FAST_RESPONSE:
+            # 200 응답과 같은 표현의 ETag, Vary (압축 여부는 본문 크기와 Accept-Encoding 으로 결정)
+            encoding = response_encoding(
+                dumps_json(companies), accept_encoding, RESPONSE_COMPRESSION_MIN_SIZE
+            )
+            response.headers["etag"] = encoded_etag(etag, encoding)
+            response.headers["vary"] += ", accept-encoding"
+        if next_after is not None:
+            response.headers[NEXT_PAGE_HEADER] = str(next_after)
+        return response
+
+    _set_etag(response, etag)
+    if next_after is not None:
+        response.headers[NEXT_PAGE_HEADER] = str(next_after)
+    if COMPANY_FAST_RESPONSE:
+        return _fast_json_response(companies, response, accept_encoding)
+    return companies
+
+
+async def get_tag_write_db():
+    """태그 추가/삭제용 세션 (태그 변경 큐를 쓰면 batch 전용 세션에서 적용하므로 None)"""
+    if _company_service.uses_tag_write_queue:
+        yield None
+        return
+    get_async_engine()
+    async with AsyncSessionLocal() as db:
+        yield db
 
 
 @router.put("/companies/{company_name}/tags")
@@ -73,9 +261,9 @@ async def add_company_new_tag(
     tags: list[NewCompanyTagNameInSchema],
     company_name: str = "",
     lang: str = Header(default=Language.ko.value, alias="x-wanted-language"),
-    db: Session = Depends(get_db),
+    db: AsyncSession | None = Depends(get_tag_write_db),
 ):
-    return _company_service.add_company_new_tag(
+    return await _company_service.add_company_new_tag(
         db=db,
         tags=tags,
         name=company_name,
@@ -88,9 +276,9 @@ async def delete_company_tag(
     company_name: str = "",
     tag_name: str = "",
     lang: str = Header(default=Language.ko.value, alias="x-wanted-language"),
-    db: Session = Depends(get_db),
+    db: AsyncSession | None = Depends(get_tag_write_db),
 ):
-    return _company_service.delete_company_tag(
+    return await _company_service.delete_company_tag(
         db=db,
         name=company_name,
         tag=tag_name,
@@ -0,0 +1,40 @@
+from fastapi import APIRouter, Request
+from fastapi.responses import PlainTextResponse
+
+from app.controllers.company import _company_service
+from app.infrastructures.metrics import request_metrics
+
+router = APIRouter(prefix="")
+
+
+@router.get("/cache/stats")
+async def cache_stats() -> dict[str, int]:
+    return _company_service.cache_stats()
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics(request: Request):
+    """Prometheus text format 요청/SQL/캐시/회사명 필터/시작 시간/쓰기 큐 지표"""
+    lines = [request_metrics.render()]
+    startup_seconds = getattr(request.app.state, "startup_seconds", None)
+    if startup_seconds is not None:
+        lines.append(
+            "# HELP app_startup_seconds Worker startup (lifespan) duration\n"
+            f"# TYPE app_startup_seconds gauge\napp_startup_seconds {startup_seconds}\n"
+        )
+    for name, value in _company_service.cache_stats().items():
+        if name in ("size", "maxsize"):
+            metric, metric_type = f"company_cache_{name}", "gauge"
+        else:
+            metric, metric_type = f"company_cache_{name}_total", "counter"
+        lines.append(f"# TYPE {metric} {metric_type}\n{metric} {value}\n")
+    for name, value in _company_service.name_filter_stats().items():
+        if name in ("lookups", "negatives", "false_positives"):
+            metric, metric_type = f"company_name_filter_{name}_total", "counter"
+        else:
+            metric, metric_type = f"company_name_filter_{name}", "gauge"
+        lines.append(f"# TYPE {metric} {metric_type}\n{metric} {value}\n")
+    lines.append(_company_service.write_queue_metrics())
+    return PlainTextResponse(
+        "".join(lines), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -1,34 +1,93 @@
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String
+from sqlalchemy import JSON, Boolean, Column, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.infrastructures.database import Base
+from app.utils.search_key import chosung_search_key, normalize_search_key
+
+
+def _search_key_default(column: str, key):
+    """INSERT 시 column 값으로 검색 키를 계산하는 컬럼 기본값"""
+    return lambda context: key(context.get_current_parameters()[column])
 
 
 class Company(Base):
     __tablename__ = "company"
+    __table_args__ = (Index("ix_company_company_name", "company_name"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     company_name: Mapped[str] = mapped_column(String(50), nullable=True)
+    # 회사명, 태그가 바뀔 때마다 1 씩 증가 (회사 상세 / 태그 검색 ETag)
+    version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default="1"
+    )
 
     tags = relationship("CompanyTag", back_populates="company")
 
 
 class CompanyName(Base):
     __tablename__ = "company_name"
+    __table_args__ = (
+        # 회사명 검색 (name -> c_id)
+        Index("ix_company_name_name_c_id", "name", "c_id"),
+        # 회사 ID 기준 지원 언어 회사명 조회
+        Index("ix_company_name_c_id_lang_name", "c_id", "lang", "name"),
+        # 정규화 / 초성 검색 키 부분 일치 검색 (search_key -> c_id)
+        Index("ix_company_name_search_key_c_id", "search_key", "c_id"),
+        Index("ix_company_name_chosung_key_c_id", "chosung_key", "c_id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     c_id: Mapped[int] = mapped_column(Integer, ForeignKey("company.id"))
     lang: Mapped[str] = mapped_column(String(20), nullable=False)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
+    # 쓰기 시점에 계산한 정규화 / 초성 검색 키 (app.utils.search_key)
+    search_key: Mapped[str] = mapped_column(
+        String(100),
+        nullable=True,
+        default=_search_key_default("name", normalize_search_key),
+    )
+    chosung_key: Mapped[str] = mapped_column(
+        String(100),
+        nullable=True,
+        default=_search_key_default("name", chosung_search_key),
+    )
 
 
 class CompanyTag(Base):
     __tablename__ = "company_tag"
+    __table_args__ = (
+        # 회사 ID 기준 지원 언어 태그 조회 (tag_category_id 순 정렬)
+        Index(
+            "ix_company_tag_c_id_lang_category_tag",
+            "c_id",
+            "lang",
+            "tag_category_id",
+            "tag",
+        ),
+        # 태그명 검색 (tag -> c_id, tag_category_id)
+        Index("ix_company_tag_tag_c_id_category", "tag", "c_id", "tag_category_id"),
+        # 태그 추가시 INSERT ... ON CONFLICT 대상
+        Index("uq_company_tag_c_id_lang_tag", "c_id", "lang", "tag", unique=True),
+        # 정규화 / 초성 검색 키 태그 검색 (search_key -> c_id)
+        Index("ix_company_tag_search_key_c_id", "search_key", "c_id"),
+        Index("ix_company_tag_chosung_key_c_id", "chosung_key", "c_id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     c_id: Mapped[int] = mapped_column(Integer, ForeignKey("company.id"))
     lang: Mapped[str] = mapped_column(String(20), nullable=False)
     tag: Mapped[str] = mapped_column(String(100), nullable=False)
+    # 쓰기 시점에 계산한 정규화 / 초성 검색 키 (app.utils.search_key)
+    search_key: Mapped[str] = mapped_column(
+        String(100),
+        nullable=True,
+        default=_search_key_default("tag", normalize_search_key),
+    )
+    chosung_key: Mapped[str] = mapped_column(
+        String(100),
+        nullable=True,
+        default=_search_key_default("tag", chosung_search_key),
+    )
     tag_category_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("company_tag_category.id")
     )
@@ -39,8 +98,42 @@ class CompanyTag(Base):
 
 class CompanyTagCategory(Base):
     __tablename__ = "company_tag_category"
+    __table_args__ = (
+        Index("ix_company_tag_category_category_name", "category_name", unique=True),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     category_name: Mapped[str] = mapped_column(String(100), nullable=False)
 
     tags = relationship("CompanyTag", back_populates="tag_category")
+
+
+class TableVersion(Base):
+    """테이블별 변경 버전 (트리거로 행이 바뀔 때마다 증가, 인메모리 색인 갱신 여부 확인용)"""
+
+    __tablename__ = "table_version"
+
+    table_name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+
+
+class CompanyProfile(Base):
+    """(회사, 지원 언어) 별 조회용 비정규화 테이블 (쓰기 시점에 갱신)"""
+
+    __tablename__ = "company_profile"
+    __table_args__ = (
+        # 회사 ID 기준 지원 언어 프로필 조회, 갱신
+        Index("uq_company_profile_c_id_lang", "c_id", "lang", unique=True),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    c_id: Mapped[int] = mapped_column(Integer, ForeignKey("company.id"))
+    lang: Mapped[str] = mapped_column(String(20), nullable=False)
+    # 지원 언어 회사명 (없으면 None)
+    name: Mapped[str] = mapped_column(String(100), nullable=True)
+    # 지원 언어 > ko > 그 외 언어 순으로 대체한 회사명
+    fallback_name: Mapped[str] = mapped_column(String(100), nullable=True)
+    # tag_category_id 순 지원 언어 태그 리스트
+    tags: Mapped[list[str]] = mapped_column(JSON, nullable=False)
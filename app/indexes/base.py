@@ -0,0 +1,27 @@
+import threading
+import time
+
+
+class RefreshableIndex:
+    """DB 변경 여부(fingerprint)를 주기적으로 확인하여 다시 생성하는 인메모리 색인"""
+
+    def __init__(self, refresh_interval: float = 5.0):
+        self.refresh_interval = refresh_interval
+        self.fingerprint = None
+
+        self._lock = threading.Lock()
+        self._checked_at = 0.0
+
+    def should_refresh(self) -> bool:
+        """마지막 갱신 확인 후 refresh_interval 이 지났는지 여부"""
+        return (
+            self.fingerprint is None
+            or time.monotonic() - self._checked_at >= self.refresh_interval
+        )
+
+    def mark_checked(self):
+        self._checked_at = time.monotonic()
+
+    def mark_stale(self):
+        """다음 조회 시 색인을 다시 생성하도록 표시"""
+        self.fingerprint = None
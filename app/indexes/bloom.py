@@ -0,0 +1,114 @@
+import hashlib
+import math
+import sys
+from typing import Iterable
+
+from app.indexes.base import RefreshableIndex
+
+# 재생성 전까지 추가될 회사명 여유분 (용량을 넘으면 다음 조회 시 다시 생성)
+CAPACITY_HEADROOM = 1.25
+MIN_CAPACITY = 1024
+
+
+class CompanyNameBloomFilter(RefreshableIndex):
+    """전체 언어 회사명 Bloom filter (없는 회사명 조회를 DB 조회 없이 404 처리)
+
+    might_contain 이 False 면 확실히 없는 회사명, True 면 DB 조회로 확인
+    """
+
+    def __init__(self, false_positive_rate: float = 0.01, refresh_interval=5.0):
+        super().__init__(refresh_interval=refresh_interval)
+        self.false_positive_rate = false_positive_rate
+        self._bits = bytearray()
+        self._size = 0
+        self._hashes = 0
+        self._capacity = 0
+        self._items = 0
+        # 조회 수, 필터로 404 처리한 수, 필터 통과 후 DB 에 없던 수 (실측 오탐)
+        self._lookups = 0
+        self._negatives = 0
+        self._false_positives = 0
+
+    def _positions(self, name: str, size: int, hashes: int):
+        # 128bit 해시 하나를 둘로 나눠 k 개 위치 생성 (double hashing)
+        digest = hashlib.blake2b(name.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % size for i in range(hashes))
+
+    def _add(self, name: str):
+        for position in self._positions(name, self._size, self._hashes):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self._items += 1
+        if self._items > self._capacity:
+            # 용량을 넘으면 오탐률이 올라가므로 다음 조회 시 더 크게 다시 생성
+            self.mark_stale()
+
+    def build(self, rows: Iterable[tuple[int, str, str]], fingerprint=None):
+        """(c_id, lang, name) 행 전체로 필터 재생성"""
+        names = {name for _, _, name in rows}
+        capacity = max(int(len(names) * CAPACITY_HEADROOM), MIN_CAPACITY)
+        # 목표 오탐률 p 의 최적 비트 수 m = -n ln p / (ln 2)^2, 해시 수 k = m / n ln 2
+        size = math.ceil(
+            -capacity * math.log(self.false_positive_rate) / math.log(2) ** 2
+        )
+        hashes = max(round(size / capacity * math.log(2)), 1)
+        with self._lock:
+            self._bits = bytearray((size + 7) // 8)
+            self._size = size
+            self._hashes = hashes
+            self._capacity = capacity
+            self._items = 0
+            for name in names:
+                self._add(name)
+            self.fingerprint = fingerprint
+            self.mark_checked()
+
+    def replace_company(self, c_id: int, company_name: dict[str, str]):
+        """새 회사명 추가 (지워진 회사명은 재생성 전까지 오탐으로 남음)"""
+        with self._lock:
+            if not self._size:
+                return
+            for name in company_name.values():
+                self._add(name)
+
+    def might_contain(self, name: str) -> bool:
+        """name 이 회사명 중 하나일 수 있는지 여부 (False 면 확실히 없음)"""
+        with self._lock:
+            self._lookups += 1
+            if not self._size:
+                return True
+            if all(
+                self._bits[position >> 3] & (1 << (position & 7))
+                for position in self._positions(name, self._size, self._hashes)
+            ):
+                return True
+            self._negatives += 1
+            return False
+
+    def record_false_positive(self):
+        """might_contain 이 True 였지만 DB 에 없던 회사명 (실측 오탐률 계산용)"""
+        self._false_positives += 1
+
+    def stats(self) -> dict[str, float]:
+        # 이론 오탐률 (1 - e^(-kn/m))^k
+        expected = (
+            (1 - math.exp(-self._hashes * self._items / self._size)) ** self._hashes
+            if self._size
+            else 0.0
+        )
+        # 없는 회사명 조회 중 필터를 통과한 비율 FP / (FP + TN)
+        absent = self._false_positives + self._negatives
+        return {
+            "items": self._items,
+            "bits": self._size,
+            "hashes": self._hashes,
+            "memory_bytes": sys.getsizeof(self._bits),
+            "expected_false_positive_rate": expected,
+            "lookups": self._lookups,
+            "negatives": self._negatives,
+            "false_positives": self._false_positives,
+            "observed_false_positive_rate": (
+                self._false_positives / absent if absent else 0.0
+            ),
+        }
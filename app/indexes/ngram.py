@@ -0,0 +1,130 @@
+from array import array
+from bisect import bisect_left
+from typing import Iterable
+
+from app.indexes.base import RefreshableIndex
+from app.utils.search_key import (
+    chosung_search_key,
+    normalize_search_key,
+    query_search_key,
+)
+
+
+class CompanyNameNgramIndex(RefreshableIndex):
+    """언어별 회사명 문자 n-gram 역색인 (부분 문자열 검색용)
+
+    posting 은 회사 ID 오름차순 array('I') 로 저장 (gram 마다 set 을 두지 않아 메모리 절감)
+    """
+
+    def __init__(self, max_n: int = 3, refresh_interval: float = 5.0):
+        super().__init__(refresh_interval=refresh_interval)
+        self.max_n = max_n
+        # lang -> c_id -> name
+        self._names: dict[str, dict[int, str]] = {}
+        # lang -> c_id -> name 의 정규화 / 초성 검색 키 (DB 검색 키 컬럼과 동일)
+        self._keys: dict[str, dict[int, str]] = {}
+        self._chosung_keys: dict[str, dict[int, str]] = {}
+        # lang -> gram -> c_ids
+        self._postings: dict[str, dict[str, array]] = {}
+
+    def _grams(self, text: str, n: int) -> set[str]:
+        return {text[i : i + n] for i in range(len(text) - n + 1)}
+
+    def _key_grams(self, key: str, chosung_key: str) -> set[str]:
+        # 초성 검색 키의 n-gram 도 같은 역색인에 추가 (후보는 검색 시 재확인)
+        return {
+            text[i : i + n]
+            for text in ((key,) if chosung_key == key else (key, chosung_key))
+            for n in range(1, self.max_n + 1)
+            for i in range(len(text) - n + 1)
+        }
+
+    def _add(self, lang: str, c_id: int, name: str):
+        key = normalize_search_key(name)
+        chosung_key = chosung_search_key(key)
+        self._names.setdefault(lang, {})[c_id] = name
+        self._keys.setdefault(lang, {})[c_id] = key
+        self._chosung_keys.setdefault(lang, {})[c_id] = chosung_key
+        postings = self._postings.setdefault(lang, {})
+        for gram in self._key_grams(key, chosung_key):
+            c_ids = postings.get(gram)
+            if c_ids is None:
+                postings[gram] = array("I", [c_id])
+            elif c_ids[-1] < c_id:
+                # 색인 생성시 행이 회사 ID 순이므로 대부분 끝에 추가
+                c_ids.append(c_id)
+            else:
+                i = bisect_left(c_ids, c_id)
+                if c_ids[i] != c_id:
+                    c_ids.insert(i, c_id)
+
+    def _remove(self, lang: str, c_id: int):
+        self._names.get(lang, {}).pop(c_id, None)
+        key = self._keys.get(lang, {}).pop(c_id, None)
+        chosung_key = self._chosung_keys.get(lang, {}).pop(c_id, None)
+        if key is None:
+            return
+
+        postings = self._postings[lang]
+        for gram in self._key_grams(key, chosung_key):
+            c_ids = postings.get(gram)
+            if c_ids is None:
+                continue
+            i = bisect_left(c_ids, c_id)
+            if i < len(c_ids) and c_ids[i] == c_id:
+                del c_ids[i]
+            if not c_ids:
+                del postings[gram]
+
+    def build(self, rows: Iterable[tuple[int, str, str]], fingerprint=None):
+        """(c_id, lang, name) 행 전체로 색인 재생성"""
+        # 새 색인은 잠금 없이 따로 만들고 교체만 잠금 안에서 (생성 중에도 기존 색인으로 검색)
+        index = CompanyNameNgramIndex(max_n=self.max_n)
+        for c_id, lang, name in rows:
+            index._add(lang, c_id, name)
+
+        with self._lock:
+            self._names = index._names
+            self._keys = index._keys
+            self._chosung_keys = index._chosung_keys
+            self._postings = index._postings
+            self.fingerprint = fingerprint
+            self.mark_checked()
+
+    def replace_company(self, c_id: int, company_name: dict[str, str]):
+        """회사 하나의 지원 언어별 회사명을 새 값으로 교체"""
+        with self._lock:
+            for lang in list(self._names):
+                self._remove(lang, c_id)
+            for lang, name in company_name.items():
+                self._add(lang, c_id, name)
+
+    def search(self, word: str) -> list[int]:
+        """어느 언어든 회사명에 word 가 포함된 회사 IDs 를 오름차순으로 반환"""
+        c_ids = set()
+        word, chosung = query_search_key(word)
+        with self._lock:
+            for lang, keys in (self._chosung_keys if chosung else self._keys).items():
+                if not word:
+                    c_ids.update(keys)
+                    continue
+
+                # 가장 짧은 posting 의 회사만 후보로 두고 실제 포함 여부 확인
+                # (후보 확인이 다른 posting 과의 교집합 역할)
+                postings = self._postings[lang]
+                candidates = min(
+                    (
+                        postings.get(gram, ())
+                        for gram in self._grams(word, min(len(word), self.max_n))
+                    ),
+                    key=len,
+                )
+                c_ids.update(c_id for c_id in candidates if word in keys[c_id])
+
+        return sorted(c_ids)
+
+    def get_names_by_ids_with_lang(self, c_ids: list[int], lang: str) -> list[str]:
+        """회사 IDs 순서대로 지원 언어 회사명 리스트 반환"""
+        with self._lock:
+            names = self._names.get(lang, {})
+            return [names[c_id] for c_id in c_ids if c_id in names]
@@ -0,0 +1,266 @@
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Callable, Iterable
+
+from app.indexes.base import RefreshableIndex
+from app.utils.search_key import (
+    chosung_search_key,
+    normalize_search_key,
+    query_search_key,
+)
+
+# 이 문자들 다음 위치도 단어 시작으로 색인 ((주)원티드랩 -> 원티드랩, 스피 링크 -> 링크)
+WORD_SEPARATORS = frozenset(" \t()[]{}<>-_/.,&·|")
+# 접두어 범위 상한 (어떤 회사명 문자보다도 큰 문자)
+MAX_CHAR = "\U0010ffff"
+
+
+def word_starts(name: str) -> list[int]:
+    """회사명에서 단어가 시작되는 위치 리스트"""
+    return [
+        i
+        for i, char in enumerate(name)
+        if char not in WORD_SEPARATORS and (i == 0 or name[i - 1] in WORD_SEPARATORS)
+    ]
+
+
+def key_word_starts(name: str, key: str) -> list[int]:
+    """회사명 단어 시작 위치를 검색 키(key) 에서의 위치로 변환한 리스트"""
+    # 검색 키는 공백 제거, NFKC 로 길이가 바뀌므로 단어 앞부분의 검색 키 길이로 계산
+    # (초성 검색 키는 검색 키와 길이가 같음)
+    return list(
+        dict.fromkeys(
+            offset
+            for offset in (
+                len(normalize_search_key(name[:i])) for i in word_starts(name)
+            )
+            if offset < len(key)
+        )
+    )
+
+
+class _LanguagePrefixIndex:
+    """한 언어 회사명의 단어 시작 위치 접미사 정렬 배열 (bisect 로 접두어 범위 검색)"""
+
+    def __init__(self, top_k: int, to_key: Callable[[str], str]):
+        self.top_k = top_k
+        self.to_key = to_key
+        # 회사명 번호 -> 회사명 (intern), 검색 키 (to_key 결과), 회사 ID
+        self.names: list[str] = []
+        self.keys: list[str] = []
+        self.c_ids = array("i")
+        # 회사 ID -> 회사명 번호
+        self.name_by_c_id: dict[int, int] = {}
+        # 접미사 순 정렬된 (회사명 번호, 단어 시작 위치)
+        self.entry_names = array("i")
+        self.entry_offsets = array("i")
+        # 검색된 적 있는 범위가 넓은 접두어 -> 순위 상위 depth 개 (회사명 번호, 단어 시작 위치, depth)
+        # (depth 는 top_k 부터 시작해 검색 조건으로 걸러지면 두 배씩 늘림)
+        self.top: dict[str, tuple[array, array, int]] = {}
+
+    def _suffix(self, entry: int) -> str:
+        return self.keys[self.entry_names[entry]][self.entry_offsets[entry] :]
+
+    def _rank(self, name: int, offset: int):
+        # 일치 위치가 앞일수록, 회사명이 짧을수록 우선
+        return offset, len(self.names[name]), self.names[name], self.c_ids[name]
+
+    def _ranked(self, entries: Iterable[tuple[int, int]], limit: int, accept=None):
+        """(순위, 회사명 번호) 를 회사당 하나씩 순위 순으로 limit 개까지 반환"""
+        ranked = []
+        c_ids = set()
+        for rank, name in sorted(
+            (self._rank(name, offset), name) for name, offset in entries
+        ):
+            c_id = rank[3]
+            if c_id in c_ids or (accept is not None and not accept(c_id)):
+                continue
+            c_ids.add(c_id)
+            ranked.append((rank, name))
+            if len(ranked) >= limit:
+                break
+        return ranked
+
+    def _add_name(self, c_id: int, name: str) -> int:
+        self.names.append(sys.intern(name))
+        self.keys.append(sys.intern(self.to_key(name)))
+        self.c_ids.append(c_id)
+        self.name_by_c_id.setdefault(c_id, len(self.names) - 1)
+        return len(self.names) - 1
+
+    def _range(self, key: str) -> tuple[int, int]:
+        entries = range(len(self.entry_names))
+        start = bisect_left(entries, key, key=self._suffix)
+        return start, bisect_left(entries, key + MAX_CHAR, lo=start, key=self._suffix)
+
+    def _entries(self, start: int, end: int):
+        return (
+            (self.entry_names[entry], self.entry_offsets[entry])
+            for entry in range(start, end)
+        )
+
+    def _set_top(self, key: str, entries: Iterable[tuple[int, int]], depth: int):
+        ranked = self._ranked(entries, depth)
+        self.top[key] = (
+            array("i", (name for _, name in ranked)),
+            array("i", (rank[0] for rank, _ in ranked)),
+            depth,
+        )
+
+    def build(self, items: Iterable[tuple[int, str]]):
+        entries = []
+        for c_id, name in items:
+            name = self._add_name(c_id, name)
+            entries.extend(
+                (name, offset)
+                for offset in key_word_starts(self.names[name], self.keys[name])
+            )
+        entries.sort(key=lambda entry: self.keys[entry[0]][entry[1] :])
+
+        self.entry_names = array("i", (name for name, _ in entries))
+        self.entry_offsets = array("i", (offset for _, offset in entries))
+        return self
+
+    def insert(self, c_id: int, name: str):
+        name = self._add_name(c_id, name)
+        key = self.keys[name]
+        for offset in key_word_starts(self.names[name], key):
+            position = bisect_left(
+                range(len(self.entry_names)), key[offset:], key=self._suffix
+            )
+            self.entry_names.insert(position, name)
+            self.entry_offsets.insert(position, offset)
+
+            for end in range(offset + 1, len(key) + 1):
+                if key[offset:end] in self.top:
+                    top_names, top_offsets, depth = self.top[key[offset:end]]
+                    self._set_top(
+                        key[offset:end],
+                        [*zip(top_names, top_offsets), (name, offset)],
+                        depth,
+                    )
+
+    def remove(self, c_id: int):
+        """회사의 회사명과 단어 시작 위치 항목 삭제"""
+        if self.name_by_c_id.pop(c_id, None) is None:
+            return
+
+        name = -1
+        while True:
+            try:
+                name = self.c_ids.index(c_id, name + 1)
+            except ValueError:
+                break
+
+            key = self.keys[name]
+            for offset in key_word_starts(self.names[name], key):
+                position = bisect_left(
+                    range(len(self.entry_names)), key[offset:], key=self._suffix
+                )
+                # 같은 접미사 항목 중 이 회사명의 항목 삭제
+                while self.entry_names[position] != name:
+                    position += 1
+                del self.entry_names[position]
+                del self.entry_offsets[position]
+
+                # 삭제된 항목이 들어있을 수 있는 상위 목록은 다음 검색에서 다시 계산
+                for end in range(offset + 1, len(key) + 1):
+                    self.top.pop(key[offset:end], None)
+
+            # 회사명 번호는 그대로 두고 (다른 항목의 번호 유지) 회사명만 비움
+            self.names[name] = self.keys[name] = ""
+            self.c_ids[name] = -1
+
+    def search(self, key: str, limit: int, accept: Callable[[int], bool]):
+        """접두어 key 로 시작하는 단어가 있는 회사의 (순위, 회사명 번호) 리스트"""
+        if key not in self.top:
+            start, end = self._range(key)
+            if end - start <= self.top_k:
+                return self._ranked(self._entries(start, end), limit, accept)
+            # 범위가 넓은 접두어는 매번 전체를 정렬하지 않도록 상위 top_k 개를 계산해 두고 재사용
+            self._set_top(key, self._entries(start, end), self.top_k)
+
+        while True:
+            top_names, top_offsets, depth = self.top[key]
+            ranked = self._ranked(zip(top_names, top_offsets), limit, accept)
+            # 상위 목록에 접두어가 일치하는 단어가 모두 들어있거나 limit 을 채운 경우
+            if len(ranked) >= limit or len(top_names) < depth:
+                return ranked
+            # accept 로 걸러져 limit 을 못 채우면 상위 목록을 두 배로 넓혀 계산해 두고 재사용
+            self._set_top(key, self._entries(*self._range(key)), depth * 2)
+
+
+class CompanyNamePrefixIndex(RefreshableIndex):
+    """언어별 회사명 접두어 색인 (단어 시작 기준 자동완성, 일치 위치 > 회사명 길이 순)
+
+    검색 키 (NFKC, casefold, 공백 제거) 와 초성 검색 키 색인을 따로 두고
+    검색어에 초성이 섞여 있으면 초성 검색 키 색인으로 검색
+    """
+
+    def __init__(self, top_k: int = 100, refresh_interval: float = 5.0):
+        super().__init__(refresh_interval=refresh_interval)
+        self.top_k = top_k
+        self._languages: dict[str, _LanguagePrefixIndex] = {}
+        self._chosung_languages: dict[str, _LanguagePrefixIndex] = {}
+
+    def _language_index(self, chosung: bool) -> _LanguagePrefixIndex:
+        return _LanguagePrefixIndex(
+            self.top_k, chosung_search_key if chosung else normalize_search_key
+        )
+
+    def build(self, rows: Iterable[tuple[int, str, str]], fingerprint=None):
+        """(c_id, lang, name) 행 전체로 색인 재생성"""
+        items: dict[str, list[tuple[int, str]]] = {}
+        for c_id, lang, name in rows:
+            items.setdefault(lang, []).append((c_id, name))
+        languages, chosung_languages = (
+            {
+                lang: self._language_index(chosung).build(lang_items)
+                for lang, lang_items in items.items()
+            }
+            for chosung in (False, True)
+        )
+
+        with self._lock:
+            self._languages = languages
+            self._chosung_languages = chosung_languages
+            self.fingerprint = fingerprint
+            self.mark_checked()
+
+    def replace_company(self, c_id: int, company_name: dict[str, str]):
+        """회사 하나의 지원 언어별 회사명을 새 값으로 교체"""
+        with self._lock:
+            for languages in (self._languages, self._chosung_languages):
+                for index in languages.values():
+                    index.remove(c_id)
+
+            for lang, name in company_name.items():
+                for chosung, languages in (
+                    (False, self._languages),
+                    (True, self._chosung_languages),
+                ):
+                    if lang not in languages:
+                        languages[lang] = self._language_index(chosung)
+                    languages[lang].insert(c_id, name)
+
+    def search(self, prefix: str, lang: str, limit: int) -> list[str]:
+        """어느 언어든 prefix 로 시작하는 단어가 있는 회사의 지원 언어 회사명 상위 limit 개"""
+        key, chosung = query_search_key(prefix)
+        with self._lock:
+            names = self._languages.get(lang)
+            if not key or names is None:
+                return []
+
+            # 언어별 상위 limit 개를 합쳐 다시 순위를 매기면 전체 상위 limit 개와 같음
+            ranked = sorted(
+                rank
+                for index in (
+                    self._chosung_languages if chosung else self._languages
+                ).values()
+                for rank, _ in index.search(
+                    key, limit, accept=names.name_by_c_id.__contains__
+                )
+            )
+            c_ids = list(dict.fromkeys(rank[3] for rank in ranked))[:limit]
+            return [names.names[names.name_by_c_id[c_id]] for c_id in c_ids]
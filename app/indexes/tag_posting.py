@@ -0,0 +1,130 @@
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Iterable
+
+from app.indexes.base import RefreshableIndex
+from app.utils.enum import TagOperator
+from app.utils.search_key import query_search_key
+
+# ko 태그명이 없어 카테고리가 없는 태그의 tag_category_id
+NO_CATEGORY = -1
+
+
+class CompanyTagPostingIndex(RefreshableIndex):
+    """태그 카테고리 -> 회사 IDs posting 색인 (다중 태그 AND / OR / NOT 검색용)
+
+    같은 카테고리의 언어별 태그(태그_4, tag_4, タグ_4)는 하나의 posting 을 공유하고
+    카테고리가 없는 태그는 태그 검색 키마다 posting 을 따로 두며
+    posting 은 회사 ID 오름차순 array('I') 로 저장
+    """
+
+    def __init__(self, refresh_interval: float = 5.0):
+        super().__init__(refresh_interval=refresh_interval)
+        # posting 키 (tag_category_id, 카테고리가 없으면 ("tag", 검색 키)) -> 회사 IDs
+        self._postings: dict[int | tuple[str, str], array] = {}
+        # 태그 검색 키 / 초성 검색 키 -> posting 키 (DB 검색 키 컬럼과 동일)
+        self._categories: dict[str, set[int | tuple[str, str]]] = {}
+        self._chosung_categories: dict[str, set[int | tuple[str, str]]] = {}
+
+    def _add_keys(self, category_id: int, key: str, chosung_key: str):
+        posting_key = _posting_key(category_id, key)
+        self._categories.setdefault(key, set()).add(posting_key)
+        self._chosung_categories.setdefault(chosung_key, set()).add(posting_key)
+        return posting_key
+
+    def build(self, rows: Iterable[tuple[int, int, str, str]], fingerprint=None):
+        """(c_id, tag_category_id, search_key, chosung_key) 태그 행 전체로 색인 재생성"""
+        postings = defaultdict(set)
+        keys = set()
+        for c_id, category_id, key, chosung_key in rows:
+            postings[_posting_key(category_id, key)].add(c_id)
+            keys.add((category_id, key, chosung_key))
+
+        with self._lock:
+            self._postings = {
+                posting_key: array("I", sorted(c_ids))
+                for posting_key, c_ids in postings.items()
+            }
+            self._categories = {}
+            self._chosung_categories = {}
+            for category_id, key, chosung_key in keys:
+                self._add_keys(category_id, key, chosung_key)
+            self.fingerprint = fingerprint
+            self.mark_checked()
+
+    def replace_company(self, c_id: int, tags: Iterable[tuple[int, str, str]]):
+        """회사 하나의 태그를 현재 (tag_category_id, search_key, chosung_key) 리스트로 교체"""
+        with self._lock:
+            posting_keys = {
+                self._add_keys(category_id, key, chosung_key)
+                for category_id, key, chosung_key in tags
+            }
+
+            for posting_key, c_ids in self._postings.items():
+                i = bisect_left(c_ids, c_id)
+                found = i < len(c_ids) and c_ids[i] == c_id
+                if found and posting_key not in posting_keys:
+                    del c_ids[i]
+                elif not found and posting_key in posting_keys:
+                    c_ids.insert(i, c_id)
+            for posting_key in posting_keys - self._postings.keys():
+                self._postings[posting_key] = array("I", [c_id])
+
+    def _tag_posting(self, tag: str) -> array:
+        key, chosung = query_search_key(tag)
+        categories = (self._chosung_categories if chosung else self._categories).get(
+            key, ()
+        )
+        postings = [self._postings[c] for c in categories if c in self._postings]
+        if len(postings) == 1:
+            return postings[0]
+        # 검색 키가 여러 카테고리에 해당하면 (초성 검색 등) 카테고리 posting 의 합집합
+        return array("I", sorted(set().union(*postings)))
+
+    def search(self, tags: list[str], op: TagOperator) -> list[int]:
+        """태그 리스트를 op 로 조합한 회사 IDs 를 오름차순으로 반환"""
+        with self._lock:
+            postings = [self._tag_posting(tag) for tag in tags]
+            if not postings:
+                return []
+            if op == TagOperator.union:
+                return sorted(set().union(*postings))
+
+            if op == TagOperator.difference:
+                c_ids, excluded = postings[0], postings[1:]
+                return [
+                    c_id
+                    for c_id in c_ids
+                    if not any(_contains(posting, c_id) for posting in excluded)
+                ]
+
+            # 가장 작은 posting 의 회사 IDs 만 나머지 posting 에서 이진 탐색
+            postings.sort(key=len)
+            c_ids = list(postings[0])
+            for posting in postings[1:]:
+                if not c_ids:
+                    break
+                c_ids = [c_id for c_id in c_ids if _contains(posting, c_id)]
+            return c_ids
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "categories": len(self._postings),
+                "postings": sum(len(c_ids) for c_ids in self._postings.values()),
+                "memory_bytes": sum(
+                    c_ids.buffer_info()[1] * c_ids.itemsize
+                    for c_ids in self._postings.values()
+                ),
+            }
+
+
+def _posting_key(category_id: int, key: str) -> int | tuple[str, str]:
+    # 카테고리가 없는 태그끼리 posting 을 공유하지 않도록 태그 검색 키로 구분
+    return ("tag", key) if category_id == NO_CATEGORY else category_id
+
+
+def _contains(c_ids: array, c_id: int) -> bool:
+    i = bisect_left(c_ids, c_id)
+    return i < len(c_ids) and c_ids[i] == c_id
@@ -0,0 +1,324 @@
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Hashable, Iterable
+
+
+class CacheBackend(ABC):
+    """TTL, 최대 크기 제한, 태그 단위 무효화를 지원하는 캐시 공통 인터페이스"""
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @abstractmethod
+    def get(self, key: Hashable, default=None): ...
+
+    @abstractmethod
+    def set(
+        self,
+        key: Hashable,
+        value,
+        tags: Iterable[Hashable] = (),
+        if_generation: int | None = None,
+    ) -> bool:
+        """항목 저장 후 저장 여부 반환
+
+        if_generation 이 현재 generation() 과 다르면 (그 사이 무효화되었으면) 저장하지 않음
+        """
+
+    @abstractmethod
+    def invalidate(self, tag: Hashable) -> int:
+        """tag 가 붙은 항목 모두 삭제 후 삭제된 개수 반환"""
+
+    @abstractmethod
+    def generation(self) -> int:
+        """무효화할 때마다 증가하는 값 (원본 조회 전에 읽어 두고 set 의 if_generation 으로 전달)"""
+
+    @abstractmethod
+    def clear(self): ...
+
+    @abstractmethod
+    def __len__(self) -> int: ...
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+class LRUCache(CacheBackend):
+    """프로세스 내부 dict 기반 LRU 캐시"""
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 60.0):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+
+        self._lock = threading.Lock()
+        # key -> (만료 시각, value, tags)
+        self._entries: OrderedDict[Hashable, tuple[float, Any, tuple]] = OrderedDict()
+        # tag -> keys
+        self._tags: dict[Hashable, set[Hashable]] = {}
+        self._generation = 0
+
+    def _pop(self, key: Hashable):
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                del self._tags[tag]
+
+    def get(self, key: Hashable, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            if entry[0] <= time.monotonic():
+                self._pop(key)
+                self.evictions += 1
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(
+        self,
+        key: Hashable,
+        value,
+        tags: Iterable[Hashable] = (),
+        if_generation: int | None = None,
+    ) -> bool:
+        tags = tuple(tags)
+        with self._lock:
+            if if_generation is not None and if_generation != self._generation:
+                return False
+            if key in self._entries:
+                self._pop(key)
+
+            self._entries[key] = (time.monotonic() + self.ttl, value, tags)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+
+            while len(self._entries) > self.maxsize:
+                self._pop(next(iter(self._entries)))
+                self.evictions += 1
+            return True
+
+    def invalidate(self, tag: Hashable) -> int:
+        with self._lock:
+            # 삭제할 항목이 없어도 조회 중인 값이 저장되지 않도록 증가
+            self._generation += 1
+            keys = list(self._tags.get(tag, ()))
+            for key in keys:
+                self._pop(key)
+            self.invalidations += len(keys)
+            return len(keys)
+
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._tags.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCache(CacheBackend):
+    """SQLite 파일 기반 캐시 (같은 호스트의 여러 워커가 항목, 무효화를 공유)"""
+
+    # 조회 시마다 쓰기가 발생하지 않도록 최근 사용 시각은 이 간격 이상 지났을 때만 갱신
+    TOUCH_INTERVAL = 1.0
+
+    def __init__(self, path: str, maxsize: int = 4096, ttl: float = 60.0):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self.path = path
+
+        self._local = threading.local()
+        with self._connection() as connection:
+            connection.executescript("""
+                CREATE TABLE IF NOT EXISTS cache_entry (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS ix_cache_entry_accessed_at
+                    ON cache_entry (accessed_at);
+                CREATE TABLE IF NOT EXISTS cache_tag (
+                    tag TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    PRIMARY KEY (tag, key)
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS ix_cache_tag_key ON cache_tag (key);
+                CREATE TABLE IF NOT EXISTS cache_generation (
+                    id INTEGER PRIMARY KEY CHECK (id = 0),
+                    generation INTEGER NOT NULL
+                );
+                INSERT OR IGNORE INTO cache_generation (id, generation) VALUES (0, 0);
+                """)
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def _dumps(self, value) -> str:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+    def _delete_keys(self, connection: sqlite3.Connection, keys: list[str]):
+        connection.executemany(
+            "DELETE FROM cache_entry WHERE key = ?", [(key,) for key in keys]
+        )
+        connection.executemany(
+            "DELETE FROM cache_tag WHERE key = ?", [(key,) for key in keys]
+        )
+
+    def get(self, key: Hashable, default=None):
+        key = self._dumps(key)
+        connection = self._connection()
+        entry = connection.execute(
+            "SELECT value, expires_at, accessed_at FROM cache_entry WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if entry is None:
+            self.misses += 1
+            return default
+
+        value, expires_at, accessed_at = entry
+        now = time.time()
+        if expires_at <= now:
+            with connection:
+                self._delete_keys(connection, [key])
+            self.evictions += 1
+            self.misses += 1
+            return default
+
+        if now - accessed_at >= self.TOUCH_INTERVAL:
+            connection.execute(
+                "UPDATE cache_entry SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+        self.hits += 1
+        return json.loads(value)
+
+    def _generation(self, connection: sqlite3.Connection) -> int:
+        return connection.execute(
+            "SELECT generation FROM cache_generation WHERE id = 0"
+        ).fetchone()[0]
+
+    def _increment_generation(self, connection: sqlite3.Connection):
+        connection.execute(
+            "UPDATE cache_generation SET generation = generation + 1 WHERE id = 0"
+        )
+
+    def set(
+        self,
+        key: Hashable,
+        value,
+        tags: Iterable[Hashable] = (),
+        if_generation: int | None = None,
+    ) -> bool:
+        key = self._dumps(key)
+        now = time.time()
+        connection = self._connection()
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            # 쓰기 잠금 안에서 비교하므로 다른 워커의 무효화와 겹치지 않음
+            if if_generation is not None and if_generation != self._generation(
+                connection
+            ):
+                return False
+            self._delete_keys(connection, [key])
+            connection.execute(
+                "INSERT INTO cache_entry (key, value, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, self._dumps(value), now + self.ttl, now),
+            )
+            connection.executemany(
+                "INSERT OR IGNORE INTO cache_tag (tag, key) VALUES (?, ?)",
+                [(self._dumps(tag), key) for tag in tags],
+            )
+
+            overflow = (
+                connection.execute("SELECT COUNT(*) FROM cache_entry").fetchone()[0]
+                - self.maxsize
+            )
+            if overflow > 0:
+                evicted = [
+                    row[0]
+                    for row in connection.execute(
+                        "SELECT key FROM cache_entry ORDER BY accessed_at LIMIT ?",
+                        (overflow,),
+                    )
+                ]
+                self._delete_keys(connection, evicted)
+                self.evictions += len(evicted)
+        return True
+
+    def invalidate(self, tag: Hashable) -> int:
+        connection = self._connection()
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            self._increment_generation(connection)
+            keys = [
+                row[0]
+                for row in connection.execute(
+                    "SELECT key FROM cache_tag WHERE tag = ?", (self._dumps(tag),)
+                )
+            ]
+            self._delete_keys(connection, keys)
+        self.invalidations += len(keys)
+        return len(keys)
+
+    def clear(self):
+        connection = self._connection()
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            self._increment_generation(connection)
+            connection.execute("DELETE FROM cache_entry")
+            connection.execute("DELETE FROM cache_tag")
+
+    def generation(self) -> int:
+        return self._generation(self._connection())
+
+    def __len__(self) -> int:
+        return (
+            self._connection().execute("SELECT COUNT(*) FROM cache_entry").fetchone()[0]
+        )
+
+
+def create_cache(url: str, maxsize: int = 4096, ttl: float = 60.0) -> CacheBackend:
+    """CACHE_URL (memory:// | sqlite:///<path>) 에 맞는 캐시 백엔드 생성"""
+    if url.startswith("memory://"):
+        return LRUCache(maxsize=maxsize, ttl=ttl)
+    if url.startswith("sqlite:///"):
+        return SQLiteCache(path=url[len("sqlite:///") :], maxsize=maxsize, ttl=ttl)
+
+    raise ValueError(f"Unsupported cache url: {url}")
@@ -0,0 +1,88 @@
+import os
+
+# DB 연결 URL (engine 은 app 시작시 생성하므로 import 시점에는 없어도 됨)
+DB_URL = os.environ.get("DB_URL")
+# 비동기 engine URL, 지정하지 않으면 DB_URL 의 sqlite 드라이버를 aiosqlite 로 바꿔 사용
+DB_ASYNC_URL = os.environ.get("DB_ASYNC_URL")
+# GET 요청용 읽기 DB (복제본 등), 지정하지 않으면 같은 DB 를 읽기 전용(query_only) 연결로 사용
+DB_READ_URL = os.environ.get("DB_READ_URL")
+
+# 앱 시작시 엔티티에 선언된 인덱스 등 스키마 마이그레이션 실행 여부
+# (기본 false: 워커마다 실행하지 않도록 배포시 python -m app.infrastructures.migration 실행)
+DB_AUTO_MIGRATE = os.environ.get("DB_AUTO_MIGRATE", "false").lower() == "true"
+
+# 앱 시작시 회사명 검색 색인을 백그라운드에서 미리 생성할지 여부 (false 면 첫 검색 요청에서 생성)
+COMPANY_INDEX_WARMUP = os.environ.get("COMPANY_INDEX_WARMUP", "true").lower() == "true"
+
+# 회사명 자동완성 / 태그 검색 방식 (index | fts | like)
+# index 는 워커마다 전체 회사명 n-gram 색인을 메모리에 두므로 회사 수에 맞춰 선택
+COMPANY_SEARCH_BACKEND = os.environ.get("COMPANY_SEARCH_BACKEND", "like")
+
+# 인메모리 색인이 다른 워커의 변경분을 확인하는 주기 (초)
+COMPANY_INDEX_REFRESH_SECONDS = float(
+    os.environ.get("COMPANY_INDEX_REFRESH_SECONDS", 5)
+)
+
+# 없는 회사명 상세 조회를 DB 조회 없이 404 처리하는 회사명 Bloom filter 사용 여부, 목표 오탐률
+# (다른 워커에서 추가된 회사명은 COMPANY_INDEX_REFRESH_SECONDS 이내에 반영)
+COMPANY_NAME_FILTER = os.environ.get("COMPANY_NAME_FILTER", "true").lower() == "true"
+COMPANY_NAME_FILTER_FP_RATE = float(os.environ.get("COMPANY_NAME_FILTER_FP_RATE", 0.01))
+
+# 회사 상세 조회 캐시 백엔드 (memory:// | sqlite:///<path>)
+# 여러 워커가 캐시와 무효화를 공유해야 하면 sqlite 파일 백엔드 사용
+CACHE_URL = os.environ.get("CACHE_URL", "memory://")
+
+# 회사 상세 조회 (회사명, 언어) 캐시 최대 항목 수, TTL (초)
+COMPANY_CACHE_MAXSIZE = int(os.environ.get("COMPANY_CACHE_MAXSIZE", 4096))
+COMPANY_CACHE_TTL_SECONDS = float(os.environ.get("COMPANY_CACHE_TTL_SECONDS", 60))
+
+# 회사 일괄 추가시 한 트랜잭션에 쓰는 회사 수
+COMPANY_IMPORT_BATCH_SIZE = int(os.environ.get("COMPANY_IMPORT_BATCH_SIZE", 1000))
+
+# 회사 태그 추가/삭제를 큐에 모아 group commit 으로 적용할지 여부
+COMPANY_TAG_WRITE_QUEUE = (
+    os.environ.get("COMPANY_TAG_WRITE_QUEUE", "false").lower() == "true"
+)
+# group commit 한 번에 적용하는 최대 태그 변경 수, 첫 변경 이후 최대 대기 시간 (ms)
+COMPANY_TAG_WRITE_BATCH_SIZE = int(os.environ.get("COMPANY_TAG_WRITE_BATCH_SIZE", 64))
+COMPANY_TAG_WRITE_BATCH_WAIT_MS = float(
+    os.environ.get("COMPANY_TAG_WRITE_BATCH_WAIT_MS", 5)
+)
+
+# /search, /tags NDJSON 스트리밍시 한 번에 조회하는 회사 수
+COMPANY_STREAM_CHUNK_SIZE = int(os.environ.get("COMPANY_STREAM_CHUNK_SIZE", 1000))
+# /search, /tags JSON 응답 한 번에 반환하는 최대 회사 수 (limit 미지정시 기본값)
+# 나머지는 x-next-after 커서로 다음 페이지 조회, 전체 결과는 format=ndjson 스트리밍
+COMPANY_SEARCH_MAX_LIMIT = int(os.environ.get("COMPANY_SEARCH_MAX_LIMIT", 1000))
+
+# 요청별 처리 시간, SQL 실행 수 측정 (/metrics, Server-Timing 헤더)
+METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "true").lower() == "true"
+
+# SQLite 연결시 적용할 PRAGMA 프로필 (wal | default)
+DB_SQLITE_PROFILE = os.environ.get("DB_SQLITE_PROFILE", "wal")
+# wal 프로필의 mmap 크기 (byte), 페이지 캐시 크기 (KiB), 잠금 대기 시간 (ms)
+DB_SQLITE_MMAP_SIZE = int(os.environ.get("DB_SQLITE_MMAP_SIZE", 256 * 1024 * 1024))
+DB_SQLITE_CACHE_SIZE_KB = int(os.environ.get("DB_SQLITE_CACHE_SIZE_KB", 64 * 1024))
+DB_SQLITE_BUSY_TIMEOUT_MS = int(os.environ.get("DB_SQLITE_BUSY_TIMEOUT_MS", 5000))
+
+# 워커 프로세스당 DB 커넥션 풀 크기, 초과 허용 수, 대기 시간 (초)
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", 5))
+DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", 10))
+DB_POOL_TIMEOUT = float(os.environ.get("DB_POOL_TIMEOUT", 30))
+
+# /companies:batch-get 한 번에 조회 가능한 회사명 수 (SQLite 바인드 변수 한도 이내)
+COMPANY_BATCH_GET_MAX_SIZE = int(os.environ.get("COMPANY_BATCH_GET_MAX_SIZE", 1000))
+
+# /search?mode=prefix 에서 limit 을 지정하지 않았을 때 반환하는 회사 수
+COMPANY_AUTOCOMPLETE_PREFIX_LIMIT = int(
+    os.environ.get("COMPANY_AUTOCOMPLETE_PREFIX_LIMIT", 10)
+)
+
+# /search, /tags JSON 응답을 응답 스키마 검증 없이 바로 직렬화 (orjson 이 있으면 사용)
+COMPANY_FAST_RESPONSE = (
+    os.environ.get("COMPANY_FAST_RESPONSE", "false").lower() == "true"
+)
+# 빠른 응답 경로에서 gzip / br 압축을 적용하는 최소 본문 크기 (byte)
+RESPONSE_COMPRESSION_MIN_SIZE = int(
+    os.environ.get("RESPONSE_COMPRESSION_MIN_SIZE", 1024)
+)
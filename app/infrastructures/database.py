@@ -1,21 +1,159 @@
-import os
+from functools import cache
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
-SQLALCHEMY_DATABASE_URL = os.environ.get("DB_URL")
-
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+from app.infrastructures.config import (
+    DB_ASYNC_URL,
+    DB_MAX_OVERFLOW,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    DB_READ_URL,
+    DB_SQLITE_BUSY_TIMEOUT_MS,
+    DB_SQLITE_CACHE_SIZE_KB,
+    DB_SQLITE_MMAP_SIZE,
+    DB_SQLITE_PROFILE,
+    DB_URL,
 )
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# DB_SQLITE_PROFILE 별 연결시 적용할 PRAGMA
+SQLITE_PRAGMA_PROFILES = {
+    # SQLite 기본값 (rollback journal, 쓰기 commit 중에는 다른 워커의 읽기도 대기)
+    "default": {},
+    # WAL: 쓰기 중에도 읽기가 막히지 않고, fsync 는 checkpoint 시에만 수행
+    "wal": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": DB_SQLITE_MMAP_SIZE,
+        "cache_size": -DB_SQLITE_CACHE_SIZE_KB,
+        "busy_timeout": DB_SQLITE_BUSY_TIMEOUT_MS,
+        "temp_store": "MEMORY",
+    },
+}
+
+POOL_OPTIONS = {
+    "pool_size": DB_POOL_SIZE,
+    "max_overflow": DB_MAX_OVERFLOW,
+    "pool_timeout": DB_POOL_TIMEOUT,
+}
+
+
+def configure_sqlite_engine(
+    engine: Engine, profile: str = DB_SQLITE_PROFILE, read_only: bool = False
+):
+    """engine 이 새 SQLite 연결을 만들 때마다 프로필의 PRAGMA 적용"""
+    pragmas = dict(SQLITE_PRAGMA_PROFILES[profile])
+    if read_only:
+        # journal_mode 변경은 쓰기이므로 쓰기 연결에만 적용
+        pragmas.pop("journal_mode", None)
+        pragmas["query_only"] = "ON"
+    if engine.dialect.name != "sqlite" or not pragmas:
+        return engine
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name} = {value}")
+        cursor.close()
+
+    return engine
+
+
+def _database_url() -> str:
+    if not DB_URL:
+        raise RuntimeError("DB_URL environment variable is not set")
+    return DB_URL
+
+
+def _async_database_url() -> str:
+    return DB_ASYNC_URL or _database_url().replace(
+        "sqlite://", "sqlite+aiosqlite://", 1
+    )
+
+
+# engine 은 import 시점이 아닌 처음 사용할 때 (app lifespan 시작시) 생성하고 세션 팩토리에 연결
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
+AsyncSessionLocal = async_sessionmaker(autocommit=False, autoflush=False)
+AsyncReadSessionLocal = async_sessionmaker(autocommit=False, autoflush=False)
+
+
+@cache
+def get_engine() -> Engine:
+    """동기 engine (마이그레이션, 커맨드용)"""
+    engine = configure_sqlite_engine(
+        create_engine(
+            _database_url(),
+            connect_args={"check_same_thread": False},
+            **POOL_OPTIONS,
+        )
+    )
+    SessionLocal.configure(bind=engine)
+    return engine
+
+
+@cache
+def get_async_engine() -> AsyncEngine:
+    """쓰기 API 용 비동기 engine"""
+    # aiosqlite 기본값(NullPool)은 요청마다 연결(스레드)을 새로 만들므로 풀 사용
+    async_engine = create_async_engine(
+        _async_database_url(), poolclass=AsyncAdaptedQueuePool, **POOL_OPTIONS
+    )
+    configure_sqlite_engine(async_engine.sync_engine)
+    AsyncSessionLocal.configure(bind=async_engine)
+    return async_engine
+
+
+@cache
+def get_read_async_engine() -> AsyncEngine:
+    """GET API 용 읽기 전용 비동기 engine"""
+    read_async_engine = create_async_engine(
+        DB_READ_URL or _async_database_url(),
+        poolclass=AsyncAdaptedQueuePool,
+        **POOL_OPTIONS,
+    )
+    configure_sqlite_engine(read_async_engine.sync_engine, read_only=True)
+    AsyncReadSessionLocal.configure(bind=read_async_engine)
+    return read_async_engine
+
+
+async def dispose_engines():
+    """생성된 engine 의 연결 풀 정리 (다음 사용시 다시 생성)"""
+    for get_async in (get_async_engine, get_read_async_engine):
+        if get_async.cache_info().currsize:
+            await get_async().dispose()
+            get_async.cache_clear()
+    if get_engine.cache_info().currsize:
+        get_engine().dispose()
+        get_engine.cache_clear()
+
 
 Base = declarative_base()
 
 
 def get_db():
+    get_engine()
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    get_async_engine()
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_async_read_db():
+    get_read_async_engine()
+    async with AsyncReadSessionLocal() as db:
+        yield db
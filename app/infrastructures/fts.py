@@ -0,0 +1,133 @@
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+# company_name / company_tag 를 하나의 FTS5(trigram) 테이블로 미러링
+# rowid 는 company_name.id * 2, company_tag.id * 2 + 1 로 매핑하여 트리거에서 rowid 로 바로 삭제
+# body 는 원문 대신 검색 키 (회사명은 공백으로 구분한 정규화 / 초성 검색 키, 태그는 정규화 검색 키)
+COMPANY_SEARCH_FTS_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS company_search_fts USING fts5(
+        body,
+        source UNINDEXED,
+        c_id UNINDEXED,
+        lang UNINDEXED,
+        tokenize = 'trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS company_name_fts_ai AFTER INSERT ON company_name
+    BEGIN
+        INSERT INTO company_search_fts (rowid, body, source, c_id, lang)
+        VALUES (
+            new.id * 2,
+            new.search_key || ' ' || new.chosung_key,
+            'name',
+            new.c_id,
+            new.lang
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS company_name_fts_ad AFTER DELETE ON company_name
+    BEGIN
+        DELETE FROM company_search_fts WHERE rowid = old.id * 2;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS company_name_fts_au AFTER UPDATE ON company_name
+    BEGIN
+        DELETE FROM company_search_fts WHERE rowid = old.id * 2;
+        INSERT INTO company_search_fts (rowid, body, source, c_id, lang)
+        VALUES (
+            new.id * 2,
+            new.search_key || ' ' || new.chosung_key,
+            'name',
+            new.c_id,
+            new.lang
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS company_tag_fts_ai AFTER INSERT ON company_tag
+    BEGIN
+        INSERT INTO company_search_fts (rowid, body, source, c_id, lang)
+        VALUES (new.id * 2 + 1, new.search_key, 'tag', new.c_id, new.lang);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS company_tag_fts_ad AFTER DELETE ON company_tag
+    BEGIN
+        DELETE FROM company_search_fts WHERE rowid = old.id * 2 + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS company_tag_fts_au AFTER UPDATE ON company_tag
+    BEGIN
+        DELETE FROM company_search_fts WHERE rowid = old.id * 2 + 1;
+        INSERT INTO company_search_fts (rowid, body, source, c_id, lang)
+        VALUES (new.id * 2 + 1, new.search_key, 'tag', new.c_id, new.lang);
+    END
+    """,
+]
+
+COMPANY_SEARCH_FTS_TRIGGERS = (
+    "company_name_fts_ai",
+    "company_name_fts_ad",
+    "company_name_fts_au",
+    "company_tag_fts_ai",
+    "company_tag_fts_ad",
+    "company_tag_fts_au",
+)
+
+COMPANY_SEARCH_FTS_REBUILD = [
+    "DELETE FROM company_search_fts",
+    """
+    INSERT INTO company_search_fts (rowid, body, source, c_id, lang)
+    SELECT id * 2, search_key || ' ' || chosung_key, 'name', c_id, lang
+    FROM company_name
+    """,
+    """
+    INSERT INTO company_search_fts (rowid, body, source, c_id, lang)
+    SELECT id * 2 + 1, search_key, 'tag', c_id, lang FROM company_tag
+    """,
+]
+
+
+def has_company_search_fts(connection: Connection) -> bool:
+    """company_search_fts 테이블 존재 여부"""
+    return (
+        connection.execute(
+            text(
+                "SELECT 1 FROM sqlite_master "
+                "WHERE type = 'table' AND name = 'company_search_fts'"
+            )
+        ).first()
+        is not None
+    )
+
+
+def _has_outdated_triggers(connection: Connection) -> bool:
+    """검색 키 대신 원문을 미러링하던 이전 버전 동기화 트리거 존재 여부"""
+    trigger_sql = connection.execute(
+        text(
+            "SELECT sql FROM sqlite_master "
+            "WHERE type = 'trigger' AND name = 'company_name_fts_ai'"
+        )
+    ).scalar()
+    return trigger_sql is not None and "search_key" not in trigger_sql
+
+
+def create_company_search_fts(connection: Connection, rebuild: bool = False):
+    """FTS5 테이블, 동기화 트리거 생성 (새로 만들어지거나 트리거가 바뀐 경우 기존 데이터로 채움)"""
+    existed = has_company_search_fts(connection)
+    if _has_outdated_triggers(connection):
+        for trigger in COMPANY_SEARCH_FTS_TRIGGERS:
+            connection.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+        rebuild = True
+
+    for ddl in COMPANY_SEARCH_FTS_DDL:
+        connection.execute(text(ddl))
+
+    if rebuild or not existed:
+        for statement in COMPANY_SEARCH_FTS_REBUILD:
+            connection.execute(text(statement))
@@ -0,0 +1,185 @@
+import bisect
+import threading
+import time
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# 요청 처리 시간 히스토그램 구간 (초)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+# 요청당 SQL 실행 수 히스토그램 구간
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 25, 50, 100)
+
+
+class RequestStats:
+    """요청 하나에서 실행된 SQL 수, 시간"""
+
+    __slots__ = ("statements", "db_seconds")
+
+    def __init__(self):
+        self.statements = 0
+        self.db_seconds = 0.0
+
+
+# 현재 요청의 RequestStats (run_sync 의 greenlet, 스레드풀에도 context 가 복사되어 전달)
+_request_stats: ContextVar[RequestStats | None] = ContextVar(
+    "request_stats", default=None
+)
+
+
+class Histogram:
+    """누적 구간별 관측 수, 합계 (Prometheus histogram)"""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def render(self, name: str, labels: str) -> list[str]:
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + ("+Inf",), self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+        lines.append(f"{name}_sum{{{labels}}} {self.sum}")
+        lines.append(f"{name}_count{{{labels}}} {self.count}")
+        return lines
+
+
+class RequestMetrics:
+    """(method, route, status) 별 처리 시간, SQL 실행 수/시간 집계 (프로세스 단위)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latency: dict[tuple[str, str, int], Histogram] = {}
+        self._statements: dict[tuple[str, str, int], Histogram] = {}
+        self._db_seconds: dict[tuple[str, str, int], float] = {}
+
+    def observe(self, method: str, route: str, status: int, elapsed: float, stats):
+        key = (method, route, status)
+        with self._lock:
+            if key not in self._latency:
+                self._latency[key] = Histogram(LATENCY_BUCKETS)
+                self._statements[key] = Histogram(STATEMENT_BUCKETS)
+                self._db_seconds[key] = 0.0
+            self._latency[key].observe(elapsed)
+            self._statements[key].observe(stats.statements)
+            self._db_seconds[key] += stats.db_seconds
+
+    def render(self) -> str:
+        """Prometheus text format 으로 변환"""
+        lines = [
+            "# HELP http_request_duration_seconds HTTP request latency",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        with self._lock:
+            keys = sorted(self._latency)
+            for key in keys:
+                lines.extend(
+                    self._latency[key].render(
+                        "http_request_duration_seconds", _labels(*key)
+                    )
+                )
+            lines.append("# HELP http_request_db_statements SQL statements per request")
+            lines.append("# TYPE http_request_db_statements histogram")
+            for key in keys:
+                lines.extend(
+                    self._statements[key].render(
+                        "http_request_db_statements", _labels(*key)
+                    )
+                )
+            lines.append(
+                "# HELP http_request_db_seconds_total SQL execution time of requests"
+            )
+            lines.append("# TYPE http_request_db_seconds_total counter")
+            for key in keys:
+                lines.append(
+                    f"http_request_db_seconds_total{{{_labels(*key)}}} "
+                    f"{self._db_seconds[key]}"
+                )
+        return "\n".join(lines) + "\n"
+
+
+def _labels(method: str, route: str, status: int) -> str:
+    route = route.replace("\\", "\\\\").replace('"', '\\"')
+    return f'method="{method}",route="{route}",status="{status}"'
+
+
+request_metrics = RequestMetrics()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _request_stats.get() is not None:
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _request_stats.get()
+    if stats is None:
+        return
+    started_at = conn.info["query_started_at"].pop()
+    stats.statements += 1
+    stats.db_seconds += time.perf_counter() - started_at
+
+
+def instrument_engine(engine: Engine):
+    """engine 의 SQL 실행 수, 시간을 현재 요청의 RequestStats 에 기록"""
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class MetricsMiddleware:
+    """요청별 처리 시간, SQL 실행 수/시간 기록 및 Server-Timing 헤더 추가 (ASGI)"""
+
+    def __init__(self, app, metrics: RequestMetrics = request_metrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        started_at = time.perf_counter()
+        status = 500
+
+        async def send_with_server_timing(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                elapsed_ms = (time.perf_counter() - started_at) * 1000
+                server_timing = (
+                    f"app;dur={elapsed_ms:.1f}, db;dur={stats.db_seconds * 1000:.1f};"
+                    f'desc="{stats.statements} queries"'
+                )
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"server-timing", server_timing.encode("latin-1"))
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_server_timing)
+        finally:
+            _request_stats.reset(token)
+            # 라우팅된 경로 템플릿 기준으로 집계 (/companies/{company_name})
+            route = scope.get("route")
+            self.metrics.observe(
+                scope["method"],
+                route.path if route is not None else "unmatched",
+                status,
+                time.perf_counter() - started_at,
+                stats,
+            )
@@ -0,0 +1,185 @@
+import argparse
+import logging
+
+from sqlalchemy import (
+    and_,
+    bindparam,
+    delete,
+    func,
+    inspect,
+    or_,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.schema import CreateColumn, Index
+
+from app.entities import company  # noqa: F401 (Base.metadata 에 테이블 등록)
+from app.entities.company import CompanyName, CompanyTag
+from app.infrastructures.database import Base, get_engine
+from app.infrastructures.fts import create_company_search_fts
+from app.infrastructures.read_model import rebuild_company_profiles
+from app.infrastructures.table_version import create_table_version_triggers
+from app.utils.search_key import chosung_search_key, normalize_search_key
+
+BACKFILL_BATCH_SIZE = 10000
+
+logger = logging.getLogger(__name__)
+
+
+def _add_missing_columns(connection: Connection, existing_tables: set[str]):
+    """기존 테이블에 없는 엔티티 컬럼 추가 (NOT NULL 컬럼은 server_default 필요)"""
+    inspector = inspect(connection)
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            column_ddl = CreateColumn(column).compile(dialect=connection.dialect)
+            connection.execute(
+                text(f'ALTER TABLE "{table.name}" ADD COLUMN {column_ddl}')
+            )
+
+
+def _delete_duplicate_rows(connection: Connection, index: Index) -> int:
+    """unique 인덱스 컬럼 값이 같은 행 중 ID 가 가장 작은 행만 남기고 삭제한 행 수 반환
+
+    삭제되는 행을 참조하는 외래 키는 남는 행을 참조하도록 변경
+    """
+    table = index.table
+    columns = list(index.columns)
+    kept = (
+        select(func.min(table.c.id).label("kept_id"), *columns)
+        .group_by(*columns)
+        .having(func.count() > 1)
+        .subquery()
+    )
+    duplicates = connection.execute(
+        select(table.c.id, kept.c.kept_id)
+        .join(kept, and_(*(column == kept.c[column.name] for column in columns)))
+        .where(table.c.id != kept.c.kept_id)
+        .order_by(table.c.id)
+    ).all()
+    if not duplicates:
+        return 0
+
+    logger.warning(
+        "%s: deleting %d rows duplicated on (%s) before creating %s "
+        "(deleted id -> kept id: %s)",
+        table.name,
+        len(duplicates),
+        ", ".join(column.name for column in columns),
+        index.name,
+        ", ".join(f"{row_id} -> {kept_id}" for row_id, kept_id in duplicates),
+    )
+    for referencing in Base.metadata.sorted_tables:
+        for foreign_key in referencing.foreign_keys:
+            if foreign_key.column is not table.c.id:
+                continue
+            connection.execute(
+                update(referencing)
+                .where(foreign_key.parent == bindparam("row_id"))
+                .values({foreign_key.parent.name: bindparam("kept_id")}),
+                [
+                    {"row_id": row_id, "kept_id": kept_id}
+                    for row_id, kept_id in duplicates
+                ],
+            )
+    connection.execute(
+        delete(table).where(table.c.id.in_([row_id for row_id, _ in duplicates]))
+    )
+    return len(duplicates)
+
+
+def _backfill_search_keys(connection: Connection, entity, column) -> int:
+    """검색 키가 비어있는 행의 정규화 / 초성 검색 키를 채우고 행 수 반환"""
+    table = entity.__table__
+    rows = connection.execute(
+        select(table.c.id, column).where(
+            or_(table.c.search_key.is_(None), table.c.chosung_key.is_(None))
+        )
+    ).all()
+    statement = (
+        update(table)
+        .where(table.c.id == bindparam("row_id"))
+        .values(
+            search_key=bindparam("row_search_key"),
+            chosung_key=bindparam("row_chosung_key"),
+        )
+    )
+    for start in range(0, len(rows), BACKFILL_BATCH_SIZE):
+        connection.execute(
+            statement,
+            [
+                {
+                    "row_id": row_id,
+                    "row_search_key": normalize_search_key(value),
+                    "row_chosung_key": chosung_search_key(value),
+                }
+                for row_id, value in rows[start : start + BACKFILL_BATCH_SIZE]
+            ],
+        )
+    return len(rows)
+
+
+def upgrade(bind: Engine, fts: bool = False) -> list[str]:
+    """엔티티에 선언된 테이블, 인덱스 중 DB 에 없거나 달라진 항목 생성 후 인덱스명 반환"""
+    created = []
+    deleted = 0
+    with bind.begin() as connection:
+        existing_tables = set(inspect(connection).get_table_names())
+        Base.metadata.create_all(bind=connection)
+        _add_missing_columns(connection, existing_tables)
+
+        inspector = inspect(connection)
+        for table in Base.metadata.sorted_tables:
+            existing = {
+                index["name"]: bool(index["unique"])
+                for index in inspector.get_indexes(table.name)
+            }
+            for index in table.indexes:
+                if existing.get(index.name) == bool(index.unique):
+                    continue
+                # 같은 이름이지만 unique 여부가 달라진 인덱스는 다시 생성
+                if index.name in existing:
+                    index.drop(bind=connection)
+                # 인덱스가 없던 동안 쌓인 중복 행이 있으면 unique 인덱스 생성이 실패하므로 먼저 정리
+                if index.unique:
+                    deleted += _delete_duplicate_rows(connection, index)
+                index.create(bind=connection)
+                created.append(index.name)
+
+        # 검색 키 컬럼이 추가되기 전에 저장된 행은 검색 키 계산
+        _backfill_search_keys(connection, CompanyName, CompanyName.name)
+        _backfill_search_keys(connection, CompanyTag, CompanyTag.tag)
+
+        create_table_version_triggers(connection)
+
+        # 새로 생성된 조회용 프로필 테이블은 기존 데이터로 채움 (중복 행을 정리했으면 다시 생성)
+        if "company_profile" not in existing_tables or deleted:
+            rebuild_company_profiles(connection)
+
+        if fts:
+            create_company_search_fts(connection)
+
+    return created
+
+
+def main():
+    parser = argparse.ArgumentParser(description="wantedlab DB 스키마 마이그레이션")
+    parser.add_argument(
+        "--fts", action="store_true", help="FTS5 검색 테이블, 동기화 트리거도 생성"
+    )
+    args = parser.parse_args()
+
+    created = upgrade(get_engine(), fts=args.fts)
+    for index_name in created:
+        print(f"created index: {index_name}")
+    print(f"migration done ({len(created)} indexes created)")
+
+
+if __name__ == "__main__":
+    main()
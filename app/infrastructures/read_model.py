@@ -0,0 +1,92 @@
+from typing import Iterable
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.engine import Connection
+
+from app.utils.enum import Language
+
+# (회사, 언어) 한 행에 회사명, 대체 회사명(해당 언어 > ko > 그 외 언어), 정렬된 태그 리스트를 저장
+# 기본 언어는 모든 회사에 행을 만들고, 그 외 언어는 회사명/태그가 있는 경우에만 행을 만듦
+# (행이 없는 언어의 대체 회사명은 ko 행의 fallback_name 과 같음)
+COMPANY_PROFILE_INSERT = """
+    INSERT INTO company_profile (c_id, lang, name, fallback_name, tags)
+    WITH language(lang) AS (VALUES {languages}),
+    profile_key AS (
+        SELECT company.id AS c_id, language.lang AS lang
+        FROM company CROSS JOIN language {company_where}
+        UNION SELECT c_id, lang FROM company_name {where}
+        UNION SELECT c_id, lang FROM company_tag {where}
+    ),
+    profile AS (
+        SELECT
+            c_id,
+            lang,
+            (
+                SELECT name FROM company_name
+                WHERE c_id = profile_key.c_id AND lang = profile_key.lang
+                ORDER BY id LIMIT 1
+            ) AS name,
+            (
+                SELECT json_group_array(tag) FROM (
+                    SELECT tag FROM company_tag
+                    WHERE c_id = profile_key.c_id AND lang = profile_key.lang
+                    ORDER BY tag_category_id, id
+                )
+            ) AS tags
+        FROM profile_key
+    )
+    SELECT
+        c_id,
+        lang,
+        name,
+        COALESCE(
+            name,
+            (
+                SELECT name FROM company_name
+                WHERE c_id = profile.c_id AND lang = 'ko'
+                ORDER BY id LIMIT 1
+            ),
+            (
+                SELECT name FROM company_name
+                WHERE c_id = profile.c_id
+                ORDER BY id LIMIT 1
+            )
+        ),
+        tags
+    FROM profile
+"""
+
+
+def _profile_insert(filtered: bool = False):
+    languages = ", ".join(f"('{lang.value}')" for lang in Language)
+    return text(
+        COMPANY_PROFILE_INSERT.format(
+            languages=languages,
+            company_where="WHERE company.id IN :c_ids" if filtered else "",
+            where="WHERE c_id IN :c_ids" if filtered else "",
+        )
+    )
+
+
+def refresh_company_profiles(connection: Connection, c_ids: Iterable[int]) -> int:
+    """회사 IDs 의 조회용 프로필 행을 원본 테이블 기준으로 다시 생성"""
+    c_ids = list(set(c_ids))
+    if not c_ids:
+        return 0
+
+    connection.execute(
+        text("DELETE FROM company_profile WHERE c_id IN :c_ids").bindparams(
+            bindparam("c_ids", expanding=True)
+        ),
+        {"c_ids": c_ids},
+    )
+    return connection.execute(
+        _profile_insert(filtered=True).bindparams(bindparam("c_ids", expanding=True)),
+        {"c_ids": c_ids},
+    ).rowcount
+
+
+def rebuild_company_profiles(connection: Connection) -> int:
+    """조회용 프로필 테이블 전체를 원본 테이블 기준으로 다시 생성"""
+    connection.execute(text("DELETE FROM company_profile"))
+    return connection.execute(_profile_insert()).rowcount
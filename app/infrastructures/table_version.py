@@ -0,0 +1,29 @@
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+# 행이 추가/변경/삭제될 때마다 table_version 의 버전을 올리는 테이블
+# (다른 워커, import CLI 의 변경을 전체 테이블 조회 없이 버전 한 행으로 확인)
+VERSIONED_TABLES = ("company_name",)
+
+TABLE_VERSION_TRIGGER_EVENTS = (("ai", "INSERT"), ("ad", "DELETE"), ("au", "UPDATE"))
+
+
+def create_table_version_triggers(connection: Connection):
+    """VERSIONED_TABLES 의 버전 행, 버전 증가 트리거 생성"""
+    for table in VERSIONED_TABLES:
+        connection.execute(
+            text(
+                "INSERT OR IGNORE INTO table_version (table_name, version) "
+                "VALUES (:table_name, 0)"
+            ),
+            {"table_name": table},
+        )
+        for suffix, event in TABLE_VERSION_TRIGGER_EVENTS:
+            connection.execute(text(f"""
+                    CREATE TRIGGER IF NOT EXISTS {table}_version_{suffix}
+                    AFTER {event} ON {table}
+                    BEGIN
+                        UPDATE table_version SET version = version + 1
+                        WHERE table_name = '{table}';
+                    END
+                    """))
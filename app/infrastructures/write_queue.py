@@ -0,0 +1,115 @@
+import asyncio
+import contextvars
+import time
+
+from app.infrastructures.metrics import LATENCY_BUCKETS, Histogram
+
+# group commit 한 번에 적용한 쓰기 작업 수 히스토그램 구간
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+# worker 종료 신호
+_STOP = object()
+
+
+class GroupCommitQueue:
+    """쓰기 작업을 모아 max_wait 초 또는 max_batch 개마다 한 트랜잭션으로 적용 (group commit)
+
+    apply_batch(items) 는 item 순서대로 결과 (실패한 item 은 예외 객체) 리스트를 반환
+    """
+
+    def __init__(self, name: str, apply_batch, max_batch: int, max_wait: float):
+        self.name = name
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._apply_batch = apply_batch
+        # 큐, worker 는 이벤트 루프에 묶이므로 첫 submit 시점에 생성
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+        self._batch_sizes = Histogram(BATCH_SIZE_BUCKETS)
+        self._wait_seconds = Histogram(LATENCY_BUCKETS)
+
+    @property
+    def depth(self) -> int:
+        """적용을 기다리는 쓰기 작업 수"""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def submit(self, item):
+        """item 을 큐에 넣고, item 이 포함된 batch 가 commit 되면 item 의 결과 반환"""
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            # 처음 submit 한 요청의 context (요청별 SQL 집계 등) 를 물려받지 않도록 빈 context 로 실행
+            # (batch 의 SQL 은 어느 한 요청의 것이 아니므로 요청별 지표에서 제외)
+            self._worker = asyncio.create_task(
+                self._run(), context=contextvars.Context()
+            )
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((item, future, time.perf_counter()))
+        # 호출측이 취소되어도 큐에 들어간 작업은 적용됨
+        return await future
+
+    async def stop(self):
+        """큐에 남은 작업을 모두 적용한 뒤 worker 종료"""
+        if self._worker is None:
+            return
+        self._queue.put_nowait(_STOP)
+        await self._worker
+        self._queue = None
+        self._worker = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            entry = await self._queue.get()
+            if entry is _STOP:
+                return
+            batch = [entry]
+            deadline = loop.time() + self.max_wait
+            stopping = False
+            while len(batch) < self.max_batch:
+                try:
+                    entry = await asyncio.wait_for(
+                        self._queue.get(), max(deadline - loop.time(), 0)
+                    )
+                except asyncio.TimeoutError:
+                    break
+                if entry is _STOP:
+                    stopping = True
+                    break
+                batch.append(entry)
+
+            await self._flush(batch)
+            if stopping:
+                return
+
+    async def _flush(self, batch: list[tuple]):
+        try:
+            results = await self._apply_batch([item for item, _, _ in batch])
+        except Exception as e:
+            results = [e] * len(batch)
+
+        now = time.perf_counter()
+        self._batch_sizes.observe(len(batch))
+        for (_, future, submitted_at), result in zip(batch, results):
+            self._wait_seconds.observe(now - submitted_at)
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def render(self) -> str:
+        """Prometheus text format 으로 변환 (큐 길이, batch 크기, 대기 시간)"""
+        labels = f'queue="{self.name}"'
+        lines = [
+            "# HELP write_queue_depth Write operations waiting for group commit",
+            "# TYPE write_queue_depth gauge",
+            f"write_queue_depth{{{labels}}} {self.depth}",
+            "# HELP write_queue_batch_size Write operations per group commit",
+            "# TYPE write_queue_batch_size histogram",
+            *self._batch_sizes.render("write_queue_batch_size", labels),
+            "# HELP write_queue_wait_seconds Time from enqueue to commit",
+            "# TYPE write_queue_wait_seconds histogram",
+            *self._wait_seconds.render("write_queue_wait_seconds", labels),
+        ]
+        return "\n".join(lines) + "\n"
@@ -1,6 +1,27 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.controllers import company
+from app.controllers import company, monitoring
+from app.infrastructures.config import (
+    COMPANY_INDEX_WARMUP,
+    COMPANY_SEARCH_BACKEND,
+    DB_AUTO_MIGRATE,
+    METRICS_ENABLED,
+)
+from app.infrastructures.database import (
+    dispose_engines,
+    get_async_engine,
+    get_engine,
+    get_read_async_engine,
+)
+from app.infrastructures.metrics import MetricsMiddleware, instrument_engine
+from app.utils.enum import SearchBackend
+
+logger = logging.getLogger(__name__)
 
 tags_metadata = [
     {
@@ -10,10 +31,51 @@ tags_metadata = [
 ]
 
 
+async def _warm_up():
+    # 실패해도 색인은 첫 검색 요청에서 다시 생성되므로 로그만 남김
+    try:
+        await company._company_service.warm_up()
+    except Exception:
+        logger.exception("search index warm-up failed")
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """app 시작/종료 처리 (engine 생성, 마이그레이션, 검색 색인 준비)"""
+    started_at = time.perf_counter()
+    # engine (및 aiosqlite 드라이버) 은 import 시점이 아닌 워커 시작시 생성
+    engine = get_engine()
+    if METRICS_ENABLED:
+        instrument_engine(engine)
+        instrument_engine(get_async_engine().sync_engine)
+        instrument_engine(get_read_async_engine().sync_engine)
+
+    if DB_AUTO_MIGRATE:
+        # 단일 워커 개발 환경용 (여러 워커가 동시에 실행하지 않도록 배포 단계에서 마이그레이션)
+        # 마이그레이션 모듈은 사용할 때만 import
+        from app.infrastructures.migration import upgrade
+
+        upgrade(engine, fts=COMPANY_SEARCH_BACKEND == SearchBackend.fts)
+    # 색인 준비는 백그라운드에서 (색인 생성은 스레드에서 하므로 준비 중에도 요청 처리)
+    warm_up = asyncio.create_task(_warm_up()) if COMPANY_INDEX_WARMUP else None
+    # /metrics 의 app_startup_seconds
+    _app.state.startup_seconds = time.perf_counter() - started_at
+
+    yield
+    if warm_up is not None:
+        # 색인 잠금을 잡은 채 끝나지 않도록 취소가 처리될 때까지 기다림
+        warm_up.cancel()
+        with suppress(asyncio.CancelledError):
+            await warm_up
+    await company._company_service.close()
+    await dispose_engines()
+
+
 def create_app() -> FastAPI:
     """app 생성"""
 
     _app = FastAPI(
+        lifespan=lifespan,
         openapi_url="/openapi.json",
         openapi_tags=tags_metadata,
         docs_url="/docs",
@@ -26,7 +88,10 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    if METRICS_ENABLED:
+        _app.add_middleware(MetricsMiddleware)
     _app.include_router(company.router)
+    _app.include_router(monitoring.router)
     return _app
 
 
@@ -1,43 +1,250 @@
+import logging
 from sqlite3 import IntegrityError
 from fastapi import HTTPException
 
-from sqlalchemy import distinct, exists, or_, select
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    Integer,
+    and_,
+    delete,
+    distinct,
+    exists,
+    func,
+    insert,
+    or_,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, aliased
 
 from app.utils.enum import Language
 
-from app.entities.company import Company, CompanyName, CompanyTag, CompanyTagCategory
+from app.entities.company import (
+    Company,
+    CompanyName,
+    CompanyProfile,
+    CompanyTag,
+    CompanyTagCategory,
+    TableVersion,
+)
+from app.schemas.request.company import NewCompanyInSchema
 from app.infrastructures.database import get_db
+from app.infrastructures.fts import (
+    create_company_search_fts,
+    has_company_search_fts,
+)
+from app.infrastructures.read_model import refresh_company_profiles
+from app.utils.search_key import query_search_key
+
+# 결과를 한 번에 메모리에 올리지 않고 커서에서 나눠 읽는 단위
+YIELD_PER = 1000
+
+logger = logging.getLogger(__name__)
 
 
 class CompanyRepository:
 
-    def get_company_ids_by_word(self, db: Session, search: str):
-        """단어 통해 검색된 회사 IDs 리스트 반환"""
+    def get_company_ids_by_word(
+        self, db: Session, search: str, after: int = 0, limit: int | None = None
+    ):
+        """단어 통해 검색된 회사 IDs 리스트를 after 이후부터 ID 순으로 반환"""
+        # 미리 계산된 검색 키 컬럼과 비교 (초성 검색어는 초성 검색 키와 비교)
+        search, chosung = query_search_key(search)
+        search_key = CompanyName.chosung_key if chosung else CompanyName.search_key
         return (
             db.query(CompanyName.c_id)
-            .filter(CompanyName.name.like(f"%{search}%"))
-            .all()
+            .filter(search_key.like(f"%{search}%"), CompanyName.c_id > after)
+            .distinct()
+            .order_by(CompanyName.c_id)
+            .limit(limit)
+            .yield_per(YIELD_PER)
         )
 
-    def get_company_ids_by_tag(self, db: Session, tag: str):
-        """태그 통해 검색된 회사 IDs 리스트 반환"""
-        return db.query(distinct(CompanyTag.c_id)).filter(CompanyTag.tag == tag).all()
+    def has_company_search_fts(self, db: Session):
+        """FTS5 검색 테이블 존재 여부"""
+        return has_company_search_fts(db.connection())
+
+    def create_company_search_fts(self, db: Session):
+        """FTS5 검색 테이블 및 동기화 트리거 생성"""
+        try:
+            create_company_search_fts(db.connection())
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            return False
+
+        return True
+
+    def get_company_ids_by_word_fts(
+        self, db: Session, search: str, after: int = 0, limit: int | None = None
+    ):
+        """FTS5(trigram) 색인 통해 단어로 검색된 회사 IDs 리스트 반환"""
+        # body 에 정규화 / 초성 검색 키가 모두 들어있으므로 초성 검색어도 그대로 비교
+        search_key, _ = query_search_key(search)
+        # trigram 보다 짧은 검색어는 FTS 색인을 사용할 수 없으므로 기존 조회로 대체
+        if len(search_key) < 3:
+            return self.get_company_ids_by_word(
+                db=db, search=search, after=after, limit=limit
+            )
+
+        return db.execute(
+            text(
+                "SELECT DISTINCT c_id FROM company_search_fts "
+                "WHERE body LIKE :search AND source = 'name' AND c_id > :after "
+                "ORDER BY c_id LIMIT :limit"
+            ).execution_options(yield_per=YIELD_PER),
+            {"search": f"%{search_key}%", "after": after, "limit": limit or -1},
+        )
+
+    def _select_company_ids_by_tag(
+        self, tag: str, after: int = 0, limit: int | None = None, fts: bool = False
+    ):
+        tag, chosung = query_search_key(tag)
+        # trigram 보다 짧은 검색어, 초성 검색어는 FTS 색인을 사용할 수 없으므로 기존 조회로 대체
+        if fts and not chosung and len(tag) >= 3:
+            return (
+                text(
+                    "SELECT DISTINCT c_id FROM company_search_fts "
+                    "WHERE company_search_fts MATCH :phrase "
+                    "AND source = 'tag' AND body = :tag AND c_id > :after "
+                    "ORDER BY c_id LIMIT :limit"
+                )
+                .bindparams(
+                    phrase='"' + tag.replace('"', '""') + '"',
+                    tag=tag,
+                    after=after,
+                    limit=limit or -1,
+                )
+                .columns(c_id=Integer)
+            )
+
+        search_key = CompanyTag.chosung_key if chosung else CompanyTag.search_key
+        return (
+            select(CompanyTag.c_id)
+            .where(search_key == tag, CompanyTag.c_id > after)
+            .distinct()
+            .order_by(CompanyTag.c_id)
+            .limit(limit)
+        )
 
-    def get_company_name_by_id_with_lang(
+    def get_company_names_by_tag_with_lang(
         self,
         db: Session,
-        c_id: int,
-        lang: Language,
+        tag: str,
+        lang: str,
+        after: int = 0,
+        limit: int | None = None,
+        fts: bool = False,
     ):
-        """회사 ID 통해 지원 언어의 회사명 반환"""
+        """태그 통해 검색된 (회사 ID, 회사명, 버전) 리스트 반환 (지원 언어 > ko > 그 외 언어 순)"""
+        return db.execute(
+            self._select_company_names_with_fallback(
+                company_ids=self._select_company_ids_by_tag(
+                    tag=tag, after=after, limit=limit, fts=fts
+                ).subquery(),
+                lang=lang,
+            ).execution_options(yield_per=YIELD_PER)
+        )
+
+    def get_company_names_by_ids_with_fallback(
+        self, db: Session, c_ids: list[int], lang: str
+    ):
+        """회사 IDs 의 (회사 ID, 회사명, 버전) 리스트 반환 (지원 언어 > ko > 그 외 언어 순)"""
+        return db.execute(
+            self._select_company_names_with_fallback(
+                company_ids=select(Company.id.label("c_id"))
+                .where(Company.id.in_(c_ids))
+                .subquery(),
+                lang=lang,
+            )
+        )
+
+    def _select_company_names_with_fallback(self, company_ids, lang: str):
+        localized = aliased(CompanyProfile)
+        default = aliased(CompanyProfile)
         return (
-            db.query(CompanyName.name)
-            .filter(
-                CompanyName.c_id == c_id,
-                CompanyName.lang == lang,
+            select(
+                company_ids.c.c_id,
+                func.coalesce(localized.fallback_name, default.fallback_name).label(
+                    "name"
+                ),
+                Company.version,
             )
-            .first()
+            .join(Company, Company.id == company_ids.c.c_id)
+            .outerjoin(
+                localized,
+                and_(localized.c_id == company_ids.c.c_id, localized.lang == lang),
+            )
+            .outerjoin(
+                default,
+                and_(
+                    default.c_id == company_ids.c.c_id,
+                    default.lang == Language.ko.value,
+                ),
+            )
+            .order_by(company_ids.c.c_id)
+        )
+
+    def get_all_company_names(self, db: Session):
+        """전체 지원 언어 회사명 (c_id, lang, name) 리스트 반환"""
+        return (
+            db.query(CompanyName.c_id, CompanyName.lang, CompanyName.name)
+            .order_by(CompanyName.c_id)
+            .all()
+        )
+
+    def get_company_name_fingerprint(self, db: Session):
+        """회사명 테이블 변경 여부 확인용 버전 반환 (행이 바뀔 때마다 트리거로 증가)"""
+        return db.scalar(
+            select(TableVersion.version).where(
+                TableVersion.table_name == CompanyName.__tablename__
+            )
+        )
+
+    def get_all_company_tag_categories(self, db: Session):
+        """전체 회사 태그 (c_id, tag_category_id, search_key, chosung_key) 반환"""
+        return db.execute(
+            select(
+                CompanyTag.c_id,
+                CompanyTag.tag_category_id,
+                CompanyTag.search_key,
+                CompanyTag.chosung_key,
+            )
+            .order_by(CompanyTag.c_id)
+            .execution_options(yield_per=YIELD_PER)
+        )
+
+    def get_company_tag_categories_by_id(self, db: Session, c_id: int):
+        """회사 ID 통해 (tag_category_id, search_key, chosung_key) 리스트 반환"""
+        return db.execute(
+            select(
+                CompanyTag.tag_category_id,
+                CompanyTag.search_key,
+                CompanyTag.chosung_key,
+            ).where(CompanyTag.c_id == c_id)
+        ).all()
+
+    def get_company_tag_fingerprint(self, db: Session):
+        """회사 태그 테이블 변경 여부 확인용 (행 개수, 최대 ID, 회사 ID 합, 카테고리 ID 합) 반환"""
+        # 삭제 후 같은 ID 로 다시 추가되어도 (회사, 카테고리) 가 바뀌면 합계가 달라짐
+        return tuple(
+            db.query(
+                func.count(CompanyTag.id),
+                func.max(CompanyTag.id),
+                func.total(CompanyTag.c_id),
+                func.total(CompanyTag.tag_category_id),
+            ).one()
+        )
+
+    def get_company_ids_by_tag(
+        self, db: Session, tag: str, after: int = 0, limit: int | None = None
+    ):
+        """태그 통해 검색된 회사 IDs 리스트를 after 이후부터 ID 순으로 반환"""
+        return db.execute(
+            self._select_company_ids_by_tag(
+                tag=tag, after=after, limit=limit
+            ).execution_options(yield_per=YIELD_PER)
         )
 
     def get_company_names_by_ids_with_lang(
@@ -48,22 +255,16 @@ class CompanyRepository:
     ):
         """회사 IDs 통해 검색된 지원 언어 회사명 리스트 반환"""
         return (
-            db.query(CompanyName)
+            db.query(CompanyProfile.name)
             .filter(
-                CompanyName.c_id.in_(c_ids),
-                CompanyName.lang == lang,
+                CompanyProfile.c_id.in_(c_ids),
+                CompanyProfile.lang == lang,
+                CompanyProfile.name.is_not(None),
             )
-            .all()
+            .order_by(CompanyProfile.c_id)
+            .yield_per(YIELD_PER)
         )
 
-    def get_company_names_by_ids(
-        self,
-        db: Session,
-        c_ids: list[int],
-    ):
-        """회사 IDs 통해 검색된 회사명 리스트 반환"""
-        return db.query(CompanyName).filter(CompanyName.c_id.in_(c_ids)).all()
-
     def get_company_id_by_name(
         self,
         db: Session,
@@ -76,20 +277,79 @@ class CompanyRepository:
             .first()
         )
 
-    def get_company_tags_by_id_with_lang(
+    def _get_company_profile(self, db: Session, c_id, lang: str):
+        # 모든 회사에 있는 ko 행 기준으로 조회하여 회사 없음 / 해당 언어 회사명 없음 구분
+        localized = aliased(CompanyProfile)
+        return (
+            db.query(CompanyProfile.c_id, localized.name, localized.tags)
+            .outerjoin(
+                localized,
+                and_(localized.c_id == CompanyProfile.c_id, localized.lang == lang),
+            )
+            .filter(
+                CompanyProfile.c_id == c_id,
+                CompanyProfile.lang == Language.ko.value,
+            )
+            .first()
+        )
+
+    def get_company_profile_by_id_with_lang(
         self,
         db: Session,
         c_id: int,
         lang: str,
     ):
-        """회사 ID 통해 지원 언어의 회사 태그 리스트 반환"""
+        """회사 ID 통해 조회용 프로필 (회사 ID, 지원 언어 회사명, 태그 리스트) 반환"""
+        return self._get_company_profile(db=db, c_id=c_id, lang=lang)
+
+    def _select_company_id_by_name(self, db: Session, name: str):
         return (
-            db.query(CompanyTag.tag)
-            .filter(
-                CompanyTag.c_id == c_id,
-                CompanyTag.lang == lang,
+            db.query(CompanyName.c_id)
+            .filter(CompanyName.name == name)
+            .limit(1)
+            .scalar_subquery()
+        )
+
+    def get_company_version_by_name(self, db: Session, name: str):
+        """회사명 통해 (회사 ID, 버전) 반환 (프로필, 태그는 조회하지 않음)"""
+        return (
+            db.query(Company.id, Company.version)
+            .filter(Company.id == self._select_company_id_by_name(db=db, name=name))
+            .first()
+        )
+
+    def _bump_company_versions(self, db: Session, c_ids: list[int]):
+        # 회사 상세 / 태그 검색 ETag 가 바뀌도록 변경된 회사의 버전 증가 (commit 은 호출측)
+        db.execute(
+            update(Company)
+            .where(Company.id.in_(c_ids))
+            .values(version=Company.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+
+    def get_company_profiles_by_names_with_lang(
+        self,
+        db: Session,
+        names: list[str],
+        lang: str,
+    ):
+        """회사명들 통해 (검색 회사명, 회사 ID, 지원 언어 회사명, 태그 리스트) 리스트를 한 번의 쿼리로 반환"""
+        return (
+            db.query(
+                CompanyName.name.label("query"),
+                CompanyName.c_id,
+                CompanyProfile.name,
+                CompanyProfile.tags,
             )
-            .order_by(CompanyTag.tag_category_id)
+            .outerjoin(
+                CompanyProfile,
+                and_(
+                    CompanyProfile.c_id == CompanyName.c_id,
+                    CompanyProfile.lang == lang,
+                ),
+            )
+            .filter(CompanyName.name.in_(names))
+            .order_by(CompanyName.name, CompanyName.c_id)
             .all()
         )
 
@@ -138,30 +398,90 @@ class CompanyRepository:
 
             if new_company_names:
                 db.bulk_save_objects(new_company_names)
+            self._bump_company_versions(db, [c_id])
         except Exception as e:
             return False
 
         return True
 
+    def _get_tag_category_names(self, tags: list[dict[str, str]]) -> list[str]:
+        # 태그 카테고리는 ko 태그명 기준으로 입력 순서대로 생성 (태그 정렬 순서가 됨)
+        return list(
+            dict.fromkeys(
+                item.tag_name[Language.ko.value]
+                for item in tags
+                if Language.ko.value in item.tag_name
+            )
+        )
+
+    def _insert_tag_categories(self, db: Session, category_names: list[str]):
+        if category_names:
+            db.execute(
+                sqlite_insert(CompanyTagCategory).on_conflict_do_nothing(
+                    index_elements=[CompanyTagCategory.category_name]
+                ),
+                [{"category_name": name} for name in category_names],
+            )
+
+    def _get_tag_category_ids(self, db: Session, category_names: list[str]):
+        return dict(
+            db.execute(
+                select(CompanyTagCategory.category_name, CompanyTagCategory.id).where(
+                    CompanyTagCategory.category_name.in_(category_names)
+                )
+            ).all()
+        )
+
+    def _insert_company_tags(self, db: Session, new_tags: list[dict]):
+        if new_tags:
+            db.execute(
+                sqlite_insert(CompanyTag).on_conflict_do_nothing(
+                    index_elements=[CompanyTag.c_id, CompanyTag.lang, CompanyTag.tag]
+                ),
+                new_tags,
+            )
+
+    def _diff_company_tags(
+        self,
+        c_id: int,
+        tags: list[dict[str, str]],
+        category_ids: dict[str, int],
+        existing_tags: set[tuple[int, str, str]],
+    ):
+        # ko 기준으로 생성된 공통 tag_category 를 각 지원언어 같은 category 값으로 넣어줌
+        new_tags = []
+        for item in tags:
+            tag_category_id = category_ids.get(item.tag_name.get(Language.ko.value), -1)
+            for lang, tag_name in item.tag_name.items():
+                if (c_id, lang, tag_name) in existing_tags:
+                    continue
+                existing_tags.add((c_id, lang, tag_name))
+                new_tags.append(
+                    {
+                        "c_id": c_id,
+                        "lang": lang,
+                        "tag": tag_name,
+                        "tag_category_id": tag_category_id,
+                    }
+                )
+        return new_tags
+
+    def refresh_company_profiles(self, db: Session, c_ids: list[int]):
+        """회사 IDs 의 조회용 프로필 갱신 (commit 은 호출하는 쪽에서)"""
+        try:
+            refresh_company_profiles(db.connection(), c_ids)
+        except Exception as e:
+            db.rollback()
+            return False
+
+        return True
+
     def insert_new_tag_category(self, db: Session, tags: list[dict[str, str]]):
-        """입력받은 태그 리스트 통해 새로운 태그 카테고리 생성"""
+        """입력받은 태그 리스트 통해 새로운 태그 카테고리 생성 (commit 은 태그 추가와 함께)"""
         try:
-            for item in tags:
-                for lang, tag_name in item.tag_name.items():
-                    if lang == Language.ko.value:
-                        tag_category = (
-                            db.query(CompanyTagCategory)
-                            .filter(CompanyTagCategory.category_name == tag_name)
-                            .first()
-                        )
-                        if not tag_category:
-                            new_tag_category = CompanyTagCategory(
-                                category_name=tag_name
-                            )
-                            db.add(new_tag_category)
-                            db.commit()
-                            db.refresh(new_tag_category)
+            self._insert_tag_categories(db, self._get_tag_category_names(tags))
         except Exception as e:
+            db.rollback()
             return False
 
         return True
@@ -169,58 +489,23 @@ class CompanyRepository:
     def upsert_company_new_tags_by_id(
         self, db: Session, c_id: int, tags: list[dict[str, str]]
     ):
-        """회사 ID 통해 새로운 회사 태그 리스트 추가"""
-        tags_to_update = []
-        tags_to_create = []
-
-        for item in tags:
-            tags_to_category_update = []
-            for lang, tag_name in item.tag_name.items():
-                tag_category = (
-                    db.query(CompanyTagCategory)
-                    .filter(CompanyTagCategory.category_name == tag_name)
-                    .first()
-                )
-                if tag_category:
-                    tag_category_id = tag_category.id
-
-                tag = (
-                    db.query(CompanyTag)
-                    .join(CompanyTag.tag_category)
-                    .filter(
-                        CompanyTag.c_id == c_id,
-                        CompanyTag.lang == lang,
-                        CompanyTag.tag == tag_name,
-                    )
-                    .first()
-                )
-                # 단순 존재 확인뿐 아니라, 새 태그 이름이 더 최신 데이터일것이라는 전제하에 갱신
-                if tag:
-                    tag.tag = tag_name
-                    tags_to_update.append(tag)
-                else:
-                    new_tag = CompanyTag(
-                        c_id=c_id,
-                        lang=lang,
-                        tag=tag_name,
-                    )
-                    tags_to_category_update.append(new_tag)
-
-            # ko 기준으로 생성된 공통 tag_category 를 각 지원언어 같은 category 값으로 넣어줌
-            for tag_to_category_update in tags_to_category_update:
-                tag_to_category_update.tag_category_id = (
-                    tag_category_id if tag_category_id else -1
-                )
-                tags_to_create.append(tag_to_category_update)
-
+        """회사 ID 통해 새로운 회사 태그 리스트 추가 (commit 은 호출측)"""
         try:
-            if tags_to_update:
-                db.bulk_save_objects(tags_to_update)
-            if tags_to_create:
-                db.bulk_save_objects(tags_to_create)
-
-            db.commit()
-        except IntegrityError as e:
+            category_ids = self._get_tag_category_ids(
+                db, self._get_tag_category_names(tags)
+            )
+            existing_tags = set(
+                db.execute(
+                    select(CompanyTag.c_id, CompanyTag.lang, CompanyTag.tag).where(
+                        CompanyTag.c_id == c_id
+                    )
+                ).all()
+            )
+            new_tags = self._diff_company_tags(c_id, tags, category_ids, existing_tags)
+            self._insert_company_tags(db, new_tags)
+            if new_tags:
+                self._bump_company_versions(db, [c_id])
+        except Exception as e:
             db.rollback()
             return False
 
@@ -245,15 +530,122 @@ class CompanyRepository:
         c_id: int,
         tag_category_id: int,
     ):
-        """회사태그 통해 회사에 연결된 일부 태그 삭제"""
+        """회사태그 통해 회사에 연결된 일부 태그 삭제 (commit 은 호출측)"""
         try:
-            db.query(CompanyTag).filter(
-                CompanyTag.c_id == c_id,
-                CompanyTag.tag_category_id == tag_category_id,
-            ).delete(synchronize_session="fetch")
-            db.commit()
+            deleted = (
+                db.query(CompanyTag)
+                .filter(
+                    CompanyTag.c_id == c_id,
+                    CompanyTag.tag_category_id == tag_category_id,
+                )
+                .delete(synchronize_session="fetch")
+            )
+            if deleted:
+                self._bump_company_versions(db, [c_id])
         except Exception as e:
             db.rollback()
             return False
 
         return True
+
+    def bulk_upsert_companies(self, db: Session, companies: list[NewCompanyInSchema]):
+        """회사 리스트를 집합 단위 쿼리로 한 번에 추가하고 회사 IDs 반환 (commit 은 호출측)"""
+        try:
+            # 1. 회사: 기존 회사는 (insert_new_company 와 같이) 회사명 일치 여부로 재사용
+            all_names = {
+                name for company in companies for name in company.company_name.values()
+            }
+            company_ids_by_name = dict(
+                db.execute(
+                    select(Company.company_name, Company.id).where(
+                        Company.company_name.in_(all_names)
+                    )
+                ).all()
+            )
+
+            # 새 회사는 ko 회사명 단위로 한 번만 생성 (ko 회사명이 없으면 입력마다 생성)
+            new_company_names = []
+            for company in companies:
+                names = company.company_name.values()
+                if any(name in company_ids_by_name for name in names):
+                    continue
+                ko_name = company.company_name.get(Language.ko.value)
+                if ko_name is not None:
+                    company_ids_by_name[ko_name] = None
+                new_company_names.append(ko_name)
+
+            new_company_ids = []
+            if new_company_names:
+                new_company_ids = db.scalars(
+                    insert(Company).returning(Company.id, sort_by_parameter_order=True),
+                    [{"company_name": name} for name in new_company_names],
+                ).all()
+            unnamed_company_ids = iter(
+                c_id
+                for name, c_id in zip(new_company_names, new_company_ids)
+                if name is None
+            )
+            company_ids_by_name.update(
+                (name, c_id)
+                for name, c_id in zip(new_company_names, new_company_ids)
+                if name is not None
+            )
+
+            company_ids = []
+            for company in companies:
+                c_id = next(
+                    (
+                        company_ids_by_name[name]
+                        for name in company.company_name.values()
+                        if name in company_ids_by_name
+                    ),
+                    None,
+                )
+                company_ids.append(c_id or next(unnamed_company_ids))
+
+            # 2. 회사명: 기존 회사명 삭제 후 마지막 입력값으로 교체
+            company_names = {}
+            for c_id, company in zip(company_ids, companies):
+                company_names[c_id] = company.company_name
+            db.execute(delete(CompanyName).where(CompanyName.c_id.in_(company_names)))
+            db.execute(
+                insert(CompanyName),
+                [
+                    {"c_id": c_id, "lang": lang, "name": name}
+                    for c_id, names in company_names.items()
+                    for lang, name in names.items()
+                ],
+            )
+
+            # 3. 태그 카테고리: ko 태그명 기준으로 없는 카테고리만 생성
+            category_names = self._get_tag_category_names(
+                [item for company in companies for item in company.tags]
+            )
+            self._insert_tag_categories(db, category_names)
+            category_ids = self._get_tag_category_ids(db, category_names)
+
+            # 4. 태그: 회사별 기존 태그와 비교하여 없는 태그만 추가
+            existing_tags = set(
+                db.execute(
+                    select(CompanyTag.c_id, CompanyTag.lang, CompanyTag.tag).where(
+                        CompanyTag.c_id.in_(company_names)
+                    )
+                ).all()
+            )
+            new_tags = []
+            for c_id, company in zip(company_ids, companies):
+                new_tags.extend(
+                    self._diff_company_tags(
+                        c_id, company.tags, category_ids, existing_tags
+                    )
+                )
+            self._insert_company_tags(db, new_tags)
+            self._bump_company_versions(db, list(company_names))
+
+            db.flush()
+        except Exception:
+            logger.exception("Error importing %d companies", len(companies))
+            db.rollback()
+            return []
+
+        return company_ids
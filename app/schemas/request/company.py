@@ -1,4 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from app.infrastructures.config import COMPANY_BATCH_GET_MAX_SIZE
 
 
 class NewCompanyTagNameInSchema(BaseModel):
@@ -8,3 +10,7 @@ class NewCompanyTagNameInSchema(BaseModel):
 class NewCompanyInSchema(BaseModel):
     company_name: dict[str, str]
     tags: list[NewCompanyTagNameInSchema]
+
+
+class CompanyBatchGetInSchema(BaseModel):
+    names: list[str] = Field(min_length=1, max_length=COMPANY_BATCH_GET_MAX_SIZE)
@@ -20,3 +20,10 @@ class CompanySearchNameOutSchema(BaseModel):
 
 class CompanySearchTagOutSchema(CompanyOutSchema):
     pass
+
+
+class CompanyBatchGetItemOutSchema(BaseModel):
+    name: str
+    company: CompanySearchNameOutSchema | None = None
+    # 회사를 찾지 못한 경우 사유
+    detail: str | None = None
@@ -1,84 +1,466 @@
+import asyncio
+import json
 import operator
-from itertools import groupby
+import time
+from bisect import bisect_right
+from functools import partial
+from typing import AsyncIterable, Iterable
 
 from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.utils.enum import Language
+from app.utils.enum import AutocompleteMode, Language, SearchBackend, TagOperator
 
+from app.infrastructures.cache import create_cache
+from app.infrastructures.config import (
+    CACHE_URL,
+    COMPANY_AUTOCOMPLETE_PREFIX_LIMIT,
+    COMPANY_CACHE_MAXSIZE,
+    COMPANY_CACHE_TTL_SECONDS,
+    COMPANY_IMPORT_BATCH_SIZE,
+    COMPANY_INDEX_REFRESH_SECONDS,
+    COMPANY_NAME_FILTER,
+    COMPANY_NAME_FILTER_FP_RATE,
+    COMPANY_SEARCH_BACKEND,
+    COMPANY_STREAM_CHUNK_SIZE,
+    COMPANY_TAG_WRITE_BATCH_SIZE,
+    COMPANY_TAG_WRITE_BATCH_WAIT_MS,
+    COMPANY_TAG_WRITE_QUEUE,
+)
+from app.infrastructures.database import AsyncReadSessionLocal, AsyncSessionLocal
+from app.infrastructures.write_queue import GroupCommitQueue
+from app.indexes.bloom import CompanyNameBloomFilter
+from app.indexes.ngram import CompanyNameNgramIndex
+from app.indexes.prefix import CompanyNamePrefixIndex
+from app.indexes.tag_posting import CompanyTagPostingIndex
 from app.repositories.company import CompanyRepository
+from app.schemas.request.company import NewCompanyInSchema
+from app.utils.company_import import batched
+from app.utils.etag import etag_matches, make_etag
 
 
 class CompanyService:
     _company_repo = CompanyRepository()
 
-    def autocomplete_company_by_word(self, db: Session, word: str, lang: Language):
-        company_ids = [
-            id_tuple[0]
-            for id_tuple in self._company_repo.get_company_ids_by_word(
-                db=db,
-                search=word,
+    def __init__(
+        self,
+        search_backend: str = COMPANY_SEARCH_BACKEND,
+        cache_url: str = CACHE_URL,
+        name_filter: bool = COMPANY_NAME_FILTER,
+    ):
+        self.search_backend = SearchBackend(search_backend)
+        self._fts_ready = False
+        self._name_index = CompanyNameNgramIndex(
+            refresh_interval=COMPANY_INDEX_REFRESH_SECONDS
+        )
+        self._prefix_index = CompanyNamePrefixIndex(
+            refresh_interval=COMPANY_INDEX_REFRESH_SECONDS
+        )
+        # 다중 태그 검색용 태그 카테고리 posting 색인 (첫 다중 태그 검색시 생성)
+        self._tag_index = CompanyTagPostingIndex(
+            refresh_interval=COMPANY_INDEX_REFRESH_SECONDS
+        )
+        self._name_filter = (
+            CompanyNameBloomFilter(
+                false_positive_rate=COMPANY_NAME_FILTER_FP_RATE,
+                refresh_interval=COMPANY_INDEX_REFRESH_SECONDS,
             )
-        ]
-        company_names = self._company_repo.get_company_names_by_ids_with_lang(
-            db=db, c_ids=company_ids, lang=lang
+            if name_filter
+            else None
+        )
+        # (회사명, 언어) -> 회사 상세, 회사 ID 태그로 무효화
+        self._profile_cache = create_cache(
+            cache_url, maxsize=COMPANY_CACHE_MAXSIZE, ttl=COMPANY_CACHE_TTL_SECONDS
         )
-        return [{"company_name": c.name} for c in company_names]
 
-    def search_company_by_name(self, db: Session, name: str, lang: Language):
-        company_id = self._company_repo.get_company_id_by_name(
+    def cache_stats(self) -> dict[str, int]:
+        return self._profile_cache.stats()
+
+    def name_filter_stats(self) -> dict[str, float]:
+        """회사명 Bloom filter 크기, 메모리, 오탐률 (사용하지 않으면 빈 dict)"""
+        return self._name_filter.stats() if self._name_filter is not None else {}
+
+    def _ensure_search_fts(self, db: Session):
+        if self._fts_ready:
+            return
+
+        # 읽기 전용 세션에서는 생성할 수 없으므로 마이그레이션에서 미리 생성
+        if not self._company_repo.has_company_search_fts(
+            db=db
+        ) and not self._company_repo.create_company_search_fts(db=db):
+            raise HTTPException(status_code=500, detail="Error creating search index")
+        self._fts_ready = True
+
+    def _refresh_index(
+        self,
+        db: Session,
+        index,
+        get_fingerprint=None,
+        get_rows=None,
+    ):
+        # 다른 워커의 변경분 반영을 위해 refresh_interval 마다 테이블 변경 여부 확인
+        # (기본: 회사명 테이블, 회사명 색인)
+        if index.should_refresh():
+            get_fingerprint = (
+                get_fingerprint or self._company_repo.get_company_name_fingerprint
+            )
+            get_rows = get_rows or self._company_repo.get_all_company_names
+            fingerprint = get_fingerprint(db=db)
+            if fingerprint != index.fingerprint:
+                index.build(get_rows(db=db), fingerprint=fingerprint)
+            else:
+                index.mark_checked()
+
+        return index
+
+    def warm_up(self, db: Session):
+        """기본 검색(부분 일치)에 쓰는 인메모리 색인 미리 생성 (첫 검색 요청 지연 방지)"""
+        # 접두어 색인은 mode=prefix 요청에서만 쓰이므로 첫 사용시 생성
+        if self.search_backend == SearchBackend.index:
+            self._get_name_index(db=db)
+        if self._name_filter is not None:
+            self._refresh_index(db=db, index=self._name_filter)
+
+    def _get_name_index(self, db: Session):
+        return self._refresh_index(db=db, index=self._name_index)
+
+    def _get_prefix_index(self, db: Session):
+        return self._refresh_index(db=db, index=self._prefix_index)
+
+    def _get_tag_index(self, db: Session):
+        return self._refresh_index(
             db=db,
-            name=name,
+            index=self._tag_index,
+            get_fingerprint=self._company_repo.get_company_tag_fingerprint,
+            get_rows=self._company_repo.get_all_company_tag_categories,
         )
-        if not company_id:
-            raise HTTPException(status_code=404, detail="Company not found")
 
-        company_name = self._company_repo.get_company_name_by_id_with_lang(
-            db=db, c_id=company_id[0], lang=lang
-        )[0]
-        company_tags = self._company_repo.get_company_tags_by_id_with_lang(
-            db=db, c_id=company_id[0], lang=lang
+    def _update_tag_index(self, db: Session, c_ids: list[int]):
+        # 생성된 색인에만 변경된 회사의 현재 태그 반영 (다른 워커 변경분은 fingerprint 로 반영)
+        if self._tag_index.fingerprint is None:
+            return
+        for c_id in c_ids:
+            self._tag_index.replace_company(
+                c_id,
+                self._company_repo.get_company_tag_categories_by_id(db=db, c_id=c_id),
+            )
+
+    def _may_have_company_name(self, db: Session, name: str) -> bool:
+        # False 면 확실히 없는 회사명이므로 회사명 조회 없이 404
+        if self._name_filter is None:
+            return True
+        name_filter = self._refresh_index(db=db, index=self._name_filter)
+        if name_filter.might_contain(name):
+            return True
+        # 필터 생성 이후 회사명 테이블이 바뀌었으면 (다른 워커, import CLI) 새 회사명일 수 있으므로
+        # 회사명 인덱스로 확인 (버전 한 행 조회, 필터 재생성은 refresh 주기에)
+        return (
+            self._company_repo.get_company_name_fingerprint(db=db)
+            != name_filter.fingerprint
         )
-        return {
-            "company_name": company_name,
-            "tags": [tag_tuple[0] for tag_tuple in company_tags],
-        }
 
-    def search_company_by_tag(self, db: Session, tag: str, lang: Language):
-        results = []
+    def _search_company_ids_by_word(
+        self, db: Session, word: str, after: int, limit: int | None
+    ) -> list[int]:
+        if self.search_backend == SearchBackend.index:
+            company_ids = self._get_name_index(db=db).search(word)
+            start = bisect_right(company_ids, after)
+            return company_ids[start : start + limit if limit else None]
 
-        company_ids = [
-            id_tuple[0]
-            for id_tuple in self._company_repo.get_company_ids_by_tag(
-                db=db,
-                tag=tag,
+        if self.search_backend == SearchBackend.fts:
+            self._ensure_search_fts(db=db)
+            company_id_tuples = self._company_repo.get_company_ids_by_word_fts(
+                db=db, search=word, after=after, limit=limit
             )
-        ]
-        company_names = self._company_repo.get_company_names_by_ids(
-            db=db, c_ids=company_ids
+        else:
+            company_id_tuples = self._company_repo.get_company_ids_by_word(
+                db=db, search=word, after=after, limit=limit
+            )
+        return [id_tuple[0] for id_tuple in company_id_tuples]
+
+    def autocomplete_company_page(
+        self,
+        db: Session,
+        word: str,
+        lang: Language,
+        after: int = 0,
+        limit: int | None = None,
+        mode: AutocompleteMode = AutocompleteMode.substring,
+    ):
+        """(회사명 리스트, 다음 페이지 커서) 반환, 마지막 페이지면 커서는 None"""
+        if mode == AutocompleteMode.prefix:
+            # 순위 상위 limit 개만 반환하므로 다음 페이지 없음
+            company_names = self._get_prefix_index(db=db).search(
+                word, lang=lang, limit=limit or COMPANY_AUTOCOMPLETE_PREFIX_LIMIT
+            )
+            return [{"company_name": name} for name in company_names], None
+
+        company_ids = self._search_company_ids_by_word(
+            db=db, word=word, after=after, limit=limit + 1 if limit else None
+        )
+        company_ids, next_after = paginate(company_ids, limit)
+        return (
+            self.autocomplete_company_by_ids(db=db, c_ids=company_ids, lang=lang),
+            next_after,
         )
 
-        company_names_list = [
-            {"id": c.c_id, "lang": c.lang, "name": c.name} for c in company_names
+    def search_company_ids_by_word(self, db: Session, word: str) -> list[int]:
+        """word 가 포함된 회사 IDs 전체를 오름차순으로 반환"""
+        return self._search_company_ids_by_word(db=db, word=word, after=0, limit=None)
+
+    def autocomplete_company_by_ids(
+        self, db: Session, c_ids: list[int], lang: Language
+    ):
+        """회사 IDs 순서대로 자동완성 결과 (지원 언어 회사명) 리스트 반환"""
+        if self.search_backend == SearchBackend.index:
+            company_names = self._name_index.get_names_by_ids_with_lang(
+                c_ids=c_ids, lang=lang
+            )
+        else:
+            company_names = [
+                c.name
+                for c in self._company_repo.get_company_names_by_ids_with_lang(
+                    db=db, c_ids=c_ids, lang=lang
+                )
+            ]
+        return [{"company_name": name} for name in company_names]
+
+    def autocomplete_company_by_word(
+        self,
+        db: Session,
+        word: str,
+        lang: Language,
+        after: int = 0,
+        limit: int | None = None,
+    ):
+        return self.autocomplete_company_page(
+            db=db, word=word, lang=lang, after=after, limit=limit
+        )[0]
+
+    def _to_company_profile(self, profile):
+        if profile is None:
+            raise HTTPException(status_code=404, detail="Company not found")
+
+        if profile.name is None:
+            raise HTTPException(status_code=404, detail="Company name not found")
+
+        return {"company_name": profile.name, "tags": profile.tags}
+
+    def _refresh_company_profiles(self, db: Session, c_ids: list[int]):
+        # 원본 테이블 변경 후 조회용 프로필까지 갱신하고 commit
+        if not self._company_repo.refresh_company_profiles(db=db, c_ids=c_ids):
+            raise HTTPException(
+                status_code=500, detail="Error refreshing company profiles"
+            )
+        db.commit()
+
+    def search_company_by_name_with_etag(
+        self,
+        db: Session,
+        name: str,
+        lang: Language,
+        if_none_match: str | None = None,
+    ):
+        """(회사 상세, ETag) 반환, If-None-Match 가 ETag 와 일치하면 회사 상세는 None"""
+        cache_key = (name, lang)
+        cached = self._profile_cache.get(cache_key)
+        if cached is not None:
+            company, etag = cached["company"], cached["etag"]
+        else:
+            # 조회 중 무효화되면 (다른 요청의 변경) 조회한 값은 캐시하지 않도록
+            # 읽기 트랜잭션이 시작되기 전에 읽어 둠
+            generation = self._profile_cache.generation()
+            if not self._may_have_company_name(db=db, name=name):
+                raise HTTPException(status_code=404, detail="Company not found")
+
+            # 버전을 먼저 읽어야 동시에 변경되어도 회사 상세가 ETag 보다 오래된 값이 되지 않음
+            company_version = self._company_repo.get_company_version_by_name(
+                db=db, name=name
+            )
+            if company_version is None:
+                if self._name_filter is not None:
+                    self._name_filter.record_false_positive()
+                raise HTTPException(status_code=404, detail="Company not found")
+
+            c_id, version = company_version
+            etag = make_etag("company", c_id, version, lang)
+            # 변경되지 않은 회사는 프로필, 태그를 조회하지 않음
+            if etag_matches(if_none_match, etag):
+                return None, etag
+
+            profile = self._company_repo.get_company_profile_by_id_with_lang(
+                db=db, c_id=c_id, lang=lang
+            )
+            company = self._to_company_profile(profile)
+            self._profile_cache.set(
+                cache_key,
+                {"company": company, "etag": etag},
+                tags=(c_id,),
+                if_generation=generation,
+            )
+
+        if etag_matches(if_none_match, etag):
+            return None, etag
+        return company, etag
+
+    def search_company_by_name(self, db: Session, name: str, lang: Language):
+        return self.search_company_by_name_with_etag(db=db, name=name, lang=lang)[0]
+
+    def search_companies_by_names(self, db: Session, names: list[str], lang: Language):
+        """회사명 순서대로 회사 상세 또는 찾지 못한 사유 리스트 반환"""
+        profiles = {}
+        candidates = [
+            name
+            for name in dict.fromkeys(names)
+            if self._may_have_company_name(db=db, name=name)
         ]
-        company_names_sorted = sorted(company_names_list, key=lambda x: x["id"])
-        company_names_dict = {
-            key: list(value)
-            for key, value in groupby(company_names_sorted, operator.itemgetter("id"))
-        }
-
-        for _, items in company_names_dict.items():
-            ko_name = list(set(item["name"] for item in items if item["lang"] == "ko"))
-            etc_name = list(set(item["name"] for item in items if item["lang"] != "ko"))
-
-            if ko_name:
-                results.append({"company_name": ko_name[0]})
-            elif etc_name:
-                results.append({"company_name": etc_name[0]})
-
-        print(results)
+        # 같은 회사명이 여러 회사에 있으면 단건 조회와 같이 회사 ID 가 가장 작은 회사
+        for profile in (
+            self._company_repo.get_company_profiles_by_names_with_lang(
+                db=db, names=candidates, lang=lang
+            )
+            if candidates
+            else ()
+        ):
+            profiles.setdefault(profile.query, profile)
+
+        results = []
+        for name in names:
+            try:
+                company = self._to_company_profile(profiles.get(name))
+            except HTTPException as e:
+                results.append({"name": name, "company": None, "detail": e.detail})
+            else:
+                results.append({"name": name, "company": company, "detail": None})
         return results
 
+    def search_company_by_tag_page(
+        self,
+        db: Session,
+        tag: str,
+        lang: Language,
+        after: int = 0,
+        limit: int | None = None,
+    ):
+        """(회사명 리스트, 다음 페이지 커서) 반환, 마지막 페이지면 커서는 None"""
+        company_names, next_after = self._search_company_names_by_tag_page(
+            db=db, tag=tag, lang=lang, after=after, limit=limit
+        )
+        return _to_tag_search_results(company_names), next_after
+
+    def search_company_by_tag_page_with_etag(
+        self,
+        db: Session,
+        tag: str,
+        lang: Language,
+        after: int = 0,
+        limit: int | None = None,
+    ):
+        """(회사명 리스트, 다음 페이지 커서, ETag) 반환"""
+        company_names, next_after = self._search_company_names_by_tag_page(
+            db=db, tag=tag, lang=lang, after=after, limit=limit
+        )
+        etag = _tag_search_etag(lang, next_after, company_names)
+        return _to_tag_search_results(company_names), next_after, etag
+
+    def search_company_by_tags_page(
+        self,
+        db: Session,
+        tags: list[str],
+        op: TagOperator,
+        lang: Language,
+        after: int = 0,
+        limit: int | None = None,
+    ):
+        """태그 리스트를 op(and, or, not) 로 조합한 (회사명 리스트, 다음 페이지 커서) 반환"""
+        return self.search_company_by_tags_page_with_etag(
+            db=db, tags=tags, op=op, lang=lang, after=after, limit=limit
+        )[:2]
+
+    def search_company_by_tags_page_with_etag(
+        self,
+        db: Session,
+        tags: list[str],
+        op: TagOperator,
+        lang: Language,
+        after: int = 0,
+        limit: int | None = None,
+    ):
+        """(회사명 리스트, 다음 페이지 커서, ETag) 반환"""
+        company_ids = self.search_company_ids_by_tags(db=db, tags=tags, op=op)
+        start = bisect_right(company_ids, after)
+        company_ids, next_after = paginate(
+            company_ids[start : start + limit + 1 if limit else None], limit
+        )
+        company_names = self._get_company_names_by_ids_with_fallback(
+            db=db, c_ids=company_ids, lang=lang
+        )
+        etag = _tag_search_etag(lang, next_after, company_names)
+        return _to_tag_search_results(company_names), next_after, etag
+
+    def search_company_ids_by_tags(
+        self, db: Session, tags: list[str], op: TagOperator
+    ) -> list[int]:
+        """태그 리스트를 op 로 조합한 회사 IDs 전체를 오름차순으로 반환"""
+        # 태그별 self-join 대신 인메모리 posting 의 집합 연산으로 회사 IDs 계산
+        return self._get_tag_index(db=db).search(tags, op)
+
+    def _get_company_names_by_ids_with_fallback(
+        self, db: Session, c_ids: list[int], lang: Language
+    ):
+        return list(
+            self._company_repo.get_company_names_by_ids_with_fallback(
+                db=db, c_ids=c_ids, lang=lang
+            )
+            if c_ids
+            else ()
+        )
+
+    def search_company_by_ids(self, db: Session, c_ids: list[int], lang: Language):
+        """회사 IDs 순서대로 태그 검색 결과 (회사명, 태그) 리스트 반환"""
+        return _to_tag_search_results(
+            self._get_company_names_by_ids_with_fallback(db=db, c_ids=c_ids, lang=lang)
+        )
+
+    def _search_company_names_by_tag_page(
+        self,
+        db: Session,
+        tag: str,
+        lang: Language,
+        after: int,
+        limit: int | None,
+    ):
+        if self.search_backend == SearchBackend.fts:
+            self._ensure_search_fts(db=db)
+
+        return paginate(
+            list(
+                self._company_repo.get_company_names_by_tag_with_lang(
+                    db=db,
+                    tag=tag,
+                    lang=lang,
+                    after=after,
+                    limit=limit + 1 if limit else None,
+                    fts=self.search_backend == SearchBackend.fts,
+                )
+            ),
+            limit,
+            cursor=operator.attrgetter("c_id"),
+        )
+
+    def search_company_by_tag(
+        self,
+        db: Session,
+        tag: str,
+        lang: Language,
+        after: int = 0,
+        limit: int | None = None,
+    ):
+        return self.search_company_by_tag_page(
+            db=db, tag=tag, lang=lang, after=after, limit=limit
+        )[0]
+
     def add_new_company(
         self,
         db: Session,
@@ -113,20 +495,30 @@ class CompanyService:
         if not new_tag_add_ok:
             raise HTTPException(status_code=400, detail="Error adding new tags")
 
-        company_name = self._company_repo.get_company_name_by_id_with_lang(
-            db=db, c_id=company_id, lang=lang
-        )[0]
-        company_tags = self._company_repo.get_company_tags_by_id_with_lang(
-            db=db, c_id=company_id, lang=lang
+        self._refresh_company_profiles(db=db, c_ids=[company_id])
+        self._name_index.replace_company(
+            c_id=company_id, company_name=company.company_name
         )
-        return {
-            "company_name": company_name,
-            "tags": [tag_tuple[0] for tag_tuple in company_tags],
-        }
+        self._prefix_index.replace_company(
+            c_id=company_id, company_name=company.company_name
+        )
+        if self._name_filter is not None:
+            self._name_filter.replace_company(
+                c_id=company_id, company_name=company.company_name
+            )
+        self._update_tag_index(db=db, c_ids=[company_id])
+        self._profile_cache.invalidate(company_id)
 
-    def add_company_new_tag(
-        self, db: Session, tags: list[dict[str, str]], name: str, lang: Language
-    ):
+        return self._to_company_profile(
+            self._company_repo.get_company_profile_by_id_with_lang(
+                db=db, c_id=company_id, lang=lang
+            )
+        )
+
+    def _add_company_new_tag(
+        self, db: Session, tags: list[dict[str, str]], name: str
+    ) -> int:
+        """회사 태그 추가 후 회사 ID 반환 (commit 은 호출측)"""
         company_id = self._company_repo.get_company_id_by_name(db=db, name=name)
         if not company_id:
             raise HTTPException(status_code=404, detail="Company not found")
@@ -144,19 +536,10 @@ class CompanyService:
         )
         if not new_tag_add_ok:
             raise HTTPException(status_code=400, detail="Error adding new tags")
+        return company_id[0]
 
-        company_name = self._company_repo.get_company_name_by_id_with_lang(
-            db=db, c_id=company_id[0], lang=lang
-        )[0]
-        company_tags = self._company_repo.get_company_tags_by_id_with_lang(
-            db=db, c_id=company_id[0], lang=lang
-        )
-        return {
-            "company_name": company_name,
-            "tags": [tag_tuple[0] for tag_tuple in company_tags],
-        }
-
-    def delete_company_tag(self, db: Session, tag: str, name: str, lang: Language):
+    def _delete_company_tag(self, db: Session, tag: str, name: str) -> int:
+        """회사 태그 삭제 후 회사 ID 반환 (commit 은 호출측)"""
         company_id = self._company_repo.get_company_id_by_name(
             db=db,
             name=name,
@@ -177,13 +560,559 @@ class CompanyService:
             c_id=company_id,
             tag_category_id=tag_category_id,
         )
-        company_name = self._company_repo.get_company_name_by_id_with_lang(
-            db=db, c_id=company_id, lang=lang
-        )[0]
-        company_tags = self._company_repo.get_company_tags_by_id_with_lang(
-            db=db, c_id=company_id, lang=lang
+        if not delete_tag_ok:
+            raise HTTPException(status_code=400, detail="Error deleting tag")
+        return company_id
+
+    def _write_company_tags(self, db: Session, write, lang: Language):
+        # 태그 변경, 조회용 프로필 갱신을 한 번의 commit 으로 적용하고 변경된 회사 프로필 반환
+        company_id = write(db)
+        self._refresh_company_profiles(db=db, c_ids=[company_id])
+        self._profile_cache.invalidate(company_id)
+        self._update_tag_index(db=db, c_ids=[company_id])
+        return self._to_company_profile(
+            self._company_repo.get_company_profile_by_id_with_lang(
+                db=db, c_id=company_id, lang=lang
+            )
+        )
+
+    def company_new_tag_write(self, tags: list[dict[str, str]], name: str):
+        """apply_company_tag_writes 로 적용할 태그 추가"""
+        return partial(self._add_company_new_tag, tags=tags, name=name)
+
+    def company_tag_delete_write(self, tag: str, name: str):
+        """apply_company_tag_writes 로 적용할 태그 삭제"""
+        return partial(self._delete_company_tag, tag=tag, name=name)
+
+    def add_company_new_tag(
+        self, db: Session, tags: list[dict[str, str]], name: str, lang: Language
+    ):
+        return self._write_company_tags(
+            db=db, write=self.company_new_tag_write(tags=tags, name=name), lang=lang
+        )
+
+    def delete_company_tag(self, db: Session, tag: str, name: str, lang: Language):
+        return self._write_company_tags(
+            db=db, write=self.company_tag_delete_write(tag=tag, name=name), lang=lang
         )
-        return {
-            "company_name": company_name,
-            "tags": [tag_tuple[0] for tag_tuple in company_tags],
-        }
+
+    def apply_company_tag_writes(self, db: Session, writes: list[tuple]) -> list:
+        """(태그 변경, 언어) 리스트를 한 트랜잭션으로 적용 (group commit)
+
+        변경별 회사 프로필 또는 HTTPException 을 순서대로 반환
+        """
+        company_ids = []
+        for write, _ in writes:
+            try:
+                company_ids.append(write(db))
+            except HTTPException as e:
+                if not db.in_transaction():
+                    # 저장소에서 트랜잭션을 롤백해 앞선 변경도 취소됨
+                    return self._apply_company_tag_writes_one_by_one(db, writes)
+                # 검증 실패 (회사, 태그 없음) 는 쓰기 전에 발생하므로 다른 변경에 영향 없음
+                company_ids.append(e)
+
+        changed_ids = sorted(
+            {c_id for c_id in company_ids if not isinstance(c_id, HTTPException)}
+        )
+        try:
+            if changed_ids:
+                self._refresh_company_profiles(db=db, c_ids=changed_ids)
+        except Exception:
+            # 프로필 갱신, commit 실패시 변경별 트랜잭션으로 다시 적용해 실패한 변경만 오류 응답
+            return self._apply_company_tag_writes_one_by_one(db, writes)
+        for company_id in changed_ids:
+            self._profile_cache.invalidate(company_id)
+        self._update_tag_index(db=db, c_ids=changed_ids)
+
+        results = []
+        for (_, lang), company_id in zip(writes, company_ids):
+            if isinstance(company_id, HTTPException):
+                results.append(company_id)
+                continue
+            try:
+                results.append(
+                    self._to_company_profile(
+                        self._company_repo.get_company_profile_by_id_with_lang(
+                            db=db, c_id=company_id, lang=lang
+                        )
+                    )
+                )
+            except HTTPException as e:
+                results.append(e)
+        return results
+
+    def _apply_company_tag_writes_one_by_one(self, db: Session, writes: list[tuple]):
+        db.rollback()
+        results = []
+        for write, lang in writes:
+            try:
+                results.append(self._write_company_tags(db=db, write=write, lang=lang))
+            except Exception as e:
+                db.rollback()
+                results.append(e)
+        return results
+
+    def _upsert_companies(self, db: Session, companies: list[NewCompanyInSchema]):
+        company_ids = self._company_repo.bulk_upsert_companies(
+            db=db, companies=companies
+        )
+        if not company_ids:
+            return []
+        self._refresh_company_profiles(db=db, c_ids=company_ids)
+
+        self._name_index.mark_stale()
+        self._prefix_index.mark_stale()
+        self._tag_index.mark_stale()
+        if self._name_filter is not None:
+            self._name_filter.mark_stale()
+        for company_id in set(company_ids):
+            self._profile_cache.invalidate(company_id)
+        return company_ids
+
+    def import_company_batch(
+        self, db: Session, companies: list[NewCompanyInSchema], offset: int = 0
+    ):
+        """회사 리스트를 한 트랜잭션으로 추가하고 추가된 회사 수 반환
+
+        offset 은 앞 batch 까지 추가된 회사 수 (실패시 입력 내 회사 순번 계산용)
+        """
+        if self._upsert_companies(db=db, companies=companies):
+            return len(companies)
+
+        # 실패한 회사를 찾도록 한 건씩 다시 적용 (실패한 회사 앞까지는 commit 됨)
+        for i, company in enumerate(companies):
+            if not self._upsert_companies(db=db, companies=[company]):
+                raise HTTPException(
+                    status_code=400,
+                    detail={
+                        "message": "Error importing companies",
+                        "imported": offset + i,
+                        "failed_record": offset + i + 1,
+                    },
+                )
+        return len(companies)
+
+    def import_companies(
+        self,
+        db: Session,
+        companies: Iterable[NewCompanyInSchema],
+        batch_size: int = COMPANY_IMPORT_BATCH_SIZE,
+    ):
+        started_at = time.perf_counter()
+        imported = 0
+        batches = 0
+        for batch in batched(companies, batch_size):
+            imported += self.import_company_batch(
+                db=db, companies=batch, offset=imported
+            )
+            batches += 1
+
+        return import_result(imported, batches, time.perf_counter() - started_at)
+
+
+def _tag_search_etag(lang: Language, next_after: int | None, company_names) -> str:
+    # 결과 회사 구성, 회사별 버전(회사명, 태그 변경)이 같으면 같은 응답
+    return make_etag(
+        "tags",
+        lang,
+        next_after,
+        [(company.c_id, company.version) for company in company_names],
+    )
+
+
+def _to_tag_search_results(company_names) -> list[dict]:
+    # 회사명이 하나도 없는 회사는 제외
+    return [{"company_name": c.name} for c in company_names if c.name is not None]
+
+
+def paginate(items: list, limit: int | None, cursor=lambda c_id: c_id):
+    """limit + 1 개까지 조회한 결과를 (현재 페이지, 다음 페이지 커서) 로 분리"""
+    if not limit or len(items) <= limit:
+        return items, None
+
+    return items[:limit], cursor(items[limit - 1])
+
+
+def import_result(imported: int, batches: int, elapsed: float):
+    return {
+        "companies": imported,
+        "batches": batches,
+        "elapsed_seconds": round(elapsed, 3),
+        "companies_per_second": round(imported / elapsed, 1) if elapsed else 0.0,
+    }
+
+
+class AsyncCompanyService:
+    """AsyncSession 위에서 CompanyService 실행"""
+
+    # CompanyRepository 의 ORM 코드를 AsyncSession.run_sync 로 실행하므로
+    # 각 DB 호출은 async 드라이버(aiosqlite)를 await 하며 이벤트 루프를 막지 않음
+
+    def __init__(
+        self,
+        company_service: CompanyService | None = None,
+        tag_write_queue: bool = COMPANY_TAG_WRITE_QUEUE,
+    ):
+        self._company_service = company_service or CompanyService()
+        # 태그 추가/삭제를 모아 group commit (SQLite 쓰기 잠금, fsync 횟수 감소)
+        self._tag_write_queue = (
+            GroupCommitQueue(
+                "company_tags",
+                self._apply_company_tag_writes,
+                max_batch=COMPANY_TAG_WRITE_BATCH_SIZE,
+                max_wait=COMPANY_TAG_WRITE_BATCH_WAIT_MS / 1000,
+            )
+            if tag_write_queue
+            else None
+        )
+        # 회사명 테이블 색인 재생성은 한 번에 하나만 (기다리는 요청도 이벤트 루프는 막지 않음)
+        # 잠금은 이벤트 루프에 묶이므로 첫 사용 시점에 생성
+        self._index_lock: asyncio.Lock | None = None
+
+    def cache_stats(self) -> dict[str, int]:
+        return self._company_service.cache_stats()
+
+    async def _refresh_index(self, index):
+        # 회사명 테이블로 만드는 색인이 바뀌었으면 run_sync 안(이벤트 루프)이 아닌 스레드에서 재생성
+        # 이후 run_sync 안의 조회는 방금 확인한 색인을 그대로 사용
+        # (요청 세션의 읽기 트랜잭션을 미리 시작하지 않도록 별도 세션에서 조회)
+        if index is None or not index.should_refresh():
+            return
+
+        repo = self._company_service._company_repo
+        if self._index_lock is None:
+            self._index_lock = asyncio.Lock()
+        async with self._index_lock, AsyncReadSessionLocal() as db:
+            if not index.should_refresh():
+                return
+            fingerprint = await db.run_sync(
+                lambda session: repo.get_company_name_fingerprint(db=session)
+            )
+            if fingerprint == index.fingerprint:
+                index.mark_checked()
+                return
+            rows = await db.run_sync(
+                lambda session: repo.get_all_company_names(db=session)
+            )
+            await asyncio.to_thread(index.build, rows, fingerprint=fingerprint)
+
+    async def _refresh_name_index(self):
+        if self._company_service.search_backend == SearchBackend.index:
+            await self._refresh_index(index=self._company_service._name_index)
+
+    async def _refresh_name_filter(self):
+        await self._refresh_index(index=self._company_service._name_filter)
+
+    def name_filter_stats(self) -> dict[str, float]:
+        return self._company_service.name_filter_stats()
+
+    async def autocomplete_company_by_word(
+        self, db: AsyncSession, word: str, lang: Language
+    ):
+        await self._refresh_name_index()
+        return await db.run_sync(
+            lambda session: self._company_service.autocomplete_company_by_word(
+                db=session, word=word, lang=lang
+            )
+        )
+
+    async def autocomplete_company_page(
+        self,
+        db: AsyncSession,
+        word: str,
+        lang: Language,
+        after: int = 0,
+        limit: int | None = None,
+        mode: AutocompleteMode = AutocompleteMode.substring,
+    ):
+        if mode == AutocompleteMode.substring:
+            await self._refresh_name_index()
+        return await db.run_sync(
+            lambda session: self._company_service.autocomplete_company_page(
+                db=session, word=word, lang=lang, after=after, limit=limit, mode=mode
+            )
+        )
+
+    async def warm_up(self):
+        await self._refresh_name_index()
+        await self._refresh_name_filter()
+
+    async def _stream_pages(self, fetch_page, after: int, chunk_size: int):
+        # keyset 페이지 단위로 나눠 조회하므로 결과 크기와 무관하게 메모리 사용량이 일정함
+        async with AsyncReadSessionLocal() as db:
+            while after is not None:
+                companies, after = await db.run_sync(
+                    fetch_page, after=after, limit=chunk_size
+                )
+                # 페이지마다 읽기 트랜잭션을 끝내 스트리밍 동안 스냅샷을 잡고 있지 않음
+                await db.commit()
+                for company in companies:
+                    yield json.dumps(company, ensure_ascii=False) + "\n"
+
+    async def _stream_id_pages(
+        self, search_ids, fetch_companies, after: int, chunk_size: int
+    ):
+        # 인메모리 색인 검색은 전체 결과 IDs 를 한 번에 구하므로 스트림당 한 번만 검색하고
+        # IDs 를 chunk_size 개씩 나눠 회사 정보 조회 (페이지마다 다시 검색하지 않음)
+        async with AsyncReadSessionLocal() as db:
+            company_ids = await db.run_sync(search_ids)
+            await db.commit()
+            for start in range(
+                bisect_right(company_ids, after), len(company_ids), chunk_size
+            ):
+                companies = await db.run_sync(
+                    fetch_companies, c_ids=company_ids[start : start + chunk_size]
+                )
+                await db.commit()
+                for company in companies:
+                    yield json.dumps(company, ensure_ascii=False) + "\n"
+
+    async def _stream_autocomplete_by_name_index(
+        self, word: str, lang: Language, after: int, chunk_size: int
+    ):
+        await self._refresh_name_index()
+        async for line in self._stream_id_pages(
+            partial(self._company_service.search_company_ids_by_word, word=word),
+            partial(self._company_service.autocomplete_company_by_ids, lang=lang),
+            after=after,
+            chunk_size=chunk_size,
+        ):
+            yield line
+
+    def stream_autocomplete_company_by_word(
+        self,
+        word: str,
+        lang: Language,
+        after: int = 0,
+        chunk_size: int = COMPANY_STREAM_CHUNK_SIZE,
+    ):
+        """회사명 자동완성 결과를 NDJSON 줄 단위로 스트리밍"""
+        if self._company_service.search_backend == SearchBackend.index:
+            return self._stream_autocomplete_by_name_index(
+                word=word, lang=lang, after=after, chunk_size=chunk_size
+            )
+        return self._stream_pages(
+            partial(
+                self._company_service.autocomplete_company_page, word=word, lang=lang
+            ),
+            after=after,
+            chunk_size=chunk_size,
+        )
+
+    async def search_company_by_name_with_etag(
+        self,
+        db: AsyncSession,
+        name: str,
+        lang: Language,
+        if_none_match: str | None = None,
+    ):
+        await self._refresh_name_filter()
+        return await db.run_sync(
+            lambda session: self._company_service.search_company_by_name_with_etag(
+                db=session, name=name, lang=lang, if_none_match=if_none_match
+            )
+        )
+
+    async def search_company_by_name(self, db: AsyncSession, name: str, lang: Language):
+        await self._refresh_name_filter()
+        return await db.run_sync(
+            lambda session: self._company_service.search_company_by_name(
+                db=session, name=name, lang=lang
+            )
+        )
+
+    async def search_companies_by_names(
+        self, db: AsyncSession, names: list[str], lang: Language
+    ):
+        await self._refresh_name_filter()
+        return await db.run_sync(
+            lambda session: self._company_service.search_companies_by_names(
+                db=session, names=names, lang=lang
+            )
+        )
+
+    async def search_company_by_tag(self, db: AsyncSession, tag: str, lang: Language):
+        return await db.run_sync(
+            lambda session: self._company_service.search_company_by_tag(
+                db=session, tag=tag, lang=lang
+            )
+        )
+
+    async def search_company_by_tag_page(
+        self,
+        db: AsyncSession,
+        tag: str,
+        lang: Language,
+        after: int = 0,
+        limit: int | None = None,
+    ):
+        return await db.run_sync(
+            lambda session: self._company_service.search_company_by_tag_page(
+                db=session, tag=tag, lang=lang, after=after, limit=limit
+            )
+        )
+
+    async def search_company_by_tag_page_with_etag(
+        self,
+        db: AsyncSession,
+        tag: str,
+        lang: Language,
+        after: int = 0,
+        limit: int | None = None,
+    ):
+        return await db.run_sync(
+            lambda session: self._company_service.search_company_by_tag_page_with_etag(
+                db=session, tag=tag, lang=lang, after=after, limit=limit
+            )
+        )
+
+    async def search_company_by_tags_page_with_etag(
+        self,
+        db: AsyncSession,
+        tags: list[str],
+        op: TagOperator,
+        lang: Language,
+        after: int = 0,
+        limit: int | None = None,
+    ):
+        return await db.run_sync(
+            lambda session: self._company_service.search_company_by_tags_page_with_etag(
+                db=session, tags=tags, op=op, lang=lang, after=after, limit=limit
+            )
+        )
+
+    def stream_search_company_by_tags(
+        self,
+        tags: list[str],
+        op: TagOperator,
+        lang: Language,
+        after: int = 0,
+        chunk_size: int = COMPANY_STREAM_CHUNK_SIZE,
+    ):
+        """다중 태그 검색 결과를 NDJSON 줄 단위로 스트리밍"""
+        return self._stream_id_pages(
+            partial(self._company_service.search_company_ids_by_tags, tags=tags, op=op),
+            partial(self._company_service.search_company_by_ids, lang=lang),
+            after=after,
+            chunk_size=chunk_size,
+        )
+
+    def stream_search_company_by_tag(
+        self,
+        tag: str,
+        lang: Language,
+        after: int = 0,
+        chunk_size: int = COMPANY_STREAM_CHUNK_SIZE,
+    ):
+        """태그 검색 결과를 NDJSON 줄 단위로 스트리밍"""
+        return self._stream_pages(
+            partial(
+                self._company_service.search_company_by_tag_page, tag=tag, lang=lang
+            ),
+            after=after,
+            chunk_size=chunk_size,
+        )
+
+    async def add_new_company(
+        self,
+        db: AsyncSession,
+        company: dict[dict[str, str], list[dict[str, str]]],
+        lang: str,
+    ):
+        return await db.run_sync(
+            lambda session: self._company_service.add_new_company(
+                db=session, company=company, lang=lang
+            )
+        )
+
+    @property
+    def uses_tag_write_queue(self) -> bool:
+        """태그 추가/삭제를 큐에 모아 batch 전용 세션에서 적용하는지 (요청 세션 불필요)"""
+        return self._tag_write_queue is not None
+
+    async def add_company_new_tag(
+        self,
+        db: AsyncSession | None,
+        tags: list[dict[str, str]],
+        name: str,
+        lang: Language,
+    ):
+        if self._tag_write_queue is not None:
+            return await self._tag_write_queue.submit(
+                (
+                    self._company_service.company_new_tag_write(tags=tags, name=name),
+                    lang,
+                )
+            )
+        return await db.run_sync(
+            lambda session: self._company_service.add_company_new_tag(
+                db=session, tags=tags, name=name, lang=lang
+            )
+        )
+
+    async def delete_company_tag(
+        self, db: AsyncSession | None, tag: str, name: str, lang: Language
+    ):
+        if self._tag_write_queue is not None:
+            return await self._tag_write_queue.submit(
+                (
+                    self._company_service.company_tag_delete_write(tag=tag, name=name),
+                    lang,
+                )
+            )
+        return await db.run_sync(
+            lambda session: self._company_service.delete_company_tag(
+                db=session, tag=tag, name=name, lang=lang
+            )
+        )
+
+    async def _apply_company_tag_writes(self, writes: list[tuple]):
+        # 요청 세션이 아닌 batch 전용 세션에서 한 트랜잭션으로 적용
+        async with AsyncSessionLocal() as db:
+            return await db.run_sync(
+                self._company_service.apply_company_tag_writes, writes=writes
+            )
+
+    def write_queue_metrics(self) -> str:
+        """태그 변경 큐 지표 (Prometheus text format), 큐를 사용하지 않으면 빈 문자열"""
+        if self._tag_write_queue is None:
+            return ""
+        return self._tag_write_queue.render()
+
+    async def close(self):
+        """큐에 남은 태그 변경 적용 (app 종료시)"""
+        if self._tag_write_queue is not None:
+            await self._tag_write_queue.stop()
+        self._index_lock = None
+
+    async def import_companies(
+        self,
+        db: AsyncSession,
+        companies: AsyncIterable[NewCompanyInSchema],
+        batch_size: int = COMPANY_IMPORT_BATCH_SIZE,
+    ):
+        started_at = time.perf_counter()
+        imported = 0
+        batches = 0
+        batch = []
+        async for company in companies:
+            batch.append(company)
+            if len(batch) < batch_size:
+                continue
+            imported += await db.run_sync(
+                self._company_service.import_company_batch,
+                companies=batch,
+                offset=imported,
+            )
+            batches += 1
+            batch = []
+        if batch:
+            imported += await db.run_sync(
+                self._company_service.import_company_batch,
+                companies=batch,
+                offset=imported,
+            )
+            batches += 1
+
+        return import_result(imported, batches, time.perf_counter() - started_at)
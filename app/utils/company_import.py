@@ -0,0 +1,117 @@
+import csv
+import json
+from collections import deque
+from itertools import islice
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator
+
+from app.schemas.request.company import NewCompanyInSchema
+
+# CSV 컬럼: company_<lang>, tag_<lang> (태그는 | 로 구분, 같은 위치의 태그가 같은 태그)
+CSV_COMPANY_PREFIX = "company_"
+CSV_TAG_PREFIX = "tag_"
+CSV_TAG_SEPARATOR = "|"
+
+
+def parse_jsonl_company(line: str) -> NewCompanyInSchema:
+    return NewCompanyInSchema.model_validate(json.loads(line))
+
+
+def parse_csv_company(header: list[str], row: list[str]) -> NewCompanyInSchema:
+    company_name = {}
+    tag_names = []
+    for column, value in zip(header, row):
+        if not value:
+            continue
+        if column.startswith(CSV_COMPANY_PREFIX):
+            company_name[column[len(CSV_COMPANY_PREFIX) :]] = value
+        elif column.startswith(CSV_TAG_PREFIX):
+            lang = column[len(CSV_TAG_PREFIX) :]
+            for i, tag_name in enumerate(value.split(CSV_TAG_SEPARATOR)):
+                if i == len(tag_names):
+                    tag_names.append({})
+                tag_names[i][lang] = tag_name
+
+    return NewCompanyInSchema(
+        company_name=company_name,
+        tags=[{"tag_name": tag_name} for tag_name in tag_names],
+    )
+
+
+def iter_companies(lines: Iterable[str], fmt: str) -> Iterator[NewCompanyInSchema]:
+    """JSONL / CSV 줄 단위 입력을 NewCompanyInSchema 로 변환"""
+    if fmt == "jsonl":
+        for line in lines:
+            if line.strip():
+                yield parse_jsonl_company(line)
+        return
+
+    rows = csv.reader(lines)
+    header = next(rows, None)
+    for row in rows:
+        if row:
+            yield parse_csv_company(header, row)
+
+
+class _LineFeed:
+    """csv.reader 입력용 줄 큐 (비어 있으면 StopIteration, 다시 채우면 이어서 읽음)"""
+
+    def __init__(self):
+        self.lines = deque()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> str:
+        if not self.lines:
+            raise StopIteration
+        return self.lines.popleft()
+
+
+async def aiter_companies(
+    lines: AsyncIterable[str], fmt: str
+) -> AsyncIterator[NewCompanyInSchema]:
+    """비동기 줄 단위 입력(요청 본문 스트림)을 NewCompanyInSchema 로 변환"""
+    if fmt == "jsonl":
+        async for line in lines:
+            if line.strip():
+                yield parse_jsonl_company(line)
+        return
+
+    # 따옴표 안 줄바꿈이 있는 레코드도 읽도록 하나의 csv.reader 에 레코드가 끝난 줄까지만 넘김
+    feed = _LineFeed()
+    rows = csv.reader(feed)
+    header = None
+    quoted = False
+    async for line in lines:
+        feed.lines.append(line)
+        # 따옴표 개수가 홀수인 줄은 따옴표 안에서 끝난 줄 ("" 은 두 개로 셈)
+        quoted ^= line.count('"') % 2 == 1
+        if quoted:
+            continue
+        for row in rows:
+            if not row:
+                continue
+            if header is None:
+                header = row
+            else:
+                yield parse_csv_company(header, row)
+    if quoted:
+        raise ValueError("unterminated quoted field at end of CSV input")
+
+
+async def aiter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """바이트 청크 스트림을 (줄바꿈 문자를 포함한) 줄 단위 문자열로 변환"""
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield (line + b"\n").decode("utf-8-sig")
+    if buffer:
+        yield buffer.decode("utf-8-sig")
+
+
+def batched(items: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
@@ -5,3 +5,26 @@ class Language(str, Enum):
     ko = "ko"
     en = "en"
     ja = "ja"
+
+
+class SearchBackend(str, Enum):
+    index = "index"
+    fts = "fts"
+    like = "like"
+
+
+class AutocompleteMode(str, Enum):
+    substring = "substring"
+    prefix = "prefix"
+
+
+class ResponseFormat(str, Enum):
+    json = "json"
+    ndjson = "ndjson"
+
+
+class TagOperator(str, Enum):
+    # 다중 태그 검색: 모든 태그 / 하나 이상의 태그 / 첫 태그만 있고 나머지 태그는 없는 회사
+    intersection = "and"
+    union = "or"
+    difference = "not"
@@ -0,0 +1,29 @@
+import hashlib
+
+# 압축 응답의 ETag 에 붙는 인코딩 접미사 (app.utils.response.CompressedJSONResponse)
+ENCODING_SUFFIXES = ('-gzip"', '-br"')
+
+
+def make_etag(*parts) -> str:
+    """응답을 결정하는 값(회사 ID, 버전, 언어 등)으로 strong ETag 생성"""
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=8).hexdigest()
+    return f'"{digest}"'
+
+
+def _strip_encoding(etag: str) -> str:
+    for suffix in ENCODING_SUFFIXES:
+        if etag.endswith(suffix):
+            return etag[: -len(suffix)] + '"'
+    return etag
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match 헤더(쉼표로 구분된 ETag 목록 또는 *) 에 etag 가 있는지 (약한 비교)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (
+        _strip_encoding(candidate.strip().removeprefix("W/"))
+        for candidate in if_none_match.split(",")
+    )
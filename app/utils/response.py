@@ -0,0 +1,99 @@
+import gzip
+import json
+
+from fastapi import Response
+
+try:
+    import orjson
+except ImportError:  # orjson 이 없으면 표준 json 으로 직렬화
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # brotli 가 없으면 br 은 협상하지 않음
+    brotli = None
+
+# 선호 순서 (q 값이 같으면 앞쪽 인코딩 사용)
+SUPPORTED_ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+# 압축률보다 응답 지연이 중요하므로 빠른 압축 단계 사용
+GZIP_LEVEL = 5
+BROTLI_QUALITY = 4
+
+
+def dumps_json(value) -> bytes:
+    """UTF-8 JSON bytes (orjson 이 있으면 orjson 사용)"""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def negotiate_encoding(accept_encoding: str | None) -> str | None:
+    """Accept-Encoding 헤더에서 지원하는 압축 방식 중 q 값이 가장 높은 방식 반환"""
+    if not accept_encoding:
+        return None
+
+    qualities = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.strip().lower()] = quality
+
+    best, best_quality = None, 0.0
+    for coding in SUPPORTED_ENCODINGS:
+        quality = qualities.get(coding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def response_encoding(
+    body: bytes, accept_encoding: str | None, min_size: int
+) -> str | None:
+    """본문에 적용할 압축 방식 (min_size 미만이면 압축하지 않음)"""
+    return negotiate_encoding(accept_encoding) if len(body) >= min_size else None
+
+
+def encoded_etag(etag: str, encoding: str | None) -> str:
+    """압축된 응답은 원본과 다른 표현이므로 strong ETag 도 구분 (If-None-Match 비교시 제거)"""
+    return f'{etag[:-1]}-{encoding}"' if encoding is not None else etag
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL)
+
+
+class CompressedJSONResponse(Response):
+    """JSON 응답 (응답 스키마 검증 없이 직렬화, min_size 이상이면 gzip / br 압축)"""
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content,
+        accept_encoding: str | None = None,
+        min_size: int = 1024,
+        status_code: int = 200,
+        headers=None,
+    ):
+        body = dumps_json(content)
+        encoding = response_encoding(body, accept_encoding, min_size)
+        if encoding is not None:
+            body = compress(body, encoding)
+        super().__init__(body, status_code=status_code, headers=headers)
+
+        vary = self.headers.get("vary")
+        self.headers["vary"] = f"{vary}, accept-encoding" if vary else "accept-encoding"
+        if encoding is not None:
+            self.headers["content-encoding"] = encoding
+            etag = self.headers.get("etag")
+            if etag is not None:
+                self.headers["etag"] = encoded_etag(etag, encoding)
@@ -0,0 +1,34 @@
+import unicodedata
+
+# 한글 음절 (가 ~ 힣), 음절당 (중성 21 * 종성 28) 개
+HANGUL_SYLLABLE_FIRST = 0xAC00
+HANGUL_SYLLABLE_LAST = 0xD7A3
+HANGUL_SYLLABLES_PER_CHOSUNG = 21 * 28
+# 초성 19자 (NFKC 는 호환 자모 ㄱ(U+3131) 를 첫소리 자모 ᄀ(U+1100) 로 바꾸므로 첫소리 자모 사용)
+CHOSUNG = tuple(chr(0x1100 + i) for i in range(19))
+_CHOSUNG_SET = frozenset(CHOSUNG)
+
+
+def normalize_search_key(text: str) -> str:
+    """검색 키: NFKC 정규화, casefold, 공백 제거 (ＷＡＮＴＥＤ Lab -> wantedlab)"""
+    return "".join(unicodedata.normalize("NFKC", text).casefold().split())
+
+
+def chosung_search_key(text: str) -> str:
+    """초성 검색 키: 검색 키의 한글 음절을 초성으로 변환 (원티드랩 -> ᄋᄐᄃᄅ)"""
+    return "".join(
+        (
+            CHOSUNG[(ord(char) - HANGUL_SYLLABLE_FIRST) // HANGUL_SYLLABLES_PER_CHOSUNG]
+            if HANGUL_SYLLABLE_FIRST <= ord(char) <= HANGUL_SYLLABLE_LAST
+            else char
+        )
+        for char in normalize_search_key(text)
+    )
+
+
+def query_search_key(text: str) -> tuple[str, bool]:
+    """검색어의 (검색 키, 초성 검색 여부) 반환 (초성이 섞인 검색어는 초성 검색 키로 비교)"""
+    key = normalize_search_key(text)
+    if any(char in _CHOSUNG_SET for char in key):
+        return chosung_search_key(key), True
+    return key, False
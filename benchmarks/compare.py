@@ -0,0 +1,60 @@
+import argparse
+import json
+import sys
+from pathlib import Path
+
+METRICS = ("p50_ms", "p95_ms", "p99_ms", "rps")
+
+
+def change(before: float, after: float) -> float | None:
+    return round((after - before) / before * 100, 1) if before else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="벤치마크 결과 JSON 두 개 비교")
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("candidate", type=Path)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="p95 지연이 이 비율(%%) 이상 늘어나면 실패 (exit code 1)",
+    )
+    args = parser.parse_args()
+
+    baseline = json.loads(args.baseline.read_text())
+    candidate = json.loads(args.candidate.read_text())
+    if baseline["config"] != candidate["config"]:
+        print("warning: benchmark config differs", file=sys.stderr)
+
+    print(f"{baseline['revision']} -> {candidate['revision']}")
+    print(f"{'scenario':>15} " + " ".join(f"{metric:>22}" for metric in METRICS))
+    regressions = []
+    for name, after in candidate["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+        cells = []
+        for metric in METRICS:
+            # 시작 시간 벤치마크(benchmarks.startup) 결과에는 rps 가 없음
+            if metric not in before or metric not in after:
+                cells.append("")
+                continue
+            delta = change(before[metric], after[metric])
+            cells.append(
+                f"{before[metric]:>8} -> {after[metric]:>8} "
+                + (f"{delta:+.1f}%" if delta is not None else "")
+            )
+        print(f"{name:>15} " + " ".join(f"{cell:>22}" for cell in cells))
+
+        delta = change(before["p95_ms"], after["p95_ms"])
+        if delta is not None and delta >= args.threshold:
+            regressions.append(name)
+
+    if regressions:
+        print(f"p95 regression: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
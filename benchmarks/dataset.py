@@ -0,0 +1,121 @@
+import random
+import sqlite3
+from pathlib import Path
+
+from sqlalchemy import create_engine
+
+from app.infrastructures.migration import upgrade
+from app.infrastructures.read_model import rebuild_company_profiles
+from app.utils.search_key import chosung_search_key, normalize_search_key
+
+KO_SYLLABLES = "가나다라마바사아자차카타파하원티드랩링크코리아스피삼일제약투게더앱"
+JA_SYLLABLES = "アイウエオカキクケコサシスセソタチツテトナニヌネノハヒフヘホマミムメモ"
+EN_WORDS = (
+    "Wanted Lab Linked Korea Spi Link Sam Il Pharm Together Apps Line Fresh "
+    "Nova Blue Peak Data Cloud Soft Bio Mobility Labs Works Studio Market"
+).split()
+
+# 회사 수와 무관하게 태그 검색 결과 수가 적당하도록 태그 카테고리 수를 제한
+TAG_CATEGORIES = 1000
+INSERT_BATCH_SIZE = 10000
+
+
+def company_names(rng: random.Random, c_id: int) -> dict[str, str]:
+    """회사 ID 별 다국어 회사명 (ko 는 항상, en / ja 는 일부 회사만)"""
+    names = {
+        "ko": "".join(rng.choices(KO_SYLLABLES, k=rng.randint(2, 5))) + f" {c_id}",
+    }
+    if rng.random() < 0.7:
+        names["en"] = " ".join(rng.choices(EN_WORDS, k=rng.randint(1, 3))) + f" {c_id}"
+    if rng.random() < 0.4:
+        names["ja"] = (
+            "".join(rng.choices(JA_SYLLABLES, k=rng.randint(2, 5))) + f" {c_id}"
+        )
+    return names
+
+
+def tag_names(category_id: int) -> dict[str, str]:
+    return {
+        "ko": f"태그_{category_id}",
+        "en": f"tag_{category_id}",
+        "ja": f"タグ_{category_id}",
+    }
+
+
+def generate_dataset(
+    path: Path, companies: int, tags_per_company: int = 3, seed: int = 0
+) -> Path:
+    """회사 수, 회사당 태그 수 기준 합성 다국어 데이터셋 SQLite 파일 생성"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.unlink(missing_ok=True)
+    engine = create_engine(f"sqlite:///{path}")
+    upgrade(engine)
+
+    rng = random.Random(seed)
+    connection = sqlite3.connect(path)
+    connection.execute("PRAGMA journal_mode = OFF")
+    connection.execute("PRAGMA synchronous = OFF")
+    with connection:
+        connection.executemany(
+            "INSERT INTO company_tag_category (id, category_name) VALUES (?, ?)",
+            ((i, f"태그_{i}") for i in range(1, TAG_CATEGORIES + 1)),
+        )
+
+    name_id = 0
+    tag_id = 0
+    for start in range(1, companies + 1, INSERT_BATCH_SIZE):
+        company_rows, name_rows, tag_rows = [], [], []
+        for c_id in range(start, min(start + INSERT_BATCH_SIZE, companies + 1)):
+            names = company_names(rng, c_id)
+            company_rows.append((c_id, names["ko"]))
+            for lang, name in names.items():
+                name_id += 1
+                name_rows.append(
+                    (
+                        name_id,
+                        c_id,
+                        lang,
+                        name,
+                        normalize_search_key(name),
+                        chosung_search_key(name),
+                    )
+                )
+            for category_id in sorted(
+                rng.sample(range(1, TAG_CATEGORIES + 1), tags_per_company)
+            ):
+                for lang, tag in tag_names(category_id).items():
+                    tag_id += 1
+                    tag_rows.append(
+                        (
+                            tag_id,
+                            c_id,
+                            lang,
+                            tag,
+                            category_id,
+                            normalize_search_key(tag),
+                            chosung_search_key(tag),
+                        )
+                    )
+
+        with connection:
+            connection.executemany(
+                "INSERT INTO company (id, company_name) VALUES (?, ?)", company_rows
+            )
+            connection.executemany(
+                "INSERT INTO company_name "
+                "(id, c_id, lang, name, search_key, chosung_key) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                name_rows,
+            )
+            connection.executemany(
+                "INSERT INTO company_tag "
+                "(id, c_id, lang, tag, tag_category_id, search_key, chosung_key) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                tag_rows,
+            )
+    connection.close()
+
+    with engine.begin() as connection:
+        rebuild_company_profiles(connection)
+    engine.dispose()
+    return path
@@ -0,0 +1,320 @@
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+DATASET_DIR = BENCHMARK_DIR / "data"
+RESULT_DIR = BENCHMARK_DIR / "results"
+
+
+def percentile(sorted_values: list[float], p: float) -> float:
+    """nearest-rank 백분위수"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def summarize(latencies: list[float], statuses: list[int], elapsed: float) -> dict:
+    latencies = sorted(latencies)
+    return {
+        "requests": len(latencies),
+        "errors": sum(1 for status in statuses if status >= 400),
+        "rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "mean_ms": (
+            round(sum(latencies) / len(latencies) * 1000, 3) if latencies else 0.0
+        ),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+    }
+
+
+def sample_companies(path: Path, rng: random.Random, count: int) -> list[dict]:
+    """데이터셋에서 임의의 회사 ko 회사명 조회"""
+    connection = sqlite3.connect(path)
+    try:
+        total = connection.execute("SELECT max(id) FROM company").fetchone()[0]
+        return [
+            {
+                "name": connection.execute(
+                    "SELECT name FROM company_name WHERE c_id = ? AND lang = 'ko'",
+                    (c_id,),
+                ).fetchone()[0]
+            }
+            for c_id in rng.sample(range(1, total + 1), min(count, total))
+        ]
+    finally:
+        connection.close()
+
+
+def build_scenarios(companies: list[dict], rng: random.Random, args) -> dict:
+    """시나리오별 (method, url, json, headers) 요청 리스트 생성 (쓰기 시나리오는 순서대로 실행)"""
+    langs = ["ko", "en", "ja"]
+    n = args.requests
+
+    def headers():
+        return {"x-wanted-language": rng.choice(langs)}
+
+    def company():
+        return rng.choice(companies)
+
+    def new_company(i: int) -> dict:
+        return {
+            "company_name": {
+                "ko": f"벤치마크 회사 {i}",
+                "en": f"Benchmark Company {i}",
+            },
+            "tags": [
+                {"tag_name": {"ko": f"태그_{k}", "en": f"tag_{k}", "ja": f"タグ_{k}"}}
+                for k in rng.sample(range(1, 1001), args.tags_per_company)
+            ],
+        }
+
+    new_companies = [new_company(i) for i in range(n)]
+    return {
+        "search": [
+            (
+                "GET",
+                f"/search?query={company()['name'][:2]}&limit={args.page_size}",
+                None,
+                headers(),
+            )
+            for _ in range(n)
+        ],
+        "company": [
+            (
+                "GET",
+                f"/companies/{company()['name']}",
+                None,
+                {"x-wanted-language": "ko"},
+            )
+            for _ in range(n)
+        ],
+        # 다중 태그 검색 (태그 posting 색인의 집합 연산)
+        "multi_tags": [
+            (
+                "GET",
+                f"/tags?tags={','.join(f'tag_{k}' for k in rng.sample(range(1, 1001), 3))}"
+                f"&op={rng.choice(['and', 'or', 'not'])}&limit={args.page_size}",
+                None,
+                headers(),
+            )
+            for _ in range(n)
+        ],
+        # 없는 회사명 상세 조회 (COMPANY_NAME_FILTER 로 DB 조회 없이 404)
+        "missing_company": [
+            ("GET", f"/companies/없는 회사 {i}", None, {"x-wanted-language": "ko"})
+            for i in range(n)
+        ],
+        "tags": [
+            (
+                "GET",
+                f"/tags?query=tag_{rng.randint(1, 1000)}&limit={args.page_size}",
+                None,
+                headers(),
+            )
+            for _ in range(n)
+        ],
+        "create_company": [
+            ("POST", "/companies", body, {"x-wanted-language": "ko"})
+            for body in new_companies
+        ],
+        "add_tags": [
+            (
+                "PUT",
+                f"/companies/{company()['name']}/tags",
+                [
+                    {
+                        "tag_name": {
+                            "ko": f"벤치마크태그_{i}",
+                            "en": f"benchmark_tag_{i}",
+                        }
+                    }
+                ],
+                {"x-wanted-language": "ko"},
+            )
+            for i in range(n)
+        ],
+        # create_company 에서 추가한 회사의 태그 삭제
+        "delete_tag": [
+            (
+                "DELETE",
+                f"/companies/{body['company_name']['ko']}/tags/"
+                f"{body['tags'][0]['tag_name']['ko']}",
+                None,
+                {"x-wanted-language": "ko"},
+            )
+            for body in new_companies
+            if body["tags"]
+        ],
+    }
+
+
+async def run_scenario(client, requests: list[tuple], concurrency: int) -> dict:
+    latencies = []
+    statuses = []
+    queue = iter(requests)
+
+    async def worker():
+        for method, url, body, headers in queue:
+            started_at = time.perf_counter()
+            response = await client.request(method, url, json=body, headers=headers)
+            latencies.append(time.perf_counter() - started_at)
+            statuses.append(response.status_code)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, statuses, time.perf_counter() - started_at)
+
+
+async def run_benchmark(app, scenarios: dict, args) -> dict:
+    import httpx
+
+    results = {}
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://benchmark"
+        ) as client:
+            for name, requests in scenarios.items():
+                if args.scenarios and name not in args.scenarios:
+                    continue
+                # 캐시, 색인 준비 등 첫 요청 비용은 측정에서 제외
+                for method, url, body, headers in requests[: args.warmup]:
+                    if method == "GET":
+                        await client.request(method, url, json=body, headers=headers)
+                results[name] = await run_scenario(client, requests, args.concurrency)
+                print(f"{name:>15}: {json.dumps(results[name])}")
+    return results
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=BENCHMARK_DIR,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Company API 벤치마크 (in-process ASGI)"
+    )
+    parser.add_argument("--companies", type=int, default=10000)
+    parser.add_argument("--tags-per-company", type=int, default=3)
+    parser.add_argument("--requests", type=int, default=500, help="시나리오별 요청 수")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--search-backend", choices=["index", "fts", "like"])
+    parser.add_argument(
+        "--fast-response",
+        action="store_true",
+        help="검색 응답을 스키마 검증 없이 직렬화, 압축 (COMPANY_FAST_RESPONSE)",
+    )
+    parser.add_argument(
+        "--tag-write-queue",
+        action="store_true",
+        help="태그 추가/삭제를 group commit 으로 적용 (COMPANY_TAG_WRITE_QUEUE)",
+    )
+    parser.add_argument("--scenarios", nargs="*", help="실행할 시나리오 (기본: 전체)")
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    dataset = (
+        DATASET_DIR
+        / f"companies-{args.companies}-tags-{args.tags_per_company}-seed-{args.seed}.db"
+    )
+    work_dir = Path(tempfile.mkdtemp(prefix="wantedlab-benchmark-"))
+    work_db = work_dir / "wantedlab.db"
+
+    # app 설정(config) 은 import 시점에 환경 변수를 읽으므로 환경 변수 설정 후 import
+    os.environ["DB_URL"] = f"sqlite:///{work_db}"
+    os.environ.pop("DB_ASYNC_URL", None)
+    os.environ.setdefault("CACHE_URL", "memory://")
+    if args.search_backend:
+        os.environ["COMPANY_SEARCH_BACKEND"] = args.search_backend
+    if args.fast_response:
+        os.environ["COMPANY_FAST_RESPONSE"] = "true"
+    if args.tag_write_queue:
+        os.environ["COMPANY_TAG_WRITE_QUEUE"] = "true"
+
+    from benchmarks.dataset import generate_dataset
+
+    dataset_seconds = None
+    if not dataset.exists():
+        started_at = time.perf_counter()
+        generate_dataset(dataset, args.companies, args.tags_per_company, args.seed)
+        dataset_seconds = round(time.perf_counter() - started_at, 3)
+        print(f"generated dataset in {dataset_seconds}s: {dataset}")
+    # 쓰기 시나리오가 데이터셋을 바꾸지 않도록 복사본 사용
+    shutil.copy(dataset, work_db)
+
+    from app.infrastructures.config import (
+        COMPANY_FAST_RESPONSE,
+        COMPANY_NAME_FILTER,
+        COMPANY_SEARCH_BACKEND,
+        COMPANY_TAG_WRITE_QUEUE,
+    )
+    from app.main import create_app
+
+    rng = random.Random(args.seed)
+    scenarios = build_scenarios(
+        sample_companies(work_db, rng, min(args.requests, args.companies)), rng, args
+    )
+    try:
+        results = asyncio.run(run_benchmark(create_app(), scenarios, args))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "environment": {
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+        },
+        "config": {
+            "companies": args.companies,
+            "tags_per_company": args.tags_per_company,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "page_size": args.page_size,
+            "seed": args.seed,
+            "search_backend": COMPANY_SEARCH_BACKEND,
+            "fast_response": COMPANY_FAST_RESPONSE,
+            "tag_write_queue": COMPANY_TAG_WRITE_QUEUE,
+            "name_filter": COMPANY_NAME_FILTER,
+            "dataset_seconds": dataset_seconds,
+        },
+        "results": results,
+    }
+    output = args.output or RESULT_DIR / (
+        f"{datetime.now():%Y%m%d-%H%M%S}-{report['revision'] or 'local'}"
+        f"-{args.companies}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n")
+    print(f"saved: {output}")
+
+
+if __name__ == "__main__":
+    main()
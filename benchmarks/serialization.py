@@ -0,0 +1,100 @@
+import argparse
+import asyncio
+import json
+import platform
+import sqlite3
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.schemas.response.company import CompanyAutoCompleteOutSchema
+from app.utils.response import CompressedJSONResponse
+from benchmarks.run import RESULT_DIR, git_revision
+from benchmarks.startup import summarize
+
+
+def measure(build_response, runs: int) -> list[float]:
+    durations = []
+    for _ in range(runs):
+        started_at = time.perf_counter()
+        build_response()
+        durations.append(time.perf_counter() - started_at)
+    return durations
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="검색 응답 직렬화 벤치마크 (기존 경로 / COMPANY_FAST_RESPONSE 경로)"
+    )
+    parser.add_argument("--rows", type=int, nargs="*", default=[20, 1000, 10000])
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--accept-encoding", default="gzip, br")
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    # 기존 경로: 응답 모델(list[CompanyAutoCompleteOutSchema]) 검증, 직렬화 후 JSONResponse
+    field = create_response_field(
+        name="response",
+        type_=list[CompanyAutoCompleteOutSchema],
+        mode="serialization",
+    )
+    loop = asyncio.new_event_loop()
+
+    results = {}
+    for rows in args.rows:
+        companies = [{"company_name": f"벤치마크 회사 {i}"} for i in range(rows)]
+
+        def validated():
+            return JSONResponse(
+                loop.run_until_complete(
+                    serialize_response(
+                        field=field, response_content=companies, is_coroutine=True
+                    )
+                )
+            )
+
+        paths = {
+            "validated": validated,
+            "fast": lambda: CompressedJSONResponse(companies),
+            "fast_compressed": lambda: CompressedJSONResponse(
+                companies, accept_encoding=args.accept_encoding
+            ),
+        }
+        for path, build_response in paths.items():
+            result = summarize(measure(build_response, args.runs))
+            result["body_bytes"] = len(build_response().body)
+            results[f"{path}-{rows}"] = result
+            print(f"{path:>15} {rows:>6}: {json.dumps(result)}")
+    loop.close()
+
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "environment": {
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+        },
+        "config": {
+            "benchmark": "serialization",
+            "rows": args.rows,
+            "runs": args.runs,
+            "accept_encoding": args.accept_encoding,
+        },
+        "results": results,
+    }
+    output = args.output or RESULT_DIR / (
+        f"{datetime.now():%Y%m%d-%H%M%S}-{report['revision'] or 'local'}"
+        "-serialization.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n")
+    print(f"saved: {output}")
+
+
+if __name__ == "__main__":
+    main()
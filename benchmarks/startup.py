@@ -0,0 +1,153 @@
+import argparse
+import asyncio
+import json
+import os
+import platform
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchmarks.run import DATASET_DIR, RESULT_DIR, git_revision, percentile
+
+PHASES = ("import", "lifespan", "first_request", "total")
+
+
+def measure_child(url: str):
+    """새 프로세스에서 app import, lifespan 시작, 첫 요청 응답까지 걸린 시간 (초) 출력"""
+    started_at = time.perf_counter()
+    from app.main import app
+
+    imported_at = time.perf_counter()
+
+    async def start():
+        import httpx
+
+        async with app.router.lifespan_context(app):
+            ready_at = time.perf_counter()
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url="http://benchmark"
+            ) as client:
+                response = await client.get(url, headers={"x-wanted-language": "ko"})
+                response.raise_for_status()
+            return ready_at, time.perf_counter()
+
+    ready_at, responded_at = asyncio.run(start())
+    print(
+        json.dumps(
+            {
+                "import": imported_at - started_at,
+                "lifespan": ready_at - imported_at,
+                "first_request": responded_at - ready_at,
+                "total": responded_at - started_at,
+            }
+        )
+    )
+
+
+def summarize(durations: list[float]) -> dict:
+    durations = sorted(durations)
+    return {
+        "runs": len(durations),
+        "mean_ms": round(sum(durations) / len(durations) * 1000, 3),
+        "p50_ms": round(percentile(durations, 50) * 1000, 3),
+        "p95_ms": round(percentile(durations, 95) * 1000, 3),
+        "p99_ms": round(percentile(durations, 99) * 1000, 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="워커 콜드 스타트 벤치마크 (import, lifespan, 첫 요청 시간)"
+    )
+    parser.add_argument("--companies", type=int, default=10000)
+    parser.add_argument("--tags-per-company", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--runs", type=int, default=10, help="새 프로세스 실행 횟수")
+    parser.add_argument("--search-backend", choices=["index", "fts", "like"])
+    parser.add_argument("--url", default="/search?query=원티드&limit=20")
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        measure_child(args.url)
+        return
+
+    from benchmarks.dataset import generate_dataset
+
+    dataset = (
+        DATASET_DIR
+        / f"companies-{args.companies}-tags-{args.tags_per_company}-seed-{args.seed}.db"
+    )
+    if not dataset.exists():
+        generate_dataset(dataset, args.companies, args.tags_per_company, args.seed)
+
+    work_dir = Path(tempfile.mkdtemp(prefix="wantedlab-startup-"))
+    work_db = work_dir / "wantedlab.db"
+    shutil.copy(dataset, work_db)
+    env = {
+        **os.environ,
+        "DB_URL": f"sqlite:///{work_db}",
+        "CACHE_URL": os.environ.get("CACHE_URL", "memory://"),
+    }
+    env.pop("DB_ASYNC_URL", None)
+    if args.search_backend:
+        env["COMPANY_SEARCH_BACKEND"] = args.search_backend
+
+    durations = {phase: [] for phase in PHASES}
+    try:
+        for _ in range(args.runs):
+            # 매번 새 프로세스로 실행해야 import 캐시 없이 워커 시작 비용을 측정
+            output = subprocess.run(
+                [sys.executable, "-m", "benchmarks.startup", "--child"]
+                + ["--url", args.url],
+                capture_output=True,
+                text=True,
+                check=True,
+                env=env,
+                cwd=Path(__file__).resolve().parent.parent,
+            ).stdout
+            for phase, seconds in json.loads(output.splitlines()[-1]).items():
+                durations[phase].append(seconds)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    results = {phase: summarize(durations[phase]) for phase in PHASES}
+    for phase, result in results.items():
+        print(f"{phase:>15}: {json.dumps(result)}")
+
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "environment": {
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+        },
+        "config": {
+            "benchmark": "startup",
+            "companies": args.companies,
+            "tags_per_company": args.tags_per_company,
+            "runs": args.runs,
+            "seed": args.seed,
+            "search_backend": env.get("COMPANY_SEARCH_BACKEND", "like"),
+            "url": args.url,
+        },
+        "results": results,
+    }
+    output = args.output or RESULT_DIR / (
+        f"{datetime.now():%Y%m%d-%H%M%S}-{report['revision'] or 'local'}"
+        f"-startup-{args.companies}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n")
+    print(f"saved: {output}")
+
+
+if __name__ == "__main__":
+    main()
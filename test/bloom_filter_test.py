@@ -0,0 +1,92 @@
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.indexes.bloom import CompanyNameBloomFilter
+from app.infrastructures.migration import upgrade
+from app.schemas.request.company import NewCompanyInSchema
+from app.services.company import CompanyService
+
+
+def test_bloom_filter_membership():
+    """
+    색인된 회사명은 항상 통과하고 (false negative 없음),
+    없는 회사명의 오탐률은 목표 오탐률 근처여야 합니다.
+    """
+    name_filter = CompanyNameBloomFilter(false_positive_rate=0.01)
+    name_filter.build(
+        [(i, "ko", f"회사_{i}") for i in range(5000)]
+        + [(i, "en", f"Company {i}") for i in range(5000)]
+    )
+
+    assert all(name_filter.might_contain(f"회사_{i}") for i in range(5000))
+    assert all(name_filter.might_contain(f"Company {i}") for i in range(5000))
+    false_positives = sum(
+        name_filter.might_contain(f"없는회사_{i}") for i in range(10000)
+    )
+    assert false_positives < 10000 * 0.02
+
+    stats = name_filter.stats()
+    assert stats["items"] == 10000
+    assert stats["expected_false_positive_rate"] < 0.01
+    assert stats["memory_bytes"] < 10000 * 2
+    assert stats["negatives"] == 10000 - false_positives
+
+
+def test_bloom_filter_replace_company():
+    """
+    새 회사명은 재생성 없이 바로 통과하고, 용량을 넘으면 다시 생성하도록 표시되어야 합니다.
+    """
+    name_filter = CompanyNameBloomFilter()
+    assert name_filter.might_contain("아무 회사")
+
+    name_filter.build([(1, "ko", "원티드랩")], fingerprint=(1, 1))
+    assert not name_filter.might_contain("라인 프레쉬")
+
+    name_filter.replace_company(2, {"ko": "라인 프레쉬", "tw": "LINE FRESH"})
+    assert name_filter.might_contain("라인 프레쉬")
+    assert name_filter.might_contain("LINE FRESH")
+    assert name_filter.fingerprint == (1, 1)
+
+    name_filter.replace_company(3, {str(i): f"회사_{i}" for i in range(2000)})
+    assert name_filter.fingerprint is None
+
+
+def test_name_filter_sees_other_writers(db_path):
+    """
+    필터에 없는 회사명은 회사명 테이블을 조회하지 않고 404 처리하고,
+    필터 생성 후 다른 워커 (다른 연결) 가 추가한 회사명은 404 가 아니라 바로 조회되어야 합니다.
+    """
+    engine = create_engine(f"sqlite:///{db_path}")
+    upgrade(engine)
+    service = CompanyService(search_backend="like", cache_url="memory://")
+    other = CompanyService(search_backend="like", cache_url="memory://")
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        service.warm_up(db=db)
+        statements = []
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        with pytest.raises(Exception, match="Company not found"):
+            service.search_company_by_name(db=db, name="라인 프레쉬", lang="ko")
+        event.remove(engine, "before_cursor_execute", capture)
+        # 필터에 없는 회사명은 회사명 테이블 대신 버전 한 행만 조회
+        assert len(statements) == 1 and "table_version" in statements[0]
+
+        other.add_new_company(
+            db=db,
+            company=NewCompanyInSchema(company_name={"ko": "라인 프레쉬"}, tags=[]),
+            lang="ko",
+        )
+
+        assert service.search_company_by_name(db=db, name="라인 프레쉬", lang="ko") == {
+            "company_name": "라인 프레쉬",
+            "tags": [],
+        }
+        assert service.name_filter_stats()["false_positives"] == 0
+    finally:
+        db.close()
+        engine.dispose()
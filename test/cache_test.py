@@ -0,0 +1,92 @@
+import time
+
+import pytest
+
+from app.infrastructures.cache import LRUCache, create_cache
+
+
+def test_lru_cache_eviction_and_invalidation():
+    """
+    LRU 캐시
+    최대 크기를 넘으면 가장 오래 사용되지 않은 항목이 제거되고,
+    태그(회사 ID) 단위로 무효화할 수 있어야 합니다.
+    """
+    cache = LRUCache(maxsize=2, ttl=60)
+    cache.set(("원티드랩", "ko"), {"company_name": "원티드랩"}, tags=(3,))
+    cache.set(("Wantedlab", "en"), {"company_name": "Wantedlab"}, tags=(3,))
+
+    assert cache.get(("원티드랩", "ko")) == {"company_name": "원티드랩"}
+
+    cache.set(("스피링크", "ko"), {"company_name": "스피링크"}, tags=(2,))
+
+    assert cache.get(("Wantedlab", "en")) is None
+    assert cache.invalidate(3) == 1
+    assert cache.get(("원티드랩", "ko")) is None
+    assert cache.get(("스피링크", "ko")) == {"company_name": "스피링크"}
+    assert cache.stats() == {
+        "size": 1,
+        "maxsize": 2,
+        "hits": 2,
+        "misses": 2,
+        "evictions": 1,
+        "invalidations": 1,
+    }
+
+
+def test_lru_cache_ttl():
+    """
+    TTL 이 지난 항목은 조회되지 않아야 합니다.
+    """
+    cache = LRUCache(maxsize=2, ttl=0.01)
+    cache.set("key", "value")
+    time.sleep(0.02)
+
+    assert cache.get("key") is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_sqlite_cache_shared_between_workers(tmp_path):
+    """
+    SQLite 캐시 백엔드
+    한 워커에서 저장/무효화한 항목이 같은 파일을 쓰는 다른 워커에도 보여야 합니다.
+    """
+    url = f"sqlite:///{tmp_path / 'cache.db'}"
+    worker_1 = create_cache(url, maxsize=2, ttl=60)
+    worker_2 = create_cache(url, maxsize=2, ttl=60)
+
+    worker_1.set(("원티드랩", "ko"), {"company_name": "원티드랩"}, tags=(3,))
+
+    assert worker_2.get(("원티드랩", "ko")) == {"company_name": "원티드랩"}
+    assert worker_2.invalidate(3) == 1
+    assert worker_1.get(("원티드랩", "ko")) is None
+
+    worker_1.set("a", 1)
+    worker_1.set("b", 2)
+    worker_2.set("c", 3)
+
+    assert len(worker_1) == 2
+    assert worker_1.get("a") is None
+    assert worker_2.stats()["evictions"] == 1
+
+
+@pytest.mark.parametrize("url", ["memory://", "sqlite:///cache.db"])
+def test_cache_set_skipped_after_invalidation(url, tmp_path, monkeypatch):
+    """
+    원본 조회 전에 읽은 generation 이후 무효화가 있었으면
+    조회한 값은 (무효화 전 값일 수 있으므로) 저장되지 않아야 합니다.
+    """
+    monkeypatch.chdir(tmp_path)
+    cache = create_cache(url, maxsize=2, ttl=60)
+    # 무효화하는 다른 요청 (sqlite 캐시는 다른 워커, memory 캐시는 워커 안에서만 공유)
+    other = cache if url == "memory://" else create_cache(url, maxsize=2, ttl=60)
+
+    generation = cache.generation()
+    other.invalidate(3)
+
+    assert not cache.set(("원티드랩", "ko"), "old", tags=(3,), if_generation=generation)
+    assert cache.get(("원티드랩", "ko")) is None
+
+    generation = cache.generation()
+
+    assert cache.set(("원티드랩", "ko"), "new", tags=(3,), if_generation=generation)
+    assert cache.get(("원티드랩", "ko")) == "new"
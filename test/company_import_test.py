@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.infrastructures.migration import upgrade
+from app.schemas.request.company import NewCompanyInSchema
+from app.services.company import CompanyService
+from app.utils.company_import import aiter_companies, aiter_lines
+
+
+async def chunks(*items: bytes):
+    for item in items:
+        yield item
+
+
+def read_companies(*items: bytes, fmt: str = "csv"):
+    async def read():
+        return [
+            company
+            async for company in aiter_companies(aiter_lines(chunks(*items)), fmt=fmt)
+        ]
+
+    return asyncio.run(read())
+
+
+def test_aiter_companies_quoted_csv():
+    """
+    청크, 줄 경계와 관계없이 따옴표 안의 쉼표, 줄바꿈, "" 를 포함한 CSV 레코드를 읽어야 합니다.
+    """
+    companies = read_companies(
+        b"company_ko,company_en,tag_ko,tag_en\r\n",
+        '원티드랩,"Wanted ""Lab"",\n'.encode(),
+        'Korea",태그_4|태그_16,tag_4|tag_16\r\n\r\n라인,'.encode(),
+        b"LINE,,\n",
+    )
+
+    assert [company.company_name for company in companies] == [
+        {"ko": "원티드랩", "en": 'Wanted "Lab",\nKorea'},
+        {"ko": "라인", "en": "LINE"},
+    ]
+    assert [tag.tag_name for tag in companies[0].tags] == [
+        {"ko": "태그_4", "en": "tag_4"},
+        {"ko": "태그_16", "en": "tag_16"},
+    ]
+
+    with pytest.raises(ValueError, match="unterminated"):
+        read_companies(b'company_ko,company_en\n\xec\x9b\x90,"Wanted\n')
+
+
+def test_import_reports_failed_record(db_path):
+    """
+    batch 중 실패한 회사가 있으면 그 앞의 회사까지 추가하고
+    추가된 회사 수와 실패한 회사 순번을 오류로 반환해야 합니다.
+    """
+    engine = create_engine(f"sqlite:///{db_path}")
+    upgrade(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "CREATE TRIGGER reject_company_name BEFORE INSERT ON company_name "
+                "WHEN NEW.name = '실패회사' BEGIN SELECT RAISE(ABORT, 'rejected'); END"
+            )
+        )
+    service = CompanyService(search_backend="like", cache_url="memory://")
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        with pytest.raises(HTTPException) as e:
+            service.import_companies(
+                db=db,
+                companies=(
+                    NewCompanyInSchema(company_name={"ko": name}, tags=[])
+                    for name in ("일괄회사_1", "일괄회사_2", "일괄회사_3", "실패회사")
+                ),
+                batch_size=2,
+            )
+        assert e.value.status_code == 400
+        assert e.value.detail == {
+            "message": "Error importing companies",
+            "imported": 3,
+            "failed_record": 4,
+        }
+        assert service.search_company_by_name(db=db, name="일괄회사_3", lang="ko") == {
+            "company_name": "일괄회사_3",
+            "tags": [],
+        }
+    finally:
+        db.close()
+        engine.dispose()
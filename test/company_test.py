@@ -1,12 +1,16 @@
+import json
+
 import pytest
 
 from fastapi.testclient import TestClient
 from app.main import app
+from app.services.company import AsyncCompanyService, CompanyService
 
 
 @pytest.fixture
 def api():
-    return TestClient(app)
+    with TestClient(app) as client:
+        yield client
 
 
 def test_company_name_autocomplete(api):
@@ -131,6 +135,104 @@ def test_search_tag_name(api):
     ]
 
 
+def test_search_tag_name_language_fallback(api):
+    """
+    태그 검색 시 요청 언어 회사명이 없으면 ko, 그 외 언어 순으로 대체되어야 합니다.
+    """
+    resp = api.get("/tags?query=タグ_22", headers=[("x-wanted-language", "en")])
+
+    assert [company["company_name"] for company in resp.json()] == [
+        "딤딤섬 대구점",
+        "마이셀럽스",
+        "Rejoice Pregnancy",
+        "삼일제약",
+        "투게더앱스",
+    ]
+
+
+def test_search_multiple_tags(api):
+    """
+    tags, op(and / or / not) 로 여러 태그를 조합해 검색할 수 있어야 합니다.
+    태그 추가/삭제는 바로 검색 결과에 반영됩니다.
+    """
+    headers = [("x-wanted-language", "ko")]
+
+    def search(url):
+        return [
+            company["company_name"] for company in api.get(url, headers=headers).json()
+        ]
+
+    assert search("/tags?tags=태그_20,タグ_22&op=and") == []
+    assert search("/tags?tags=태그_4,tag_20") == ["원티드랩"]
+    assert search("/tags?tags=tag_20,タグ_22&op=or") == [
+        "원티드랩",
+        "딤딤섬 대구점",
+        "마이셀럽스",
+        "Rejoice Pregnancy",
+        "삼일제약",
+        "투게더앱스",
+    ]
+
+    resp = api.get("/tags?tags=タグ_22,태그_20&op=not&limit=2", headers=headers)
+    assert [c["company_name"] for c in resp.json()] == ["딤딤섬 대구점", "마이셀럽스"]
+    after = resp.headers["x-next-after"]
+    assert search(f"/tags?tags=タグ_22,태그_20&op=not&limit=2&after={after}") == [
+        "Rejoice Pregnancy",
+        "삼일제약",
+    ]
+
+    api.put(
+        "/companies/삼일제약/tags",
+        json=[{"tag_name": {"ko": "태그_20", "en": "tag_20"}}],
+        headers=headers,
+    )
+    assert search("/tags?tags=태그_20,タグ_22&op=and") == ["삼일제약"]
+    assert "삼일제약" not in search("/tags?tags=タグ_22,태그_20&op=not")
+
+    api.delete("/companies/삼일제약/tags/태그_20", headers=headers)
+    assert search("/tags?tags=태그_20,タグ_22&op=and") == []
+
+
+def test_search_normalized_keys(api):
+    """
+    회사명, 태그 검색은 NFKC 정규화, 대소문자, 공백을 구분하지 않고
+    한글 초성만 입력해도 검색되어야 합니다.
+    """
+    resp = api.get("/search?query=WANTED lab", headers=[("x-wanted-language", "en")])
+    assert resp.json() == [{"company_name": "Wantedlab"}]
+
+    resp = api.get("/search?query=ＷＡＮＴＥＤ", headers=[("x-wanted-language", "ko")])
+    assert resp.json() == [{"company_name": "원티드랩"}]
+
+    resp = api.get("/search?query=ㅇㅌㄷㄹ", headers=[("x-wanted-language", "ko")])
+    assert resp.json() == [{"company_name": "원티드랩"}]
+
+    # 접두어 검색(mode=prefix) 도 같은 검색 키로 비교
+    resp = api.get(
+        "/search?query=ＷＡＮ&mode=prefix", headers=[("x-wanted-language", "ko")]
+    )
+    assert resp.json() == [{"company_name": "원티드랩"}]
+
+    resp = api.get(
+        "/search?query=ㅇㅌ&mode=prefix", headers=[("x-wanted-language", "ko")]
+    )
+    assert resp.json() == [{"company_name": "원티드랩"}]
+
+    resp = api.get(
+        "/search?query=wanted l&mode=prefix", headers=[("x-wanted-language", "en")]
+    )
+    assert resp.json() == [{"company_name": "Wantedlab"}]
+
+    resp = api.get("/tags?query=TAG_ 22", headers=[("x-wanted-language", "ko")])
+    assert [company["company_name"] for company in resp.json()] == [
+        "딤딤섬 대구점",
+        "마이셀럽스",
+        "Rejoice Pregnancy",
+        "삼일제약",
+        "투게더앱스",
+    ]
+
+
 def test_new_tag(api):
     """
     5.  회사 태그 정보 추가
@@ -188,3 +290,389 @@ def test_delete_tag(api):
             "tag_50",
         ],
     }
+
+
+def test_company_search_after_tag_update(api):
+    """
+    7.  회사 태그 정보 변경 후 회사 검색
+    캐시된 회사 정보는 태그 추가/삭제 후 갱신된 값으로 출력되어야 합니다.
+    """
+    resp = api.get("/companies/원티드랩", headers=[("x-wanted-language", "ko")])
+    assert resp.json() == {
+        "company_name": "원티드랩",
+        "tags": ["태그_4", "태그_20", "태그_50"],
+    }
+
+    resp = api.delete(
+        "/companies/원티드랩/tags/태그_50",
+        headers=[("x-wanted-language", "ko")],
+    )
+    assert resp.status_code == 200
+
+    resp = api.get("/companies/원티드랩", headers=[("x-wanted-language", "ko")])
+    assert resp.json() == {
+        "company_name": "원티드랩",
+        "tags": ["태그_4", "태그_20"],
+    }
+
+    resp = api.get("/cache/stats")
+    assert resp.status_code == 200
+    assert resp.json()["invalidations"] >= 1
+
+
+def test_import_companies(api):
+    """
+    8.  회사 일괄 추가
+    JSONL / CSV 본문의 회사들이 한 번에 추가되고 처리량이 반환되어야 합니다.
+    """
+    resp = api.post(
+        "/companies:import",
+        content="\n".join(
+            [
+                '{"company_name": {"ko": "일괄회사_1", "en": "Bulk_1"}, '
+                '"tags": [{"tag_name": {"ko": "태그_1", "en": "tag_1"}}]}',
+                '{"company_name": {"ko": "일괄회사_2", "en": "Bulk_2"}, "tags": []}',
+            ]
+        ),
+        headers=[("content-type", "application/x-ndjson")],
+    )
+    assert resp.status_code == 200
+    assert resp.json()["companies"] == 2
+
+    resp = api.post(
+        "/companies:import",
+        content="company_ko,company_en,tag_ko,tag_en\n"
+        "일괄회사_3,Bulk_3,태그_1|태그_8,tag_1|tag_8\n",
+        headers=[("content-type", "text/csv")],
+    )
+    assert resp.status_code == 200
+    assert resp.json()["companies"] == 1
+
+    resp = api.get("/companies/Bulk_3", headers=[("x-wanted-language", "en")])
+    assert resp.json() == {"company_name": "Bulk_3", "tags": ["tag_1", "tag_8"]}
+
+    resp = api.get("/search?query=Bulk", headers=[("x-wanted-language", "ko")])
+    assert resp.json() == [
+        {"company_name": "일괄회사_1"},
+        {"company_name": "일괄회사_2"},
+        {"company_name": "일괄회사_3"},
+    ]
+
+
+def test_import_companies_quoted_csv(api):
+    """
+    따옴표 안에 쉼표, 줄바꿈이 있는 CSV 필드도 하나의 값으로 읽어야 합니다.
+    """
+    resp = api.post(
+        "/companies:import",
+        content="company_ko,company_en,tag_ko,tag_en\n"
+        '일괄회사_4,"Bulk 4, Inc.\nKorea","태그_1",tag_1\n'
+        "일괄회사_5,Bulk_5,,\n",
+        headers=[("content-type", "text/csv")],
+    )
+    assert resp.status_code == 200
+    assert resp.json()["companies"] == 2
+
+    resp = api.get("/companies/일괄회사_4", headers=[("x-wanted-language", "en")])
+    assert resp.json() == {"company_name": "Bulk 4, Inc.\nKorea", "tags": ["tag_1"]}
+
+
+def test_search_pagination(api):
+    """
+    9.  검색 결과 페이지네이션 / 스트리밍
+    limit, after 로 나눠 조회할 수 있고 다음 페이지 커서는 x-next-after 헤더로 전달됩니다.
+    format=ndjson 이면 한 줄에 회사 하나씩 스트리밍됩니다.
+    """
+    resp = api.get("/tags?query=タグ_22&limit=2", headers=[("x-wanted-language", "ko")])
+    assert [company["company_name"] for company in resp.json()] == [
+        "딤딤섬 대구점",
+        "마이셀럽스",
+    ]
+
+    after = resp.headers["x-next-after"]
+    resp = api.get(
+        f"/tags?query=タグ_22&limit=2&after={after}",
+        headers=[("x-wanted-language", "ko")],
+    )
+    assert [company["company_name"] for company in resp.json()] == [
+        "Rejoice Pregnancy",
+        "삼일제약",
+    ]
+
+    resp = api.get("/search?query=링크&limit=1", headers=[("x-wanted-language", "en")])
+    assert resp.json() == [{"company_name": "Linked Korea Corporation"}]
+    assert resp.headers["x-next-after"] == "1"
+
+    resp = api.get(
+        "/search?query=링크&format=ndjson", headers=[("x-wanted-language", "en")]
+    )
+    assert resp.headers["content-type"] == "application/x-ndjson"
+    assert resp.text.splitlines() == [
+        '{"company_name": "Linked Korea Corporation"}',
+        '{"company_name": "Spilink"}',
+    ]
+
+
+def test_metrics(api):
+    """
+    요청별 처리 시간, SQL 실행 수가 /metrics 와 Server-Timing 헤더로 노출되어야 합니다.
+    """
+    resp = api.get("/companies/원티드랩", headers=[("x-wanted-language", "ko")])
+    assert resp.headers["server-timing"].startswith("app;dur=")
+
+    resp = api.get("/metrics")
+    assert resp.status_code == 200
+    assert (
+        'http_request_duration_seconds_count{method="GET",'
+        'route="/companies/{company_name}",status="200"}'
+    ) in resp.text
+    assert "http_request_db_statements_bucket" in resp.text
+    assert "company_cache_hits" in resp.text
+    assert "app_startup_seconds " in resp.text
+
+
+def test_batch_get_companies(api):
+    """
+    여러 회사명을 한 번에 조회하고, 찾지 못한 회사는 항목별로 사유를 반환해야 합니다.
+    """
+    resp = api.post(
+        "/companies:batch-get",
+        json={"names": ["원티드랩", "없는회사", "Wantedlab", "원티드랩"]},
+        headers=[("x-wanted-language", "ko")],
+    )
+
+    assert resp.status_code == 200
+    results = resp.json()
+    assert [result["name"] for result in results] == [
+        "원티드랩",
+        "없는회사",
+        "Wantedlab",
+        "원티드랩",
+    ]
+    assert results[0]["company"]["company_name"] == "원티드랩"
+    assert results[0] == results[3]
+    assert results[1] == {
+        "name": "없는회사",
+        "company": None,
+        "detail": "Company not found",
+    }
+    assert results[2]["company"] == results[0]["company"]
+
+    resp = api.post("/companies:batch-get", json={"names": []})
+    assert resp.status_code == 422
+
+
+def test_company_name_prefix_autocomplete(api):
+    """
+    mode=prefix 이면 단어 시작이 일치하는 회사를 순위 순으로 limit 개 반환해야 합니다.
+    """
+    resp = api.get(
+        "/search?query=링크&mode=prefix&limit=5", headers=[("x-wanted-language", "ko")]
+    )
+
+    assert resp.status_code == 200
+    assert resp.json() == [{"company_name": "주식회사 링크드코리아"}]
+
+    resp = api.get(
+        "/search?query=li&mode=prefix", headers=[("x-wanted-language", "en")]
+    )
+    assert resp.json() == [
+        {"company_name": "LINE FRESH"},
+        {"company_name": "Linked Korea Corporation"},
+    ]
+
+
+def test_conditional_get(api):
+    """
+    회사 상세, 태그 검색은 ETag 를 반환하고 If-None-Match 가 일치하면 304 로 응답해야 합니다.
+    회사 태그가 바뀌면 ETag 도 바뀌어야 합니다.
+    """
+    headers = [("x-wanted-language", "ko")]
+    resp = api.get("/companies/삼일제약", headers=headers)
+    etag = resp.headers["etag"]
+    assert resp.headers["vary"] == "x-wanted-language"
+
+    resp = api.get("/companies/삼일제약", headers=headers + [("if-none-match", etag)])
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert resp.headers["etag"] == etag
+
+    # 언어별 응답은 ETag 도 다름
+    resp = api.get("/companies/원티드랩", headers=[("x-wanted-language", "ko")])
+    ko_etag = resp.headers["etag"]
+    resp = api.get("/companies/원티드랩", headers=[("x-wanted-language", "en")])
+    assert resp.headers["etag"] not in (etag, ko_etag)
+
+    resp = api.get("/tags?query=タグ_22", headers=headers)
+    tags_etag = resp.headers["etag"]
+    resp = api.get(
+        "/tags?query=タグ_22", headers=headers + [("if-none-match", tags_etag)]
+    )
+    assert resp.status_code == 304
+
+    api.put(
+        "/companies/삼일제약/tags",
+        json=[{"tag_name": {"ko": "태그_77", "en": "tag_77"}}],
+        headers=headers,
+    )
+    resp = api.get("/companies/삼일제약", headers=headers + [("if-none-match", etag)])
+    assert resp.status_code == 200
+    assert "태그_77" in resp.json()["tags"]
+    added_etag = resp.headers["etag"]
+    assert added_etag != etag
+
+    resp = api.get(
+        "/tags?query=タグ_22", headers=headers + [("if-none-match", tags_etag)]
+    )
+    assert resp.status_code == 200
+
+    api.delete("/companies/삼일제약/tags/태그_77", headers=headers)
+    resp = api.get(
+        "/companies/삼일제약", headers=headers + [("if-none-match", added_etag)]
+    )
+    assert resp.status_code == 200
+    assert resp.headers["etag"] not in (etag, added_etag)
+
+
+def test_unknown_company_name_filter(api):
+    """
+    회사명 필터로 404 처리한 조회는 /metrics 에 집계되고, 새로 추가한 회사는 바로 조회되어야 합니다.
+    """
+    headers = [("x-wanted-language", "ko")]
+    assert api.get("/companies/없는회사_1", headers=headers).status_code == 404
+    resp = api.post(
+        "/companies:batch-get", json={"names": ["없는회사_2"]}, headers=headers
+    )
+    assert resp.json()[0]["detail"] == "Company not found"
+
+    metrics = api.get("/metrics").text
+    negatives = next(
+        float(line.split()[1])
+        for line in metrics.splitlines()
+        if line.startswith("company_name_filter_negatives_total ")
+    )
+    assert negatives >= 2
+    assert "company_name_filter_memory_bytes " in metrics
+    assert "company_name_filter_observed_false_positive_rate " in metrics
+
+    api.post(
+        "/companies",
+        json={"company_name": {"ko": "없는회사_1"}, "tags": []},
+        headers=headers,
+    )
+    resp = api.get("/companies/없는회사_1", headers=headers)
+    assert resp.status_code == 200
+
+
+def test_fast_response(api, monkeypatch):
+    """
+    빠른 응답 경로(COMPANY_FAST_RESPONSE)는 기존 응답과 같은 JSON, 헤더를 반환해야 합니다.
+    """
+    headers = [("x-wanted-language", "ko")]
+    urls = ["/search?query=링크", "/search?query=a&limit=3", "/tags?query=タグ_22"]
+    expected = [api.get(url, headers=headers) for url in urls]
+
+    monkeypatch.setattr("app.controllers.company.COMPANY_FAST_RESPONSE", True)
+    monkeypatch.setattr("app.controllers.company.RESPONSE_COMPRESSION_MIN_SIZE", 0)
+    for url, expected_resp in zip(urls, expected):
+        resp = api.get(url, headers=headers + [("accept-encoding", "gzip")])
+        assert resp.status_code == 200
+        assert resp.headers["content-encoding"] == "gzip"
+        assert resp.json() == expected_resp.json()
+        assert resp.headers.get("x-next-after") == expected_resp.headers.get(
+            "x-next-after"
+        )
+
+    # 압축 응답의 ETag 로도 304 응답하고, 304 의 ETag, Vary 는 같은 요청의 200 응답과 같음
+    etag = resp.headers["etag"]
+    assert etag.endswith('-gzip"')
+    resp = api.get(
+        "/tags?query=タグ_22",
+        headers=headers + [("accept-encoding", "gzip"), ("if-none-match", etag)],
+    )
+    assert resp.status_code == 304
+    assert resp.headers["etag"] == etag
+    assert resp.headers["vary"] == "x-wanted-language, accept-encoding"
+
+    resp = api.get(
+        "/tags?query=タグ_22",
+        headers=headers + [("accept-encoding", "identity"), ("if-none-match", etag)],
+    )
+    assert resp.status_code == 304
+    assert resp.headers["etag"] == etag.removesuffix('-gzip"') + '"'
+
+
+def test_tag_write_queue(monkeypatch):
+    """
+    태그 변경 큐(COMPANY_TAG_WRITE_QUEUE)를 사용해도 태그 추가/삭제 응답은 같아야 합니다.
+    """
+    service = AsyncCompanyService(tag_write_queue=True)
+    monkeypatch.setattr("app.controllers.company._company_service", service)
+    monkeypatch.setattr("app.controllers.monitoring._company_service", service)
+
+    # 큐를 쓰면 요청 세션을 만들지 않음 (batch 전용 세션에서 적용)
+    def no_request_session():
+        raise AssertionError("request session opened in queue mode")
+
+    monkeypatch.setattr("app.controllers.company.AsyncSessionLocal", no_request_session)
+    headers = [("x-wanted-language", "ko")]
+    with TestClient(app) as api:
+        resp = api.put(
+            "/companies/원티드랩/tags",
+            json=[{"tag_name": {"ko": "태그_77", "en": "tag_77"}}],
+            headers=headers,
+        )
+        assert resp.status_code == 200
+        assert "태그_77" in resp.json()["tags"]
+
+        resp = api.delete("/companies/원티드랩/tags/태그_77", headers=headers)
+        assert resp.status_code == 200
+        assert "태그_77" not in resp.json()["tags"]
+
+        resp = api.delete("/companies/없는회사/tags/태그_77", headers=headers)
+        assert resp.status_code == 404
+
+        metrics = api.get("/metrics").text
+        assert 'write_queue_batch_size_count{queue="company_tags"} 3' in metrics
+        assert 'write_queue_depth{queue="company_tags"} 0' in metrics
+
+
+def test_search_stream_index(monkeypatch):
+    """
+    색인 검색 방식의 NDJSON 스트리밍은 페이지마다 다시 검색하지 않고 스트림당 한 번 검색한 결과를
+    나눠 보내야 하고, JSON 응답은 limit 이 없어도 최대 COMPANY_SEARCH_MAX_LIMIT 개씩 반환되어야 합니다.
+    """
+    service = AsyncCompanyService(CompanyService(search_backend="index"))
+    monkeypatch.setattr("app.controllers.company._company_service", service)
+    name_index = service._company_service._name_index
+    search = name_index.search
+    searches = []
+
+    def count_search(word):
+        searches.append(word)
+        return search(word)
+
+    monkeypatch.setattr(name_index, "search", count_search)
+
+    async def stream():
+        return [
+            json.loads(line)
+            async for line in service.stream_autocomplete_company_by_word(
+                word="a", lang="en", chunk_size=2
+            )
+        ]
+
+    headers = [("x-wanted-language", "en")]
+    with TestClient(app) as api:
+        companies = api.portal.call(stream)
+        assert searches == ["a"]
+        assert len(companies) > 2
+        assert companies == api.get("/search?query=a", headers=headers).json()
+
+        monkeypatch.setattr("app.controllers.company.COMPANY_SEARCH_MAX_LIMIT", 2)
+        resp = api.get("/search?query=a", headers=headers)
+        assert resp.json() == companies[:2]
+        assert "x-next-after" in resp.headers
+        resp = api.get("/tags?query=タグ_22", headers=headers)
+        assert len(resp.json()) == 2
+        assert "x-next-after" in resp.headers
@@ -0,0 +1,35 @@
+import atexit
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+
+# 저장소에 커밋된 테스트 DB 원본 (테스트는 복사본만 사용하고 원본에는 쓰지 않음)
+PRISTINE_DB = Path(__file__).resolve().parent.parent / "wantedlab.db"
+
+# app 은 import 시점에 DB_URL 을 읽으므로 테스트 모듈 import 전에 임시 복사본으로 지정
+_app_db_dir = tempfile.mkdtemp(prefix="wantedlab-test-")
+atexit.register(shutil.rmtree, _app_db_dir, ignore_errors=True)
+shutil.copy(PRISTINE_DB, Path(_app_db_dir) / "wantedlab.db")
+os.environ["DB_URL"] = f"sqlite:///{Path(_app_db_dir) / 'wantedlab.db'}"
+# 비동기 / 읽기 URL 은 DB_URL 에서 만들도록 해 같은 복사본을 사용
+os.environ.pop("DB_ASYNC_URL", None)
+os.environ.pop("DB_READ_URL", None)
+
+# 배포 단계와 같이 app 시작 전에 마이그레이션 (app 은 기본적으로 시작시 마이그레이션하지 않음)
+from app.infrastructures.migration import upgrade  # noqa: E402
+
+_app_engine = create_engine(os.environ["DB_URL"])
+upgrade(_app_engine, fts=os.environ.get("COMPANY_SEARCH_BACKEND") == "fts")
+_app_engine.dispose()
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """테스트마다 새로 복사한 원본 DB 경로"""
+    db_path = tmp_path / "wantedlab.db"
+    shutil.copy(PRISTINE_DB, db_path)
+    return db_path
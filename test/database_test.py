@@ -0,0 +1,164 @@
+import asyncio
+import os
+import sqlite3
+import subprocess
+import sys
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.infrastructures.database import configure_sqlite_engine
+from app.infrastructures.migration import upgrade
+
+
+def read_while_writing(engine):
+    """쓰기 트랜잭션이 배타 잠금을 잡고 있는 동안 다른 연결에서 회사 수 조회"""
+    writer = engine.raw_connection()
+    reader = engine.raw_connection()
+    try:
+        writer.driver_connection.isolation_level = None
+        before = reader.execute("SELECT count(*) FROM company").fetchone()[0]
+
+        writer.execute("BEGIN EXCLUSIVE")
+        writer.execute("INSERT INTO company (company_name) VALUES ('쓰기 중')")
+        try:
+            during = reader.execute("SELECT count(*) FROM company").fetchone()[0]
+        finally:
+            writer.execute("COMMIT")
+        after = reader.execute("SELECT count(*) FROM company").fetchone()[0]
+    finally:
+        reader.close()
+        writer.close()
+    return before, during, after
+
+
+def test_wal_readers_not_blocked_by_writer(db_path):
+    """
+    wal 프로필에서는 쓰기 트랜잭션 중에도 다른 연결의 읽기가 대기 없이 이전 데이터를 읽어야 합니다.
+    """
+    engine = configure_sqlite_engine(
+        create_engine(f"sqlite:///{db_path}", connect_args={"timeout": 0.1}), "wal"
+    )
+    try:
+        before, during, after = read_while_writing(engine)
+    finally:
+        engine.dispose()
+
+    assert during == before
+    assert after == before + 1
+
+
+def test_rollback_journal_readers_blocked_by_writer(db_path):
+    """
+    기본(rollback journal) 프로필에서는 같은 상황에서 읽기가 잠금에 막힙니다.
+    """
+    engine = configure_sqlite_engine(
+        create_engine(f"sqlite:///{db_path}", connect_args={"timeout": 0.1}),
+        "default",
+    )
+    try:
+        with pytest.raises(sqlite3.OperationalError, match="locked"):
+            read_while_writing(engine)
+    finally:
+        engine.dispose()
+
+
+def test_read_only_engine_rejects_writes(db_path):
+    """
+    읽기 전용(query_only) 연결은 조회만 가능하고 쓰기는 거부해야 합니다.
+    """
+    engine = configure_sqlite_engine(
+        create_engine(f"sqlite:///{db_path}"), "wal", read_only=True
+    )
+    try:
+        with engine.connect() as connection:
+            count = connection.scalar(text("SELECT count(*) FROM company"))
+            with pytest.raises(OperationalError, match="readonly"):
+                connection.execute(
+                    text("INSERT INTO company (company_name) VALUES ('읽기 전용')")
+                )
+            assert connection.scalar(text("SELECT count(*) FROM company")) == count
+    finally:
+        engine.dispose()
+
+
+def test_wal_profile_applies_to_async_engine(db_path):
+    """
+    aiosqlite 연결에도 같은 PRAGMA 가 적용되어야 합니다.
+    """
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    configure_sqlite_engine(engine.sync_engine, "wal")
+
+    async def pragmas():
+        async with engine.connect() as connection:
+            journal_mode = await connection.scalar(text("PRAGMA journal_mode"))
+            synchronous = await connection.scalar(text("PRAGMA synchronous"))
+        await engine.dispose()
+        return journal_mode, synchronous
+
+    assert asyncio.run(pragmas()) == ("wal", 1)
+
+
+def test_app_import_without_engine():
+    """
+    app import 시점에는 engine 을 만들지 않으므로 DB_URL 없이도 import 할 수 있어야 합니다.
+    """
+    env = {name: value for name, value in os.environ.items() if name != "DB_URL"}
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import app.main\n"
+            "from app.infrastructures.database import get_engine\n"
+            "assert get_engine.cache_info().currsize == 0",
+        ],
+        env=env,
+        check=True,
+    )
+
+
+def test_upgrade_deletes_duplicates_before_unique_indexes(db_path):
+    """
+    unique 인덱스가 없던 DB 에 중복 행이 있어도 마이그레이션은 ID 가 가장 작은 행만 남기고
+    삭제되는 태그 카테고리를 참조하던 태그는 남는 카테고리를 참조해야 합니다.
+    """
+    connection = sqlite3.connect(db_path)
+    try:
+        connection.execute(
+            "INSERT INTO company_tag_category (id, category_name) VALUES (5, '태그_4')"
+        )
+        connection.executemany(
+            "INSERT INTO company_tag (id, c_id, lang, tag, tag_category_id) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [(100, 3, "ko", "태그_16", 2), (101, 1, "ja", "タグ_4", 5)],
+        )
+        connection.commit()
+    finally:
+        connection.close()
+
+    engine = create_engine(f"sqlite:///{db_path}")
+    try:
+        created = upgrade(engine)
+    finally:
+        engine.dispose()
+    assert "uq_company_tag_c_id_lang_tag" in created
+    assert "ix_company_tag_category_category_name" in created
+
+    connection = sqlite3.connect(db_path)
+    try:
+        assert connection.execute(
+            "SELECT id FROM company_tag_category WHERE category_name = '태그_4'"
+        ).fetchall() == [(1,)]
+        assert connection.execute(
+            "SELECT id FROM company_tag WHERE c_id = 3 AND tag = '태그_16'"
+        ).fetchall() == [(2,)]
+        assert connection.execute(
+            "SELECT tag_category_id FROM company_tag WHERE id = 101"
+        ).fetchone() == (1,)
+        assert connection.execute(
+            "SELECT tags FROM company_profile WHERE c_id = 1 AND lang = 'ja'"
+        ).fetchone() == ('["タグ_4"]',)
+    finally:
+        connection.close()
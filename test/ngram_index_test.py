@@ -0,0 +1,61 @@
+from app.indexes.ngram import CompanyNameNgramIndex
+
+
+def test_ngram_index_search():
+    """
+    n-gram 색인 부분 문자열 검색
+    어느 언어든 회사명 일부가 포함되면 검색되고, 요청 언어의 회사명으로 반환되어야 합니다.
+    SQLite LIKE 와 같이 영문 대소문자는 구분하지 않습니다.
+    """
+    index = CompanyNameNgramIndex()
+    index.build(
+        [
+            (1, "ko", "주식회사 링크드코리아"),
+            (1, "en", "Linked Korea Corporation"),
+            (2, "ko", "스피링크"),
+            (2, "en", "Spilink"),
+            (3, "en", "Wantedlab"),
+        ]
+    )
+
+    assert index.search("링크") == [1, 2]
+    assert index.search("LINK") == [1, 2]
+    assert index.search("spil") == [2]
+    assert index.search("링크드코리") == [1]
+    assert index.search("없는회사") == []
+    assert index.search("") == [1, 2, 3]
+    assert index.get_names_by_ids_with_lang([1, 2, 3], "en") == [
+        "Linked Korea Corporation",
+        "Spilink",
+        "Wantedlab",
+    ]
+
+    index.replace_company(3, {"ko": "원티드랩", "en": "Wanted Careers"})
+
+    assert index.search("lab") == []
+    assert index.search("티드") == [3]
+    assert index.get_names_by_ids_with_lang([3], "ko") == ["원티드랩"]
+
+
+def test_ngram_index_search_key():
+    """
+    n-gram 색인은 DB 검색 키와 같이 NFKC, casefold, 공백 제거한 회사명으로 비교하고
+    초성 검색어는 초성 검색 키로 비교해야 합니다.
+    """
+    index = CompanyNameNgramIndex()
+    index.build(
+        [
+            (1, "ko", "주식회사 링크드코리아"),
+            (2, "ko", "스피링크"),
+            (3, "ko", "원티드랩"),
+            (3, "en", "Wanted Lab"),
+        ]
+    )
+
+    assert index.search("wantedlab") == [3]
+    assert index.search("ＷＡＮＴＥＤ") == [3]
+    assert index.search("링크 드") == [1]
+    assert index.search("ㅇㅌㄷ") == [3]
+    assert index.search("ㄹㅋ") == [1, 2]
+    assert index.search("링ㅋ") == [1, 2]
+    assert index.search("ㅋㄹ") == [1]
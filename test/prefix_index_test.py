@@ -0,0 +1,117 @@
+from app.indexes.prefix import CompanyNamePrefixIndex
+
+
+def test_prefix_index_search():
+    """
+    접두어 색인 자동완성
+    회사명의 단어 시작 부분이 일치하는 회사를 일치 위치, 회사명 길이 순으로 limit 개 반환해야 합니다.
+    """
+    index = CompanyNamePrefixIndex(top_k=2)
+    index.build(
+        [
+            (1, "ko", "원티드랩 코리아"),
+            (1, "en", "Wantedlab Korea"),
+            (2, "ko", "원티드"),
+            (3, "ko", "(주)코리아 원티드랩"),
+            (4, "ko", "원"),
+            (5, "en", "Korea Wanted"),
+        ]
+    )
+
+    assert index.search("원티", lang="ko", limit=10) == [
+        "원티드",
+        "원티드랩 코리아",
+        "(주)코리아 원티드랩",
+    ]
+    assert index.search("원", lang="ko", limit=3) == ["원", "원티드", "원티드랩 코리아"]
+    assert index.search("원", lang="ko", limit=1) == ["원"]
+    assert index.search("KOR", lang="en", limit=10) == [
+        "Korea Wanted",
+        "Wantedlab Korea",
+    ]
+    assert index.search("wanted", lang="ko", limit=10) == ["원티드랩 코리아"]
+    assert index.search("티드", lang="ko", limit=10) == []
+    assert index.search("", lang="ko", limit=10) == []
+
+    index.replace_company(6, {"ko": "원티"})
+
+    assert index.search("원티", lang="ko", limit=2) == ["원티", "원티드"]
+    assert index.search("원", lang="ko", limit=2) == ["원", "원티"]
+
+
+def test_prefix_index_search_key():
+    """
+    접두어 색인도 DB 검색 키와 같이 NFKC, casefold, 공백 제거한 회사명으로 비교하고
+    초성 검색어는 초성 검색 키로 비교해야 합니다.
+    """
+    index = CompanyNamePrefixIndex()
+    index.build(
+        [
+            (1, "ko", "주식회사 링크드코리아"),
+            (2, "ko", "스피링크"),
+            (3, "ko", "원티드랩"),
+            (3, "en", "Wanted Lab"),
+        ]
+    )
+
+    assert index.search("ＷＡＮ", lang="ko", limit=10) == ["원티드랩"]
+    assert index.search("wantedl", lang="en", limit=10) == ["Wanted Lab"]
+    assert index.search("LAB", lang="en", limit=10) == ["Wanted Lab"]
+    assert index.search("ㅇㅌ", lang="ko", limit=10) == ["원티드랩"]
+    assert index.search("링ㅋ", lang="ko", limit=10) == ["주식회사 링크드코리아"]
+    assert index.search("ㅋㄹ", lang="ko", limit=10) == []
+
+    index.replace_company(4, {"ko": "원티 랩스"})
+    assert index.search("ㅇㅌ", lang="ko", limit=10) == ["원티드랩", "원티 랩스"]
+    assert index.search("원티랩", lang="ko", limit=10) == ["원티 랩스"]
+    assert index.search("ㄹㅅ", lang="ko", limit=10) == ["원티 랩스"]
+
+
+def test_prefix_index_replace_company():
+    """
+    이미 색인된 회사의 회사명을 바꾸면 색인을 다시 생성하지 않고 그 회사 항목만 교체해야 합니다.
+    """
+    index = CompanyNamePrefixIndex(top_k=2)
+    index.build(
+        [
+            (1, "ko", "원티드랩"),
+            (1, "en", "Wantedlab"),
+            (2, "ko", "원티드"),
+            (3, "ko", "원티드 코리아"),
+        ],
+        fingerprint=1,
+    )
+    assert index.search("원티", lang="ko", limit=3) == [
+        "원티드",
+        "원티드랩",
+        "원티드 코리아",
+    ]
+
+    index.replace_company(1, {"ko": "코리아랩", "en": "Korea Lab"})
+
+    assert index.fingerprint == 1
+    assert index.search("원티", lang="ko", limit=3) == ["원티드", "원티드 코리아"]
+    assert index.search("코리", lang="ko", limit=3) == ["코리아랩", "원티드 코리아"]
+    assert index.search("want", lang="ko", limit=3) == []
+    assert index.search("lab", lang="en", limit=3) == ["Korea Lab"]
+
+
+def test_prefix_index_search_other_language():
+    """
+    요청 언어 회사명이 없는 회사가 상위 목록을 차지해도 그 다음 순위 회사로 limit 개를 채워야 합니다.
+    """
+    index = CompanyNamePrefixIndex(top_k=2)
+    index.build(
+        [
+            (1, "en", "Want"),
+            (2, "en", "Wanted"),
+            (3, "en", "Wantedly"),
+            (4, "en", "Wanted Lab"),
+            (4, "ko", "원티드랩"),
+            (5, "en", "Wanted Korea"),
+            (5, "ko", "원티드코리아"),
+        ]
+    )
+
+    assert index.search("wan", lang="ko", limit=2) == ["원티드랩", "원티드코리아"]
+    assert index.search("wan", lang="ko", limit=1) == ["원티드랩"]
@@ -0,0 +1,158 @@
+import pytest
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import sessionmaker
+
+from app.entities.company import CompanyTag
+from app.infrastructures.migration import upgrade
+from app.repositories.company import CompanyRepository
+from app.schemas.request.company import NewCompanyInSchema, NewCompanyTagNameInSchema
+
+TABLES = ("company", "company_name", "company_tag", "company_tag_category")
+# 요청 처리 중 조회하는 테이블 (행 수가 회사 수에 비례)
+HOT_LOOKUP_TABLES = ("company_name", "company_tag")
+# 색인 생성 / 변경 확인용으로 전체 행을 읽는 쿼리 (요청마다 실행되지 않음)
+FULL_SCAN_QUERIES = {
+    "get_all_company_names",
+    "get_all_company_tag_categories",
+    "get_company_tag_fingerprint",
+}
+
+
+@pytest.fixture
+def engine(db_path):
+    engine = create_engine(f"sqlite:///{db_path}")
+    upgrade(engine)
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+def run_repository_queries(db, on_query=lambda name: None):
+    """CompanyRepository 의 쿼리를 모두 실행 (on_query 로 실행할 메서드 이름 전달)"""
+    repo = CompanyRepository()
+    tags = [NewCompanyTagNameInSchema(tag_name={"ko": "태그_4", "en": "tag_4"})]
+
+    def run(method, **kwargs):
+        on_query(method)
+        result = getattr(repo, method)(db=db, **kwargs)
+        # Query, Result 는 결과를 읽어야 실행되므로 모두 읽음
+        return result.all() if hasattr(result, "all") else result
+
+    run("get_company_ids_by_word", search="링크", after=0, limit=10)
+    run("get_all_company_names")
+    run("get_company_name_fingerprint")
+    run("get_company_ids_by_tag", tag="タグ_22")
+    run("get_all_company_tag_categories")
+    run("get_company_tag_categories_by_id", c_id=3)
+    run("get_company_tag_fingerprint")
+    run("get_company_names_by_ids_with_fallback", c_ids=[3, 4], lang="en")
+    run("get_company_names_by_tag_with_lang", tag="タグ_22", lang="en")
+    run("get_company_names_by_ids_with_lang", c_ids=[1, 2], lang="ko")
+    run("get_company_id_by_name", name="원티드랩")
+    run("get_company_profile_by_id_with_lang", c_id=3, lang="ko")
+    run("get_company_version_by_name", name="원티드랩")
+    run(
+        "get_company_profiles_by_names_with_lang",
+        names=["원티드랩", "Wantedlab", "없는회사"],
+        lang="ko",
+    )
+    run("get_tag_category_id_by_tag", c_id=3, tag="태그_4")
+    company_id = run("insert_new_company", company_name={"ko": "원티드랩"})
+    run(
+        "insert_new_company_name",
+        c_id=company_id,
+        company_name={"ko": "원티드랩", "en": "Wantedlab"},
+    )
+    run("insert_new_tag_category", tags=tags)
+    run("upsert_company_new_tags_by_id", c_id=company_id, tags=tags)
+    run("refresh_company_profiles", c_ids=[company_id])
+    run("delete_company_tag_by_tag_category_id", c_id=company_id, tag_category_id=1)
+    run(
+        "bulk_upsert_companies",
+        companies=[
+            NewCompanyInSchema(company_name={"ko": "원티드랩"}, tags=tags),
+            NewCompanyInSchema(company_name={"ko": "일괄회사"}, tags=tags),
+        ],
+    )
+
+
+def test_repository_queries_use_indexes(engine):
+    """
+    CompanyRepository 의 모든 조회/삭제 쿼리는 EXPLAIN QUERY PLAN 상 인덱스를 사용해야 하고
+    요청마다 실행되는 조회는 회사명/태그 테이블을 (커버링 인덱스로도) 전체 스캔하지 않아야 합니다.
+    """
+    statements = []
+    query = [None]
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "DELETE", "UPDATE")):
+            statements.append(
+                (query[0], statement, parameters[0] if executemany else parameters)
+            )
+
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        run_repository_queries(db, on_query=lambda name: query.__setitem__(0, name))
+    finally:
+        db.close()
+    event.remove(engine, "before_cursor_execute", capture)
+
+    assert {name for name, _, _ in statements} >= FULL_SCAN_QUERIES | {
+        "get_company_ids_by_word",
+        "get_company_names_by_ids_with_lang",
+    }
+    with engine.connect() as connection:
+        cursor = connection.connection.cursor()
+        for name, statement, parameters in statements:
+            plan = [
+                row[3]
+                for row in cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            ]
+            for detail in plan:
+                if not detail.startswith(("SCAN", "SEARCH")):
+                    continue
+                table = detail.split()[1]
+                if table in TABLES:
+                    assert "INDEX" in detail or "PRIMARY KEY" in detail, (
+                        name,
+                        statement,
+                        plan,
+                    )
+                if name not in FULL_SCAN_QUERIES and table in HOT_LOOKUP_TABLES:
+                    assert not detail.startswith("SCAN"), (name, statement, plan)
+
+
+def test_upsert_company_tags_statement_count(engine):
+    """
+    태그 추가는 태그/언어 수와 무관하게 고정된 개수의 SQL 로 처리되어야 합니다.
+    """
+    repo = CompanyRepository()
+    tags = [
+        NewCompanyTagNameInSchema(
+            tag_name={"ko": f"태그_{i}", "en": f"tag_{i}", "ja": f"タグ_{i}"}
+        )
+        for i in range(20)
+    ]
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        assert repo.insert_new_tag_category(db=db, tags=tags)
+        assert repo.upsert_company_new_tags_by_id(db=db, c_id=3, tags=tags)
+        event.remove(engine, "before_cursor_execute", capture)
+
+        company_tags = db.scalars(
+            select(CompanyTag.tag).where(CompanyTag.c_id == 3, CompanyTag.lang == "ja")
+        ).all()
+        assert sorted(company_tags) == sorted(f"タグ_{i}" for i in range(20))
+    finally:
+        db.close()
+
+    # 카테고리 INSERT, 카테고리 SELECT, 기존 태그 SELECT, 태그 INSERT, 회사 버전 UPDATE
+    assert len(statements) == 5
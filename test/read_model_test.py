@@ -0,0 +1,120 @@
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from app.entities.company import CompanyProfile
+from app.infrastructures.migration import upgrade
+from app.infrastructures.read_model import rebuild_company_profiles
+from app.repositories.company import CompanyRepository
+from app.schemas.request.company import NewCompanyInSchema, NewCompanyTagNameInSchema
+from app.services.company import CompanyService
+
+
+@pytest.fixture
+def engine(db_path):
+    engine = create_engine(f"sqlite:///{db_path}")
+    upgrade(engine)
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+def company_profiles(connection):
+    return connection.execute(
+        select(
+            CompanyProfile.c_id,
+            CompanyProfile.lang,
+            CompanyProfile.name,
+            CompanyProfile.fallback_name,
+            CompanyProfile.tags,
+        ).order_by(CompanyProfile.c_id, CompanyProfile.lang)
+    ).all()
+
+
+def test_company_profiles_follow_writes(engine):
+    """
+    쓰기 시점에 갱신된 조회용 프로필은 전체 재생성 결과와 같아야 합니다.
+    """
+    service = CompanyService(search_backend="like", cache_url="memory://")
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        service.add_new_company(
+            db=db,
+            company=NewCompanyInSchema(
+                company_name={"tw": "LINE FRESH"},
+                tags=[
+                    NewCompanyTagNameInSchema(tag_name={"ko": "태그_1", "tw": "tag_1"})
+                ],
+            ),
+            lang="tw",
+        )
+        service.add_company_new_tag(
+            db=db,
+            tags=[NewCompanyTagNameInSchema(tag_name={"ko": "태그_8", "tw": "tag_8"})],
+            name="LINE FRESH",
+            lang="tw",
+        )
+        service.delete_company_tag(db=db, tag="태그_1", name="LINE FRESH", lang="tw")
+
+        assert service.search_company_by_name(db=db, name="LINE FRESH", lang="tw") == {
+            "company_name": "LINE FRESH",
+            "tags": ["tag_8"],
+        }
+        with pytest.raises(Exception, match="Company name not found"):
+            service.search_company_by_name(db=db, name="LINE FRESH", lang="en")
+    finally:
+        db.close()
+
+    with engine.begin() as connection:
+        incremental = company_profiles(connection)
+        rebuild_company_profiles(connection)
+        assert company_profiles(connection) == incremental
+
+    assert incremental[-4:] == [
+        (9, "en", None, "LINE FRESH", []),
+        (9, "ja", None, "LINE FRESH", []),
+        (9, "ko", None, "LINE FRESH", ["태그_8"]),
+        (9, "tw", "LINE FRESH", "LINE FRESH", ["tag_8"]),
+    ]
+
+
+def test_profile_cache_not_filled_with_invalidated_read(engine, monkeypatch):
+    """
+    회사 상세 조회 중 다른 요청이 그 회사를 변경(캐시 무효화)하면
+    조회한 값은 캐시되지 않고 다음 조회는 변경된 값을 반환해야 합니다.
+    """
+    service = CompanyService(search_backend="like", cache_url="memory://")
+    writer = CompanyService(search_backend="like", cache_url="memory://")
+    writer._profile_cache = service._profile_cache
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    write_db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    get_profile = service._company_repo.get_company_profile_by_id_with_lang
+
+    def get_profile_during_write(db, c_id, lang):
+        profile = get_profile(db=db, c_id=c_id, lang=lang)
+        # 프로필을 읽은 직후 다른 요청이 태그를 추가하고 캐시를 무효화
+        writer.add_company_new_tag(
+            db=write_db,
+            tags=[NewCompanyTagNameInSchema(tag_name={"ko": "태그_50"})],
+            name="원티드랩",
+            lang="ko",
+        )
+        return profile
+
+    try:
+        # 조회하는 서비스의 저장소만 교체 (CompanyService._company_repo 는 클래스 속성)
+        repo = CompanyRepository()
+        repo.get_company_profile_by_id_with_lang = get_profile_during_write
+        monkeypatch.setattr(service, "_company_repo", repo)
+        stale = service.search_company_by_name(db=db, name="원티드랩", lang="ko")
+        monkeypatch.undo()
+        db.rollback()
+
+        assert "태그_50" not in stale["tags"]
+        assert "태그_50" in (
+            service.search_company_by_name(db=db, name="원티드랩", lang="ko")["tags"]
+        )
+    finally:
+        db.close()
+        write_db.close()
@@ -0,0 +1,44 @@
+import gzip
+import json
+
+from app.utils.etag import etag_matches
+from app.utils.response import (
+    CompressedJSONResponse,
+    dumps_json,
+    negotiate_encoding,
+)
+
+
+def test_negotiate_encoding():
+    """
+    Accept-Encoding 의 q 값이 가장 높은 지원 압축 방식을 골라야 합니다.
+    """
+    assert negotiate_encoding(None) is None
+    assert negotiate_encoding("identity") is None
+    assert negotiate_encoding("gzip, deflate") == "gzip"
+    assert negotiate_encoding("gzip;q=0") is None
+    assert negotiate_encoding("*;q=0.5") is not None
+    assert negotiate_encoding("deflate, *;q=0") is None
+
+
+def test_compressed_json_response():
+    """
+    min_size 이상인 본문만 압축하고, 압축된 응답의 ETag 는 인코딩별로 구분되어야 합니다.
+    """
+    companies = [{"company_name": f"회사_{i}"} for i in range(100)]
+    assert json.loads(dumps_json(companies)) == companies
+
+    response = CompressedJSONResponse(
+        companies, accept_encoding="gzip", headers={"etag": '"abc"'}
+    )
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"] == '"abc-gzip"'
+    assert response.headers["vary"] == "accept-encoding"
+    assert json.loads(gzip.decompress(response.body)) == companies
+    assert etag_matches(response.headers["etag"], '"abc"')
+
+    response = CompressedJSONResponse(
+        companies[:1], accept_encoding="gzip", headers={"etag": '"abc"'}
+    )
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"] == '"abc"'
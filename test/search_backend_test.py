@@ -0,0 +1,56 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.infrastructures.migration import upgrade
+from app.services.company import CompanyService
+
+
+@pytest.fixture
+def db(db_path):
+    engine = create_engine(f"sqlite:///{db_path}")
+    upgrade(engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+@pytest.mark.parametrize("search_backend", ["index", "fts", "like"])
+def test_search_backends(db, search_backend):
+    """
+    검색 방식(index / fts / like)과 무관하게 같은 결과를 반환해야 합니다.
+    """
+    service = CompanyService(search_backend=search_backend)
+
+    assert service.autocomplete_company_by_word(db=db, word="링크", lang="ko") == [
+        {"company_name": "주식회사 링크드코리아"},
+        {"company_name": "스피링크"},
+    ]
+    assert service.autocomplete_company_by_word(db=db, word="linked", lang="en") == [
+        {"company_name": "Linked Korea Corporation"},
+    ]
+    assert [
+        c["company_name"]
+        for c in service.search_company_by_tag(db=db, tag="タグ_22", lang="ko")
+    ] == ["딤딤섬 대구점", "마이셀럽스", "Rejoice Pregnancy", "삼일제약", "투게더앱스"]
+
+
+def test_fts_follows_writes(db):
+    """
+    FTS 테이블은 트리거를 통해 회사명/태그 변경을 따라가야 합니다.
+    """
+    service = CompanyService(search_backend="fts")
+    assert service.autocomplete_company_by_word(db=db, word="Fresh", lang="en") == []
+
+    class NewCompany:
+        company_name = {"ko": "라인 프레쉬", "en": "LINE FRESH"}
+        tags = []
+
+    service.add_new_company(db=db, company=NewCompany(), lang="ko")
+
+    assert service.autocomplete_company_by_word(db=db, word="Fresh", lang="en") == [
+        {"company_name": "LINE FRESH"},
+    ]
@@ -0,0 +1,49 @@
+import sqlite3
+
+from sqlalchemy import create_engine
+
+from app.infrastructures.migration import upgrade
+from app.utils.search_key import (
+    chosung_search_key,
+    normalize_search_key,
+    query_search_key,
+)
+
+
+def test_search_keys():
+    """
+    검색 키는 NFKC 정규화, casefold, 공백 제거한 값이고
+    초성 검색 키는 한글 음절을 초성으로 바꾼 값이어야 합니다.
+    """
+    assert normalize_search_key("Wanted Lab") == "wantedlab"
+    assert normalize_search_key("ＷＡＮＴＥＤ　ＬＡＢ") == "wantedlab"
+    assert normalize_search_key("Straße") == "strasse"
+    assert chosung_search_key("원티드랩 Lab") == "ᄋᄐᄃᄅlab"
+    assert query_search_key("Wanted Lab") == ("wantedlab", False)
+    # 호환 자모 (ㅇ) 로 입력한 초성, 음절이 섞인 검색어는 초성 검색 키로 비교
+    assert query_search_key("ㅇㅌㄷ") == ("ᄋᄐᄃ", True)
+    assert query_search_key("원ㅌ") == ("ᄋᄐ", True)
+
+
+def test_upgrade_backfills_search_keys(db_path):
+    """
+    검색 키 컬럼이 없던 DB 를 마이그레이션하면 기존 행의 검색 키가 채워져야 합니다.
+    """
+    engine = create_engine(f"sqlite:///{db_path}")
+    try:
+        upgrade(engine)
+    finally:
+        engine.dispose()
+
+    connection = sqlite3.connect(db_path)
+    try:
+        assert connection.execute(
+            "SELECT lang, search_key, chosung_key FROM company_name "
+            "WHERE c_id = 3 ORDER BY lang"
+        ).fetchall() == [("en", "wantedlab", "wantedlab"), ("ko", "원티드랩", "ᄋᄐᄃᄅ")]
+        assert connection.execute(
+            "SELECT count(*) FROM company_tag "
+            "WHERE search_key IS NULL OR chosung_key IS NULL"
+        ).fetchone() == (0,)
+    finally:
+        connection.close()
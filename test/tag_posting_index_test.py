@@ -0,0 +1,113 @@
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.indexes.tag_posting import CompanyTagPostingIndex
+from app.infrastructures.migration import upgrade
+from app.schemas.request.company import NewCompanyTagNameInSchema
+from app.services.company import CompanyService
+from app.utils.enum import Language, TagOperator
+
+
+def build_index():
+    index = CompanyTagPostingIndex()
+    index.build(
+        [
+            (1, 1, "태그_4", "ᄐᄀ_4"),
+            (1, 1, "tag_4", "tag_4"),
+            (1, 2, "태그_16", "ᄐᄀ_16"),
+            (2, 1, "태그_4", "ᄐᄀ_4"),
+            (3, 2, "tag_16", "tag_16"),
+            (3, 3, "태그_20", "ᄐᄀ_20"),
+        ]
+    )
+    return index
+
+
+def test_tag_posting_index_search():
+    """
+    태그 리스트를 and / or / not 으로 조합한 회사 IDs 를 반환해야 합니다.
+    같은 카테고리의 언어별 태그는 같은 회사 리스트로 검색됩니다.
+    """
+    index = build_index()
+
+    assert index.search(["tag_4"], TagOperator.intersection) == [1, 2]
+    assert index.search(["TAG_4", "tag_16"], TagOperator.intersection) == [1]
+    assert index.search(["태그_4", "태그_20"], TagOperator.union) == [1, 2, 3]
+    assert index.search(["태그_4", "태그_16"], TagOperator.difference) == [2]
+    assert index.search(["태그_4", "없는태그"], TagOperator.intersection) == []
+    assert index.search(["태그_4", "없는태그"], TagOperator.union) == [1, 2]
+    assert index.search([], TagOperator.union) == []
+    assert index.stats() == {"categories": 3, "postings": 5, "memory_bytes": 20}
+
+
+def test_tag_posting_index_replace_company():
+    """
+    회사의 태그가 바뀌면 재생성 없이 posting 에 반영되어야 합니다.
+    """
+    index = build_index()
+
+    index.replace_company(2, [(2, "태그_16", "ᄐᄀ_16"), (4, "태그_99", "ᄐᄀ_99")])
+    assert index.search(["태그_4"], TagOperator.union) == [1]
+    assert index.search(["태그_16"], TagOperator.union) == [1, 2, 3]
+    assert index.search(["태그_99"], TagOperator.union) == [2]
+
+    index.replace_company(1, [])
+    assert index.search(["태그_16"], TagOperator.union) == [2, 3]
+
+
+def test_tag_posting_index_tags_without_category():
+    """
+    ko 태그명이 없어 카테고리가 없는 태그끼리는 posting 을 공유하지 않아야 합니다.
+    """
+    index = CompanyTagPostingIndex()
+    index.build(
+        [(1, 1, "태그_4", "ᄐᄀ_4"), (2, -1, "foo", "foo"), (3, -1, "bar", "bar")]
+    )
+
+    assert index.search(["foo"], TagOperator.union) == [2]
+    assert index.search(["foo", "bar"], TagOperator.intersection) == []
+
+    index.replace_company(1, [(-1, "foo", "foo")])
+    assert index.search(["foo"], TagOperator.union) == [1, 2]
+    assert index.search(["bar"], TagOperator.union) == [3]
+
+
+def test_company_search_by_tags_without_category(db_path):
+    """
+    카테고리가 없는 태그로도 다중 태그 검색 결과가 정확해야 합니다.
+    (색인 생성 후 쓰기 반영, 전체 재생성 모두)
+    """
+    engine = create_engine(f"sqlite:///{db_path}")
+    upgrade(engine)
+    service = CompanyService(search_backend="like", cache_url="memory://")
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+
+    def search(service, tags, op):
+        return service.search_company_by_tags_page(
+            db=db, tags=tags, op=op, lang=Language.ko
+        )[0]
+
+    try:
+        assert search(service, ["foo"], TagOperator.union) == []
+        for name, tag in (("원티드랩", "foo"), ("스피링크", "bar")):
+            service.add_company_new_tag(
+                db=db,
+                tags=[NewCompanyTagNameInSchema(tag_name={"en": tag})],
+                name=name,
+                lang=Language.ko,
+            )
+
+        for searcher in (
+            service,
+            CompanyService(search_backend="like", cache_url="memory://"),
+        ):
+            assert search(searcher, ["foo"], TagOperator.union) == [
+                {"company_name": "원티드랩"}
+            ]
+            assert search(searcher, ["bar"], TagOperator.union) == [
+                {"company_name": "스피링크"}
+            ]
+            assert search(searcher, ["foo", "bar"], TagOperator.intersection) == []
+    finally:
+        db.close()
+        engine.dispose()
@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.infrastructures.metrics import RequestStats, _request_stats
+from app.infrastructures.migration import upgrade
+from app.infrastructures.write_queue import GroupCommitQueue
+from app.schemas.request.company import NewCompanyTagNameInSchema
+from app.services.company import CompanyService
+
+
+@pytest.fixture
+def engine(db_path):
+    engine = create_engine(f"sqlite:///{db_path}")
+    upgrade(engine)
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+def test_group_commit_queue():
+    """
+    동시에 들어온 쓰기 작업은 max_batch 단위로 묶여 적용되고,
+    호출측은 각자의 결과 (또는 예외) 를 받아야 합니다.
+    """
+    batches = []
+
+    async def apply_batch(items):
+        batches.append(items)
+        return [ValueError(item) if item < 0 else item * 2 for item in items]
+
+    async def run():
+        queue = GroupCommitQueue("test", apply_batch, max_batch=4, max_wait=0.01)
+        results = await asyncio.gather(
+            *(queue.submit(item) for item in [1, 2, -3, 4, 5]),
+            return_exceptions=True,
+        )
+        await queue.stop()
+        return queue, results
+
+    queue, results = asyncio.run(run())
+    assert results[:2] == [2, 4] and results[3:] == [8, 10]
+    assert isinstance(results[2], ValueError)
+    assert batches == [[1, 2, -3, 4], [5]]
+    assert queue.depth == 0
+    assert 'write_queue_batch_size_count{queue="test"} 2' in queue.render()
+
+
+def test_group_commit_queue_context():
+    """
+    worker 는 처음 submit 한 요청의 context 를 물려받지 않아야 합니다.
+    (batch 의 SQL 이 그 요청의 SQL 수, 시간으로 집계되지 않도록)
+    """
+    request_stats = []
+
+    async def apply_batch(items):
+        request_stats.append(_request_stats.get())
+        return items
+
+    async def run():
+        queue = GroupCommitQueue("test", apply_batch, max_batch=1, max_wait=0)
+        token = _request_stats.set(RequestStats())
+        try:
+            await queue.submit(1)
+        finally:
+            _request_stats.reset(token)
+        await queue.submit(2)
+        await queue.stop()
+
+    asyncio.run(run())
+    assert request_stats == [None, None]
+
+
+def test_apply_company_tag_writes(engine):
+    """
+    태그 변경 batch 는 한 번의 commit 으로 적용되고, 실패한 변경만 오류를 반환해야 합니다.
+    """
+    service = CompanyService()
+    tags = [NewCompanyTagNameInSchema(tag_name={"ko": "태그_77", "en": "tag_77"})]
+    writes = [
+        (service.company_new_tag_write(tags=tags, name="원티드랩"), "ko"),
+        (service.company_new_tag_write(tags=tags, name="없는회사"), "ko"),
+        (service.company_new_tag_write(tags=tags, name="삼일제약"), "ko"),
+        (service.company_tag_delete_write(tag="태그_77", name="삼일제약"), "ko"),
+    ]
+    commits = []
+    event.listen(engine, "commit", lambda conn: commits.append(conn))
+
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        added, missing, _, deleted = service.apply_company_tag_writes(
+            db=db, writes=writes
+        )
+    finally:
+        db.close()
+
+    assert len(commits) == 1
+    assert added["company_name"] == "원티드랩" and "태그_77" in added["tags"]
+    assert isinstance(missing, HTTPException) and missing.status_code == 404
+    assert deleted["company_name"] == "삼일제약"
+    assert "태그_77" not in deleted["tags"]